@@ -0,0 +1,76 @@
+import csv
+import io
+import logging
+
+from django.db import transaction
+from django.db.models import Max, QuerySet
+from typing import Iterable, List, Optional, Tuple
+
+from usaspending_api.broker.models import DeletedRecord, DeletedRecordFile
+from usaspending_api.common.helpers.s3_helpers import access_s3_object
+
+
+logger = logging.getLogger("console")
+
+# Deletion files name their id column; anything else is read from the first column
+KNOWN_ID_COLUMNS = ("detached_award_proc_unique", "afa_generated_unique")
+
+RECORD_BATCH_SIZE = 10000
+
+
+def read_deletion_file(data: io.BytesIO) -> Tuple[Optional[str], List[str]]:
+    """Returns the id column name and the ids found in a deletion CSV"""
+    reader = csv.DictReader(io.StringIO(data.read().decode("utf-8")))
+    if not reader.fieldnames:
+        return None, []
+    id_column = next((c for c in KNOWN_ID_COLUMNS if c in reader.fieldnames), reader.fieldnames[0])
+    return id_column, [row[id_column] for row in reader if row[id_column]]
+
+
+def journal_deletion_files(bucket_name: str, objects: Iterable) -> int:
+    """
+    Records the ids of every S3 object summary not already in the journal (matched on key and last modified time) and
+    returns how many files were added.  Only new files are downloaded.  A file that was replaced in the bucket
+    supersedes the ids journaled from its previous version.
+    """
+    objects = list(objects)
+    if not objects:
+        return 0
+
+    journaled = set(
+        DeletedRecordFile.objects.filter(file_key__in=[o.key for o in objects]).values_list("file_key", "last_modified")
+    )
+    new_objects = [o for o in objects if (o.key, o.last_modified) not in journaled]
+    logger.info(f"{len(new_objects):,} of {len(objects):,} deletion files have not been journaled yet")
+
+    for obj in new_objects:
+        id_column, ids = read_deletion_file(access_s3_object(bucket_name=bucket_name, obj=obj))
+        with transaction.atomic():
+            journal_file, created = DeletedRecordFile.objects.get_or_create(
+                file_key=obj.key,
+                last_modified=obj.last_modified,
+                defaults={"id_column": id_column, "record_count": len(ids)},
+            )
+            if not created:
+                continue  # journaled by a concurrent loader
+            DeletedRecordFile.objects.filter(file_key=obj.key, last_modified__lt=obj.last_modified).delete()
+            DeletedRecord.objects.bulk_create(
+                [DeletedRecord(deleted_record_file=journal_file, unique_id=i) for i in ids],
+                batch_size=RECORD_BATCH_SIZE,
+            )
+        logger.info(f"{len(ids):,} delete ids journaled from {obj.key}")
+
+    return len(new_objects)
+
+
+def get_deleted_records(files: QuerySet) -> QuerySet:
+    """
+    Returns (id_column, unique_id, last_modified) for every distinct id journaled from files, a DeletedRecordFile
+    queryset, where last_modified is that of the newest file listing the id
+    """
+    return (
+        DeletedRecord.objects.filter(deleted_record_file__in=files)
+        .values_list("deleted_record_file__id_column", "unique_id")
+        .annotate(last_modified=Max("deleted_record_file__last_modified"))
+        .order_by()
+    )
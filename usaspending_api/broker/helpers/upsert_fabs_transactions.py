@@ -9,7 +9,11 @@ from usaspending_api.awards.models import TransactionFABS, TransactionNormalized
 from usaspending_api.broker.helpers.get_business_categories import get_business_categories
 from usaspending_api.common.helpers.date_helper import cast_datetime_to_utc
 from usaspending_api.common.helpers.dict_helpers import upper_case_dict_values
-from usaspending_api.common.helpers.etl_helpers import update_c_to_d_linkages
+from usaspending_api.common.helpers.etl_helpers import (
+    award_partition_expression,
+    run_in_worker_processes,
+    update_c_to_d_linkages,
+)
 from usaspending_api.common.helpers.date_helper import fy
 from usaspending_api.common.helpers.timing_helpers import timer
 from usaspending_api.etl.award_helpers import update_awards, update_assistance_awards
@@ -44,6 +48,28 @@ def fetch_fabs_data_generator(dap_uid_list):
         yield dictfetchall(db_cursor)
 
 
+def partition_ids_by_award(dap_uid_list, partitions):
+    """
+    Splits source_assistance_transaction ids into partitions by unique_award_key so that every transaction for an
+    award is loaded by the same worker.
+    """
+    db_query = """
+        SELECT published_award_financial_assistance_id, {} FROM source_assistance_transaction
+        WHERE published_award_financial_assistance_id IN %s;
+    """.format(
+        award_partition_expression("unique_award_key", partitions)
+    )
+
+    partitioned_ids = [[] for _ in range(partitions)]
+    with connection.cursor() as cursor:
+        for i in range(0, len(dap_uid_list), BATCH_FETCH_SIZE):
+            cursor.execute(db_query, [tuple(dap_uid_list[i : i + BATCH_FETCH_SIZE])])
+            for published_award_financial_assistance_id, partition in cursor.fetchall():
+                partitioned_ids[partition].append(published_award_financial_assistance_id)
+
+    return partitioned_ids
+
+
 @transaction.atomic
 def insert_all_new_fabs(all_new_to_insert):
     update_award_ids = []
@@ -155,11 +181,18 @@ def insert_new_fabs(to_insert):
     return update_award_ids
 
 
-def upsert_fabs_transactions(ids_to_upsert, externally_updated_award_ids):
+def upsert_fabs_transactions(ids_to_upsert, externally_updated_award_ids, workers=1):
     if ids_to_upsert or externally_updated_award_ids:
         update_award_ids = copy(externally_updated_award_ids)
 
-        if ids_to_upsert:
+        if ids_to_upsert and workers > 1:
+            with timer(f"inserting new FABS data across {workers} worker processes", logger.info):
+                partitioned_ids = partition_ids_by_award(ids_to_upsert, workers)
+                for partition_award_ids in run_in_worker_processes(
+                    insert_all_new_fabs, [(ids,) for ids in partitioned_ids if ids], workers
+                ):
+                    update_award_ids.extend(partition_award_ids)
+        elif ids_to_upsert:
             with timer("inserting new FABS data", logger.info):
                 update_award_ids.extend(insert_all_new_fabs(ids_to_upsert))
 
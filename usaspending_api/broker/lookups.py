@@ -16,6 +16,8 @@ EXTERNAL_DATA_TYPE = [
     # "opposite" side of the broker data load, data from USAspending DB -> Elasticsearch
     LookupType(100, "es_transactions", "Load elasticsearch with transactions from USAspending"),
     LookupType(101, "es_awards", "Load elasticsearch with awards from USAspending"),
+    LookupType(102, "spending_over_time_rollups", "Load spending over time rollups from USAspending"),
+    LookupType(103, "spending_over_time_cube", "Rewrite of the spending over time rollups held in API worker memory"),
 ]
 EXTERNAL_DATA_TYPE_DICT = {item.name: item.id for item in EXTERNAL_DATA_TYPE}
 EXTERNAL_DATA_TYPE_DICT_ID = {item.id: item.name for item in EXTERNAL_DATA_TYPE}
@@ -0,0 +1,62 @@
+"""
+Times the row by row and set-based (--bulk-upsert) FPDS load paths on the same chunks of source_procurement_transaction
+records, at the chunk size load_fpds_transactions uses.  Each load runs in a transaction that is rolled back, so both
+paths start from the same data and the database is left as it was.
+"""
+
+import logging
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from time import perf_counter
+
+from usaspending_api.broker.management.commands.load_fpds_transactions import CHUNK_SIZE
+from usaspending_api.etl.transaction_loaders.fpds_loader import failed_ids, load_fpds_transactions
+
+
+logger = logging.getLogger("console")
+
+
+class Command(BaseCommand):
+    help = "Benchmark the row by row and bulk upsert FPDS transaction load paths"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="Transactions per load call")
+        parser.add_argument("--chunks", type=int, default=1, help="Chunks of source transactions to load per path")
+
+    def handle(self, *args, **options):
+        chunk_size = options["chunk_size"]
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "select detached_award_procurement_id from source_procurement_transaction "
+                "order by detached_award_procurement_id limit %s",
+                [chunk_size * options["chunks"]],
+            )
+            ids = [row[0] for row in cursor.fetchall()]
+        if not ids:
+            raise CommandError("No source_procurement_transaction records to load")
+        chunks = [ids[i : i + chunk_size] for i in range(0, len(ids), chunk_size)]
+
+        results = {}
+        for load_path, bulk_upsert in (("row by row", False), ("bulk upsert", True)):
+            elapsed = 0
+            award_count = 0
+            path_failed_ids = []
+            for chunk in chunks:
+                with transaction.atomic():
+                    start = perf_counter()
+                    award_count += len(set(load_fpds_transactions(chunk, bulk_upsert=bulk_upsert)))
+                    elapsed += perf_counter() - start
+                    transaction.set_rollback(True)
+                path_failed_ids.extend(failed_ids)
+                failed_ids.clear()
+            results[load_path] = (award_count, sorted(path_failed_ids))
+
+            logger.info(
+                f"{load_path:>11}: {len(ids):,} transactions in {len(chunks)} chunk(s) of {chunk_size:,} in "
+                f"{elapsed:.2f}s ({len(ids) / elapsed:,.0f}/s), {award_count:,} awards touched, "
+                f"{len(path_failed_ids):,} failed"
+            )
+
+        if results["row by row"] != results["bulk upsert"]:
+            raise CommandError("Load paths touched a different number of awards or failed on different ids")
@@ -15,6 +15,7 @@ from usaspending_api.broker.helpers.last_load_date import get_last_load_date
 from usaspending_api.broker.helpers.last_load_date import update_last_load_date
 from usaspending_api.broker.helpers.upsert_fabs_transactions import upsert_fabs_transactions
 from usaspending_api.broker.models import ExternalDataLoadDate
+from usaspending_api.common.cache import try_bump_data_generation
 from usaspending_api.common.helpers.date_helper import cast_datetime_to_naive, datetime_command_line_argument_type
 from usaspending_api.common.helpers.timing_helpers import timer
 from usaspending_api.common.retrieve_file_from_uri import RetrieveFileFromUri
@@ -160,6 +161,15 @@ class Command(BaseCommand):
             "quotes if date/time contains spaces.",
         )
 
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Split the transactions to insert/update into this many partitions by unique_award_key and load "
+            "them in parallel, one worker process and database connection each. Award updates still run once, "
+            "after all partitions finish.",
+        )
+
     def handle(self, *args, **options):
         processing_start_datetime = datetime.now(timezone.utc)
 
@@ -196,9 +206,10 @@ class Command(BaseCommand):
             ids_to_upsert = get_fabs_transaction_ids(afa_ids, start_datetime, end_datetime)
 
         update_award_ids = delete_fabs_transactions(ids_to_delete) if is_incremental_load else []
-        upsert_fabs_transactions(ids_to_upsert, update_award_ids)
+        upsert_fabs_transactions(ids_to_upsert, update_award_ids, workers=options["workers"])
 
         if is_incremental_load:
             update_last_load_date("fabs", processing_start_datetime)
 
+        try_bump_data_generation()
         logger.info("FABS UPDATE FINISHED!")
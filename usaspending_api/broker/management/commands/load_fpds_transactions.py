@@ -7,8 +7,13 @@ from django.core.management.base import BaseCommand
 from typing import IO, List, AnyStr, Optional
 
 from usaspending_api.broker.helpers.last_load_date import get_last_load_date, update_last_load_date
+from usaspending_api.common.cache import try_bump_data_generation
 from usaspending_api.common.helpers.date_helper import datetime_command_line_argument_type
-from usaspending_api.common.helpers.etl_helpers import update_c_to_d_linkages
+from usaspending_api.common.helpers.etl_helpers import (
+    award_partition_filter,
+    run_in_worker_processes,
+    update_c_to_d_linkages,
+)
 from usaspending_api.common.helpers.sql_helpers import get_database_dsn_string
 from usaspending_api.common.retrieve_file_from_uri import RetrieveFileFromUri
 from usaspending_api.etl.award_helpers import update_awards, update_procurement_awards, prune_empty_awards
@@ -22,13 +27,25 @@ CHUNK_SIZE = 15000
 ALL_FPDS_QUERY = "SELECT {} FROM source_procurement_transaction"
 
 
+def load_fpds_partition(date, chunk_size, bulk_upsert, partition, partitions):
+    """
+    Worker process entry point for parallel loads.  failed_ids is module state, so it is handed back to the parent
+    process along with the awards touched and then cleared in case this process is handed another partition.
+    """
+    modified_award_ids = Command.load_fpds_chunks(date, chunk_size, bulk_upsert, partition, partitions)
+    partition_failed_ids = list(failed_ids)
+    failed_ids.clear()
+    return modified_award_ids, partition_failed_ids
+
+
 class Command(BaseCommand):
     help = "Sync USAspending DB FPDS data using source transaction for new or modified records and S3 for deleted IDs"
 
     modified_award_ids = []
+    bulk_upsert = False
 
     @staticmethod
-    def get_cursor_for_date_query(connection, date, count=False):
+    def get_cursor_for_date_query(connection, date, count=False, partition=None, partitions=None):
         if count:
             db_cursor = connection.cursor()
             db_query = ALL_FPDS_QUERY.format("COUNT(*)")
@@ -36,13 +53,46 @@ class Command(BaseCommand):
             db_cursor = connection.cursor("fpds_load", cursor_factory=psycopg2.extras.DictCursor)
             db_query = ALL_FPDS_QUERY.format("detached_award_procurement_id")
 
+        predicates = []
+        params = []
         if date:
-            db_cursor.execute(db_query + " WHERE updated_at >= %s", [date])
+            predicates.append("updated_at >= %s")
+            params.append(date)
+        if partitions:
+            predicates.append(award_partition_filter("unique_award_key", partition, partitions))
+
+        if predicates:
+            db_cursor.execute(db_query + " WHERE " + " AND ".join(predicates), params)
         else:
             db_cursor.execute(db_query)
         return db_cursor
 
-    def load_fpds_incrementally(self, date: Optional[datetime], chunk_size: int = CHUNK_SIZE) -> None:
+    @staticmethod
+    def load_fpds_chunks(date, chunk_size, bulk_upsert, partition=None, partitions=None):
+        """Loads every transaction matching the date (and partition, if provided), returning the awards touched"""
+        modified_award_ids = []
+        partition_label = f"Partition {partition + 1}/{partitions}: " if partitions else ""
+
+        with psycopg2.connect(dsn=get_database_dsn_string()) as connection:
+            logger.info(f"{partition_label}Fetching records to update")
+            total_records = Command.get_cursor_for_date_query(connection, date, True, partition, partitions).fetchall()[
+                0
+            ][0]
+            records_processed = 0
+            logger.info("{}{} total records to update".format(partition_label, total_records))
+            cursor = Command.get_cursor_for_date_query(connection, date, False, partition, partitions)
+            while True:
+                id_list = cursor.fetchmany(chunk_size)
+                if len(id_list) == 0:
+                    break
+                logger.info("{}Loading batch (size: {}) from date query...".format(partition_label, len(id_list)))
+                modified_award_ids.extend(load_fpds_transactions([row[0] for row in id_list], bulk_upsert=bulk_upsert))
+                records_processed = records_processed + len(id_list)
+                logger.info("{}{} out of {} processed".format(partition_label, records_processed, total_records))
+
+        return modified_award_ids
+
+    def load_fpds_incrementally(self, date: Optional[datetime], chunk_size: int = CHUNK_SIZE, workers: int = 1) -> None:
         """Process incremental loads based on a date range or full data loads"""
 
         if date is None:
@@ -54,20 +104,18 @@ class Command(BaseCommand):
             stale_awards = delete_stale_fpds(detached_award_procurement_ids)
             self.update_award_records(awards=stale_awards, skip_cd_linkage=True)
 
-        with psycopg2.connect(dsn=get_database_dsn_string()) as connection:
-            logger.info("Fetching records to update")
-            total_records = self.get_cursor_for_date_query(connection, date, True).fetchall()[0][0]
-            records_processed = 0
-            logger.info("{} total records to update".format(total_records))
-            cursor = self.get_cursor_for_date_query(connection, date)
-            while True:
-                id_list = cursor.fetchmany(chunk_size)
-                if len(id_list) == 0:
-                    break
-                logger.info("Loading batch (size: {}) from date query...".format(len(id_list)))
-                self.modified_award_ids.extend(load_fpds_transactions([row[0] for row in id_list]))
-                records_processed = records_processed + len(id_list)
-                logger.info("{} out of {} processed".format(records_processed, total_records))
+        if workers > 1:
+            logger.info(f"Loading in {workers} partitions by unique_award_key across {workers} worker processes")
+            results = run_in_worker_processes(
+                load_fpds_partition,
+                [(date, chunk_size, self.bulk_upsert, partition, workers) for partition in range(workers)],
+                workers,
+            )
+            for modified_award_ids, partition_failed_ids in results:
+                self.modified_award_ids.extend(modified_award_ids)
+                failed_ids.extend(partition_failed_ids)
+        else:
+            self.modified_award_ids.extend(self.load_fpds_chunks(date, chunk_size, self.bulk_upsert))
 
     @staticmethod
     def gen_read_file_for_ids(file: IO[AnyStr], chunk_size: int = CHUNK_SIZE) -> List[str]:
@@ -88,7 +136,7 @@ class Command(BaseCommand):
                 id_list = [int(re.search(r"\d+", x).group()) for x in next_batch]
                 total_count += len(id_list)
                 logger.info(f"Loading next batch (size: {len(id_list)}, ids {id_list[0]}-{id_list[-1]})...")
-                self.modified_award_ids.extend(load_fpds_transactions(id_list))
+                self.modified_award_ids.extend(load_fpds_transactions(id_list, bulk_upsert=self.bulk_upsert))
 
         logger.info(f"Total transaction IDs in file: {total_count}")
 
@@ -139,20 +187,34 @@ class Command(BaseCommand):
             action="store_true",
             help="Script will load or reload all FPDS records in source tables, from all time. This does NOT clear the USAspending database first",
         )
+        parser.add_argument(
+            "--bulk-upsert",
+            action="store_true",
+            help="Load each chunk of transactions with a few set-based statements (COPY into temp tables, then "
+            "INSERT/UPDATE ... SELECT) instead of row by row. Chunks that fail are retried row by row.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="For --reload-all, --date and --since-last-load, split the transactions into this many partitions "
+            "by unique_award_key and load them in parallel, one worker process and database connection each.",
+        )
 
     def handle(self, *args, **options):
 
         # Record script execution start time to update the FPDS last updated date in DB as appropriate
         update_time = datetime.now(timezone.utc)
+        self.bulk_upsert = options["bulk_upsert"]
 
         if options["reload_all"]:
-            self.load_fpds_incrementally(None)
+            self.load_fpds_incrementally(None, workers=options["workers"])
 
         elif options["date"]:
-            self.load_fpds_incrementally(options["date"])
+            self.load_fpds_incrementally(options["date"], workers=options["workers"])
 
         elif options["ids"]:
-            self.modified_award_ids.extend(load_fpds_transactions(options["ids"]))
+            self.modified_award_ids.extend(load_fpds_transactions(options["ids"], bulk_upsert=self.bulk_upsert))
 
         elif options["file"]:
             self.load_fpds_from_file(options["file"])
@@ -161,7 +223,7 @@ class Command(BaseCommand):
             last_load = get_last_load_date("fpds")
             if not last_load:
                 raise ValueError("No last load date for FPDS stored in the database")
-            self.load_fpds_incrementally(last_load)
+            self.load_fpds_incrementally(last_load, workers=options["workers"])
 
         self.update_award_records(awards=self.modified_award_ids, skip_cd_linkage=False)
 
@@ -176,4 +238,5 @@ class Command(BaseCommand):
             # we wait until after the load finishes to update the load date because if this crashes we'll need to load again
             update_last_load_date("fpds", update_time)
 
+        try_bump_data_generation()
         logger.info(f"Successfully Completed")
@@ -0,0 +1,40 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('broker', '0002_auto_20190402_1457'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DeletedRecordFile',
+            fields=[
+                ('deleted_record_file_id', models.AutoField(primary_key=True, serialize=False)),
+                ('file_key', models.TextField()),
+                ('last_modified', models.DateTimeField(db_index=True)),
+                ('id_column', models.TextField(blank=True, null=True)),
+                ('record_count', models.IntegerField()),
+                ('create_date', models.DateTimeField(auto_now_add=True, null=True)),
+            ],
+            options={
+                'db_table': 'deleted_record_file',
+                'managed': True,
+                'unique_together': {('file_key', 'last_modified')},
+            },
+        ),
+        migrations.CreateModel(
+            name='DeletedRecord',
+            fields=[
+                ('deleted_record_id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('unique_id', models.TextField(db_index=True)),
+                ('deleted_record_file', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='broker.DeletedRecordFile')),
+            ],
+            options={
+                'db_table': 'deleted_record',
+                'managed': True,
+            },
+        ),
+    ]
@@ -22,3 +22,29 @@ class ExternalDataLoadDate(models.Model):
         managed = True
         unique_together = (("last_load_date", "external_data_type"),)
         db_table = "external_data_load_date"
+
+
+class DeletedRecordFile(models.Model):
+    """A deletion CSV from the DELETED_TRANSACTION_JOURNAL_FILES bucket whose ids have been read into DeletedRecord"""
+
+    deleted_record_file_id = models.AutoField(primary_key=True)
+    file_key = models.TextField(blank=False, null=False)
+    last_modified = models.DateTimeField(blank=False, null=False, db_index=True)
+    id_column = models.TextField(blank=True, null=True)
+    record_count = models.IntegerField(blank=False, null=False)
+    create_date = models.DateTimeField(auto_now_add=True, blank=True, null=True)
+
+    class Meta:
+        managed = True
+        unique_together = (("file_key", "last_modified"),)
+        db_table = "deleted_record_file"
+
+
+class DeletedRecord(models.Model):
+    deleted_record_id = models.BigAutoField(primary_key=True)
+    deleted_record_file = models.ForeignKey(DeletedRecordFile, models.CASCADE, blank=False, null=False)
+    unique_id = models.TextField(blank=False, null=False, db_index=True)
+
+    class Meta:
+        managed = True
+        db_table = "deleted_record"
@@ -0,0 +1,129 @@
+import io
+import pytest
+
+from collections import Counter, namedtuple
+from datetime import datetime, timezone
+
+from usaspending_api.broker.helpers.deleted_record_journal import get_deleted_records, journal_deletion_files
+from usaspending_api.broker.models import DeletedRecord, DeletedRecordFile
+from usaspending_api.etl.es_etl_helpers import gather_deleted_ids
+from usaspending_api.transactions.transaction_delete_journal_helpers import retrieve_deleted_fpds_transactions
+
+
+BUCKET_NAME = "deleted-records"
+
+ObjectSummary = namedtuple("ObjectSummary", ["key", "last_modified"])
+
+
+class LocalS3Bucket:
+    """Stand-in for the deletion bucket that counts how many times each object is downloaded"""
+
+    def __init__(self):
+        self.files = {}
+        self.downloads = Counter()
+
+    def put(self, key, last_modified, contents):
+        self.files[key] = (ObjectSummary(key, last_modified), contents)
+
+    def objects(self):
+        return [summary for summary, _ in self.files.values()]
+
+    def access_s3_object(self, bucket_name, obj):
+        assert bucket_name == BUCKET_NAME
+        self.downloads[obj.key] += 1
+        return io.BytesIO(self.files[obj.key][1].encode())
+
+
+@pytest.fixture
+def local_bucket(monkeypatch):
+    bucket = LocalS3Bucket()
+    monkeypatch.setattr(
+        "usaspending_api.broker.helpers.deleted_record_journal.access_s3_object", bucket.access_s3_object
+    )
+    monkeypatch.setattr(
+        "usaspending_api.etl.es_etl_helpers.retrieve_s3_bucket_object_list", lambda bucket_name: bucket.objects()
+    )
+    monkeypatch.setattr(
+        "usaspending_api.transactions.transaction_delete_journal_helpers.retrieve_s3_bucket_object_list",
+        lambda bucket_name: bucket.objects(),
+    )
+    monkeypatch.setattr("usaspending_api.settings.DELETED_TRANSACTION_JOURNAL_FILES", BUCKET_NAME)
+    return bucket
+
+
+def _datetime(day):
+    return datetime(2020, 3, day, tzinfo=timezone.utc)
+
+
+@pytest.mark.django_db
+def test_only_new_files_are_downloaded(local_bucket):
+    local_bucket.put("03-01-2020_delete_records_IDV_1.csv", _datetime(1), "detached_award_proc_unique\nabc\ndef\n")
+    local_bucket.put("03-02-2020_FABSdeletions_2.csv", _datetime(2), "afa_generated_unique\nxyz\n")
+
+    assert journal_deletion_files(BUCKET_NAME, local_bucket.objects()) == 2
+    assert journal_deletion_files(BUCKET_NAME, local_bucket.objects()) == 0
+    assert local_bucket.downloads == Counter({k: 1 for k in local_bucket.files})
+    assert DeletedRecord.objects.count() == 3
+
+    local_bucket.put("03-03-2020_FABSdeletions_3.csv", _datetime(3), "afa_generated_unique\nxyz\nuvw\n")
+    assert journal_deletion_files(BUCKET_NAME, local_bucket.objects()) == 1
+    assert local_bucket.downloads["03-03-2020_FABSdeletions_3.csv"] == 1
+    assert sum(local_bucket.downloads.values()) == 3
+
+
+@pytest.mark.django_db
+def test_replaced_file_supersedes_earlier_version(local_bucket):
+    key = "03-01-2020_delete_records_award_1.csv"
+    local_bucket.put(key, _datetime(1), "detached_award_proc_unique\nabc\ndef\n")
+    journal_deletion_files(BUCKET_NAME, local_bucket.objects())
+    local_bucket.put(key, _datetime(2), "detached_award_proc_unique\nghi\n")
+    journal_deletion_files(BUCKET_NAME, local_bucket.objects())
+
+    assert list(DeletedRecordFile.objects.values_list("file_key", "last_modified")) == [(key, _datetime(2))]
+    records = get_deleted_records(DeletedRecordFile.objects.all())
+    assert list(records) == [("detached_award_proc_unique", "ghi", _datetime(2))]
+
+
+@pytest.mark.django_db
+def test_gather_deleted_ids_from_journal(local_bucket):
+    local_bucket.put("03-01-2020_delete_records_IDV_1.csv", _datetime(1), "detached_award_proc_unique\nold\n")
+    local_bucket.put("03-02-2020_delete_records_IDV_2.csv", _datetime(2), "detached_award_proc_unique\nabc\n")
+    local_bucket.put("03-03-2020_FABSdeletions_3.csv", _datetime(3), "afa_generated_unique\nxyz\n")
+    local_bucket.put("03-04-2020_FABSdeletions_4.csv", _datetime(4), "afa_generated_unique\nxyz\n")
+    local_bucket.put("staging/03-04-2020_FABSdeletions_5.csv", _datetime(4), "afa_generated_unique\nstaged\n")
+    local_bucket.put("03-04-2020_notes.txt", _datetime(4), "not a deletion file")
+
+    config = {
+        "process_deletes": True,
+        "s3_bucket": BUCKET_NAME,
+        "starting_date": _datetime(2),
+        "verbose": False,
+    }
+    expected = {"CONT_TX_ABC": _datetime(2), "ASST_TX_XYZ": _datetime(4)}
+
+    assert dict(gather_deleted_ids(config)) == expected
+    assert dict(gather_deleted_ids(config)) == expected
+    assert local_bucket.downloads == Counter(
+        {
+            "03-02-2020_delete_records_IDV_2.csv": 1,
+            "03-03-2020_FABSdeletions_3.csv": 1,
+            "03-04-2020_FABSdeletions_4.csv": 1,
+        }
+    )
+
+
+@pytest.mark.django_db
+def test_retrieve_deleted_fpds_transactions_from_journal(local_bucket):
+    local_bucket.put("03-01-2020_delete_records_IDV_1583020800.csv", _datetime(1), "detached_award_proc_unique\nold\n")
+    local_bucket.put("03-02-2020_delete_records_IDV_1583107200.csv", _datetime(2), "detached_award_proc_unique\n1\n2\n")
+    # Grouped by the date in the key, not when the file was last modified
+    local_bucket.put("03-03-2020_delete_records_award_1583193600.csv", _datetime(4), "detached_award_proc_unique\n2\n")
+    local_bucket.put("03-03-2020_FABSdeletions_1583193600.csv", _datetime(3), "afa_generated_unique\nxyz\n")
+
+    expected = {"03-02-2020": ["1", "2"], "03-03-2020": ["2"]}
+
+    assert retrieve_deleted_fpds_transactions(start_datetime=_datetime(2)) == expected
+    assert retrieve_deleted_fpds_transactions(start_datetime=_datetime(2)) == expected
+    assert local_bucket.downloads == Counter(
+        {"03-02-2020_delete_records_IDV_1583107200.csv": 1, "03-03-2020_delete_records_award_1583193600.csv": 1}
+    )
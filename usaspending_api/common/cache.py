@@ -1,11 +1,22 @@
 import hashlib
 import json
+import logging
+import time
 
+from uuid import uuid4
+from django.conf import settings
+from django.core.cache import caches
+from functools import wraps
+from typing import Callable, Optional, TypeVar
 from rest_framework_extensions.key_constructor import bits
 from rest_framework_extensions.key_constructor.constructors import DefaultKeyConstructor
 
 from usaspending_api.common.helpers.dict_helpers import order_nested_object
 
+logger = logging.getLogger("console")
+
+T = TypeVar("T")
+
 
 class PathKeyBit(bits.QueryParamsKeyBit):
     """
@@ -47,3 +58,111 @@ class USAspendingKeyConstructor(DefaultKeyConstructor):
 
 
 usaspending_key_func = USAspendingKeyConstructor()
+
+
+# Cached API responses are keyed on the data generation current when they were computed.  Loaders start a new
+# generation once they finish so entries computed against older data are never served as fresh again; they simply
+# expire.  The previous generation is remembered so its entries can be served while a fresh copy is computed.
+DATA_GENERATION_KEY = "usaspending-data-generation"
+
+
+def get_data_generations(cache=None):
+    """Returns the (current, previous) data generation tokens; previous is None until the first bump"""
+    cache = cache or caches[settings.REST_FRAMEWORK_EXTENSIONS["DEFAULT_USE_CACHE"]]
+    generations = cache.get(DATA_GENERATION_KEY)
+    if generations is None:
+        generations = {"current": uuid4().hex, "previous": None}
+        # add() so that concurrent first requests all agree on the winner's token
+        if not cache.add(DATA_GENERATION_KEY, generations, None):
+            generations = cache.get(DATA_GENERATION_KEY) or generations
+    return generations["current"], generations["previous"]
+
+
+def bump_data_generation(cache=None):
+    """Starts a new data generation, making every cached response stale, and returns its token"""
+    cache = cache or caches[settings.REST_FRAMEWORK_EXTENSIONS["DEFAULT_USE_CACHE"]]
+    current, _ = get_data_generations(cache)
+    generation = uuid4().hex
+    cache.set(DATA_GENERATION_KEY, {"current": generation, "previous": current}, None)
+    logger.info(f"Started cache data generation {generation}")
+    return generation
+
+
+def try_bump_data_generation():
+    """
+    bump_data_generation for loaders whose changes are already committed.  A cache that cannot be reached is logged
+    rather than raised so it does not fail the load; cached responses are then only refreshed as they expire.
+    """
+    try:
+        return bump_data_generation()
+    except Exception:
+        logger.exception("Unable to start a new cache data generation")
+        return None
+
+
+# Small reference tables (populations, country names, ...) are held in memory by every worker process and reloaded
+# once their loaders start a new version.  See references.reference_data_cache.
+REFERENCE_DATA_VERSION_KEY = "usaspending-reference-data-version"
+
+
+def get_reference_data_version(cache=None):
+    """Returns the current reference data version token"""
+    cache = cache or caches[settings.REST_FRAMEWORK_EXTENSIONS["DEFAULT_USE_CACHE"]]
+    version = cache.get(REFERENCE_DATA_VERSION_KEY)
+    if version is None:
+        version = uuid4().hex
+        if not cache.add(REFERENCE_DATA_VERSION_KEY, version, None):
+            version = cache.get(REFERENCE_DATA_VERSION_KEY) or version
+    return version
+
+
+def bump_reference_data_version(cache=None):
+    """Starts a new reference data version so every worker reloads its in-memory reference tables"""
+    cache = cache or caches[settings.REST_FRAMEWORK_EXTENSIONS["DEFAULT_USE_CACHE"]]
+    version = uuid4().hex
+    cache.set(REFERENCE_DATA_VERSION_KEY, version, None)
+    logger.info(f"Started reference data version {version}")
+    return version
+
+
+def try_bump_reference_data_version():
+    """bump_reference_data_version that logs rather than raises when the cache cannot be reached"""
+    try:
+        return bump_reference_data_version()
+    except Exception:
+        logger.exception("Unable to start a new reference data version")
+        return None
+
+
+def memoize_per_generation(
+    load: Callable[[], T], get_generation: Optional[Callable[[], str]] = None
+) -> Callable[[], T]:
+    """
+    Memoizes what load returns in this process until the token returned by get_generation (by default the current data
+    generation) changes.  Each process only fetches the token every GENERATION_CHECK_INTERVAL seconds, so a call
+    normally costs no round trip at all, and keeps serving what it has already loaded if the token cannot be fetched.
+
+    The returned value is shared by every caller in the process; treat it as read only.
+    """
+    memo = {"generation": None, "checked_at": None, "value": None}
+
+    @wraps(load)
+    def memoized():
+        now = time.monotonic()
+        checked_at = memo["checked_at"]
+        if checked_at is None or now - checked_at >= settings.GENERATION_CHECK_INTERVAL:
+            try:
+                generation = get_generation() if get_generation else get_data_generations()[0]
+            except Exception:
+                # keep serving what has already been loaded rather than failing the request
+                logger.exception(f"Problem while retrieving the generation of {load.__name__}")
+                generation = memo["generation"]
+            if checked_at is None or generation != memo["generation"]:
+                memo["value"] = load()
+                memo["generation"] = generation
+                logger.info(f"Loaded {load.__name__} for generation {generation}")
+            memo["checked_at"] = now
+        return memo["value"]
+
+    memoized.cache_clear = lambda: memo.update(generation=None, checked_at=None, value=None)
+    return memoized
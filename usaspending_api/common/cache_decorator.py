@@ -1,47 +1,88 @@
 # -*- coding: utf-8 -*-
 import logging
+import time
+import zlib
+
+from django.conf import settings
+from django.http import HttpResponse
 from rest_framework_extensions.cache.decorators import CacheResponse
 
+from usaspending_api.common.cache import get_data_generations
 from usaspending_api.common.experimental_api_flags import is_experimental_elasticsearch_api
 
 logger = logging.getLogger("console")
 
+# How often a request waiting on another request computing the same response checks whether it has finished
+LOCK_POLL_INTERVAL = 0.1
+
+# Cached responses are stored as (status code, content type, compressed, content bytes)
+CACHE_FORMAT_LENGTH = 4
+
+
+def serialize_response(response):
+    """Keeps only what is needed to rebuild a rendered response, deflating content above the compression threshold"""
+    content = response.content
+    compressed = len(content) >= settings.CACHE_COMPRESSION_THRESHOLD
+    if compressed:
+        content = zlib.compress(content, settings.CACHE_COMPRESSION_LEVEL)
+    return response.status_code, response["Content-Type"], compressed, content
+
+
+def deserialize_response(value):
+    """Rebuilds the response cached by serialize_response; None for anything stored in another format"""
+    if not isinstance(value, tuple) or len(value) != CACHE_FORMAT_LENGTH:
+        return None
+    status_code, content_type, compressed, content = value
+    if compressed:
+        content = zlib.decompress(content)
+    return HttpResponse(content, status=status_code, content_type=content_type)
+
 
 class CustomCacheResponse(CacheResponse):
+    """
+    Caches responses under a key that includes the current data generation (see common.cache), so a finished load
+    makes every cached response stale without clearing the cache.  Only one request computes a missing response at a
+    time: concurrent identical requests are served the previous generation's response if there is one, otherwise
+    they wait for the first request to finish (up to CACHE_LOCK_TIMEOUT seconds) and share its result.
+
+    Only the rendered content, status code and content type are cached.  The size of the cached entry and the time
+    spent (de)serializing it are attached to the response as cache_metrics, which LoggingMiddleware adds to the
+    server log alongside the path and Cache-Trace.
+    """
+
     def process_cache_response(self, view_instance, view_method, request, args, kwargs):
         if is_experimental_elasticsearch_api(request):
             # bypass cache altogether
-            response = view_method(view_instance, request, *args, **kwargs)
-            response = view_instance.finalize_response(request, response, *args, **kwargs)
-            response["Cache-Trace"] = "no-cache"
-            return response
-        key = self.calculate_key(
+            return self._get_response(view_instance, view_method, request, args, kwargs)
+
+        base_key = self.calculate_key(
             view_instance=view_instance, view_method=view_method, request=request, args=args, kwargs=kwargs
         )
-        response = None
         try:
-            response = self.cache.get(key)
+            generation, previous_generation = get_data_generations(self.cache)
         except Exception:
-            msg = "Problem while retrieving key [{k}] from cache for path:'{p}'"
-            logger.exception(msg.format(k=key, p=str(request.path)))
+            logger.exception(f"Problem while retrieving the cache data generation for path:'{request.path}'")
+            generation, previous_generation = None, None
+        key = f"{base_key}:{generation}"
 
-        if not response:
-            response = view_method(view_instance, request, *args, **kwargs)
-            response = view_instance.finalize_response(request, response, *args, **kwargs)
-            response["Cache-Trace"] = "no-cache"
-            response.render()  # should be rendered, before picklining while storing to cache
-
-            if not response.status_code >= 400 or self.cache_errors:
-                if self.cache_errors:
-                    logger.error(self.cache_errors)
-                try:
-                    self.cache.set(key, response, self.timeout)
-                    response["Cache-Trace"] = "set-cache"
-                except Exception:
-                    msg = "Problem while writing to cache: path:'{p}' data:'{d}'"
-                    logger.exception(msg.format(p=str(request.path), d=str(request.data)))
-        else:
+        response = self._cache_get(key, request)
+        if response is not None:
             response["Cache-Trace"] = "hit-cache"
+        elif self._acquire_lock(key, request):
+            try:
+                response = self._get_and_cache_response(key, view_instance, view_method, request, args, kwargs)
+            finally:
+                self._release_lock(key)
+        else:
+            response = previous_generation and self._cache_get(f"{base_key}:{previous_generation}", request)
+            if response is not None:
+                response["Cache-Trace"] = "stale-cache"
+            else:
+                response = self._wait_for_response(key, request)
+                if response is not None:
+                    response["Cache-Trace"] = "hit-cache"
+                else:
+                    response = self._get_and_cache_response(key, view_instance, view_method, request, args, kwargs)
 
         if not hasattr(response, "_closable_objects"):
             response._closable_objects = []
@@ -49,5 +90,80 @@ class CustomCacheResponse(CacheResponse):
         response["key"] = key
         return response
 
+    @staticmethod
+    def _get_response(view_instance, view_method, request, args, kwargs):
+        response = view_method(view_instance, request, *args, **kwargs)
+        response = view_instance.finalize_response(request, response, *args, **kwargs)
+        response["Cache-Trace"] = "no-cache"
+        return response
+
+    def _get_and_cache_response(self, key, view_instance, view_method, request, args, kwargs):
+        response = self._get_response(view_instance, view_method, request, args, kwargs)
+        response.render()  # should be rendered, before serializing while storing to cache
+
+        if not response.status_code >= 400 or self.cache_errors:
+            if self.cache_errors:
+                logger.error(self.cache_errors)
+            try:
+                start = time.perf_counter()
+                value = serialize_response(response)
+                response.cache_metrics = {
+                    "cache_bytes": len(value[-1]),
+                    "cache_serialize_ms": round((time.perf_counter() - start) * 1000, 3),
+                }
+                self.cache.set(key, value, self.timeout)
+                response["Cache-Trace"] = "set-cache"
+            except Exception:
+                msg = "Problem while writing to cache: path:'{p}' data:'{d}'"
+                logger.exception(msg.format(p=str(request.path), d=str(request.data)))
+        return response
+
+    def _cache_get(self, key, request):
+        try:
+            value = self.cache.get(key)
+            start = time.perf_counter()
+            response = deserialize_response(value)
+        except Exception:
+            msg = "Problem while retrieving key [{k}] from cache for path:'{p}'"
+            logger.exception(msg.format(k=key, p=str(request.path)))
+            return None
+        if response is not None:
+            response.cache_metrics = {
+                "cache_bytes": len(value[-1]),
+                "cache_deserialize_ms": round((time.perf_counter() - start) * 1000, 3),
+            }
+        return response
+
+    def _acquire_lock(self, key, request):
+        """True if this request should compute the response; a broken cache lets every request compute it"""
+        try:
+            return self.cache.add(f"{key}:lock", True, settings.CACHE_LOCK_TIMEOUT)
+        except Exception:
+            logger.exception(f"Problem while locking key [{key}] in cache for path:'{request.path}'")
+            return True
+
+    def _release_lock(self, key):
+        try:
+            self.cache.delete(f"{key}:lock")
+        except Exception:
+            logger.exception(f"Problem while unlocking key [{key}] in cache")
+
+    def _wait_for_response(self, key, request):
+        """Waits for the request holding the lock on key to cache its response and returns it"""
+        deadline = time.monotonic() + settings.CACHE_LOCK_TIMEOUT
+        while time.monotonic() < deadline:
+            time.sleep(LOCK_POLL_INTERVAL)
+            response = self._cache_get(key, request)
+            if response is not None:
+                return response
+            try:
+                if self.cache.get(f"{key}:lock") is None:
+                    # the lock holder finished without caching anything (an error response, for instance)
+                    return None
+            except Exception:
+                return None
+        logger.warning(f"Gave up waiting on another request for key [{key}] for path:'{request.path}'")
+        return None
+
 
 cache_response = CustomCacheResponse
@@ -1,19 +1,47 @@
-from typing import Union, Optional
+from typing import Any, Callable, Optional, Tuple, Union
 
 import certifi
 import logging
+import os
+import socket
+import threading
 
+from concurrent.futures import ThreadPoolExecutor
 from django.conf import settings
-from elasticsearch import Elasticsearch
+from elasticsearch import Elasticsearch, Urllib3HttpConnection
 from elasticsearch.connection import create_ssl_context
 from ssl import CERT_NONE
+from time import perf_counter
 
 from elasticsearch_dsl.response import Response
 
 logger = logging.getLogger("console")
-CLIENT = None
 ElasticsearchResponse = Optional[Union[dict, Response]]
 
+# Client shared by every search made in this process, created on first use (see get_es_client)
+_shared_client = None
+_shared_client_lock = threading.Lock()
+
+# Threads that searches started with handle_execute_in_background run on (see get_es_executor)
+_shared_executor = None
+
+# Elasticsearch requests made by the current thread since reset_es_request_metrics (see get_es_request_metrics)
+_request_metrics = threading.local()
+
+
+def _reset_shared_client() -> None:
+    """
+    A forked child must not share its parent's sockets (or a lock another parent thread held while forking), so it
+    starts without a client or executor and creates its own on first use
+    """
+    global _shared_client, _shared_client_lock, _shared_executor
+    _shared_client = None
+    _shared_client_lock = threading.Lock()
+    _shared_executor = None  # Its threads were not copied into the child
+
+
+os.register_at_fork(after_in_child=_reset_shared_client)
+
 
 def instantiate_elasticsearch_client() -> Elasticsearch:
     es_kwargs = {"timeout": 300}
@@ -24,11 +52,87 @@ def instantiate_elasticsearch_client() -> Elasticsearch:
     return Elasticsearch(settings.ES_HOSTNAME, **es_kwargs)
 
 
-def create_es_client() -> Elasticsearch:
+class MeteredConnection(Urllib3HttpConnection):
+    """
+    Connection that keeps its idle sockets alive with TCP keep-alive probes and records how long each request took
+    and whether it needed a new socket or reused one from the pool
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if settings.ES_TCP_KEEPALIVE_SECONDS:
+            socket_options = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+            if hasattr(socket, "TCP_KEEPIDLE"):
+                socket_options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, settings.ES_TCP_KEEPALIVE_SECONDS))
+            self.pool.conn_kw["socket_options"] = self.pool.ConnectionCls.default_socket_options + socket_options
+
+    def perform_request(self, *args, **kwargs):
+        connections_before = self.pool.num_connections
+        start = perf_counter()
+        try:
+            return super().perform_request(*args, **kwargs)
+        finally:
+            # Approximate when other threads share the pool, exact for the one request at a time of a sync worker
+            _record_request(perf_counter() - start, self.pool.num_connections - connections_before)
+
+
+def _record_request(duration: float, connections_opened: int, requests: int = 1) -> None:
+    _request_metrics.requests = getattr(_request_metrics, "requests", 0) + requests
+    _request_metrics.duration = getattr(_request_metrics, "duration", 0.0) + duration
+    _request_metrics.connections_opened = getattr(_request_metrics, "connections_opened", 0) + connections_opened
+
+
+def reset_es_request_metrics() -> None:
+    _request_metrics.requests = 0
+    _request_metrics.duration = 0.0
+    _request_metrics.connections_opened = 0
+
+
+def measure_es_requests(func: Callable) -> Tuple[Any, tuple]:
+    """
+    Calls func and returns its result along with the metrics of the Elasticsearch requests it made.  For work done on
+    another thread, whose metrics add_es_request_metrics then adds to those of the thread handling the API request.
+    """
+    reset_es_request_metrics()
+    result = func()
+    return result, (_request_metrics.duration, _request_metrics.connections_opened, _request_metrics.requests)
+
+
+def add_es_request_metrics(metrics: tuple) -> None:
+    _record_request(*metrics)
+
+
+def get_es_request_metrics() -> dict:
+    """
+    Number of Elasticsearch requests made by this thread since reset_es_request_metrics, the milliseconds spent on
+    them, and how many of them opened a new connection instead of reusing a pooled one.  Empty if there were none.
+    """
+    requests = getattr(_request_metrics, "requests", 0)
+    if not requests:
+        return {}
+    connections_opened = min(_request_metrics.connections_opened, requests)
+    return {
+        "es_requests": requests,
+        "es_request_ms": int(_request_metrics.duration * 1000),
+        "es_connections_opened": connections_opened,
+        "es_connections_reused": requests - connections_opened,
+    }
+
+
+def _create_pooled_client() -> Elasticsearch:
     if settings.ES_HOSTNAME is None or settings.ES_HOSTNAME == "":
         logger.error("env var 'ES_HOSTNAME' needs to be set for Elasticsearch connection")
-    global CLIENT
-    es_config = {"hosts": [settings.ES_HOSTNAME], "timeout": settings.ES_TIMEOUT}
+    es_config = {
+        "hosts": [settings.ES_HOSTNAME],
+        "timeout": settings.ES_TIMEOUT,
+        "connection_class": MeteredConnection,
+        "maxsize": settings.ES_MAX_CONNECTIONS,
+        "max_retries": settings.ES_TRANSPORT_MAX_RETRIES,
+    }
+    if settings.ES_SNIFF_INTERVAL:
+        es_config.update(
+            {"sniff_on_start": True, "sniff_on_connection_fail": True, "sniffer_timeout": settings.ES_SNIFF_INTERVAL}
+        )
     try:
         # If the connection string is using SSL with localhost, disable verifying
         # the certificates to allow testing in a development environment
@@ -43,6 +147,34 @@ def create_es_client() -> Elasticsearch:
             ssl_context.verify_mode = CERT_NONE
             es_config["ssl_context"] = ssl_context
 
-        CLIENT = Elasticsearch(**es_config)
+        return Elasticsearch(**es_config)
     except Exception as e:
         logger.error("Error creating the elasticsearch client: {}".format(e))
+
+
+def get_es_client() -> Elasticsearch:
+    """
+    Returns the process-wide client used for API searches.  Its connections are pooled, so searches after the first
+    skip the TCP and TLS handshakes.  Thread-safe, and each forked worker process creates a client of its own.
+    """
+    global _shared_client
+    if _shared_client is None:
+        with _shared_client_lock:
+            if _shared_client is None:
+                _shared_client = _create_pooled_client()
+    return _shared_client
+
+
+def get_es_executor() -> ThreadPoolExecutor:
+    """
+    Returns the process-wide thread pool that background searches wait on Elasticsearch in, sized to the client's
+    connection pool so that every thread can have a connection
+    """
+    global _shared_executor
+    if _shared_executor is None:
+        with _shared_client_lock:
+            if _shared_executor is None:
+                _shared_executor = ThreadPoolExecutor(
+                    max_workers=settings.ES_MAX_CONNECTIONS, thread_name_prefix="elasticsearch"
+                )
+    return _shared_executor
@@ -1,21 +1,51 @@
 import logging
-from ssl import CERT_NONE
+import random
 
-from typing import Optional, Union
+from concurrent.futures import Future
+from functools import partial
+from time import sleep
+from typing import List, Optional, Union
 
 from django.conf import settings
-from elasticsearch.connection import create_ssl_context
-from elasticsearch_dsl import Search
+from elasticsearch_dsl import MultiSearch, Search
 from elasticsearch_dsl.response import Response
 from elasticsearch import ConnectionError, Elasticsearch
 from elasticsearch import ConnectionTimeout
 from elasticsearch import NotFoundError
+from elasticsearch import SSLError
 from elasticsearch import TransportError
 
+from usaspending_api.common.elasticsearch.client import (
+    add_es_request_metrics,
+    get_es_client,
+    get_es_executor,
+    measure_es_requests,
+)
+
 logger = logging.getLogger("console")
 
+# Statuses of requests that may succeed if sent again: too many requests, and a node unreachable or overloaded
+RETRYABLE_STATUS_CODES = {429, 502, 503, 504}
+
+
+def is_retryable(error: TransportError) -> bool:
+    """Whether a failed request is worth retrying; a bad query or a missing index fails the same way every time"""
+    if isinstance(error, SSLError):
+        return False
+    if isinstance(error, ConnectionError):  # Includes ConnectionTimeout
+        return True
+    return error.status_code in RETRYABLE_STATUS_CODES
+
+
+def get_backoff_seconds(attempt: int) -> float:
+    """Exponential backoff with full jitter, so that workers retrying together do not hit the cluster together"""
+    ceiling = min(settings.ES_RETRY_MAX_BACKOFF_SECONDS, settings.ES_RETRY_BACKOFF_SECONDS * 2 ** attempt)
+    return random.uniform(0, ceiling)
+
+
+class _ExecuteMixin:
+    """Retry and error handling shared by the single and multi search wrappers"""
 
-class _Search(Search):
     _index_name = None
 
     def __init__(self, **kwargs) -> None:
@@ -25,26 +55,10 @@ class _Search(Search):
 
     @staticmethod
     def _create_es_client() -> Elasticsearch:
-        if settings.ES_HOSTNAME is None or settings.ES_HOSTNAME == "":
-            logger.error("env var 'ES_HOSTNAME' needs to be set for Elasticsearch connection")
-        es_config = {"hosts": [settings.ES_HOSTNAME], "timeout": settings.ES_TIMEOUT}
-        try:
-            # If the connection string is using SSL with localhost, disable verifying
-            # the certificates to allow testing in a development environment
-            # Also allow host.docker.internal, when SSH-tunneling on localhost to a remote nonprod instance over HTTPS
-            if settings.ES_HOSTNAME.startswith(("https://localhost", "https://host.docker.internal")):
-                logger.warning("SSL cert verification is disabled. Safe only for local development")
-                import urllib3
-
-                urllib3.disable_warnings()
-                ssl_context = create_ssl_context()
-                ssl_context.check_hostname = False
-                ssl_context.verify_mode = CERT_NONE
-                es_config["ssl_context"] = ssl_context
-
-            return Elasticsearch(**es_config)
-        except Exception as e:
-            logger.error("Error creating the elasticsearch client: {}".format(e))
+        return get_es_client()
+
+    def _execute(self, timeout: str):
+        return self.params(timeout=timeout).execute()
 
     def _handle_execute_retry(self, retries: int, timeout: str) -> Optional[Union[Response, int]]:
         if retries > 20:
@@ -52,11 +66,18 @@ class _Search(Search):
         elif retries < 1:
             retries = 1
         for attempt in range(retries):
-            response = self.params(timeout=timeout).execute()
-            if response is None:
-                logger.info(f"Failure using these: Index='{self._index_name}', Body={self.to_dict()}")
+            try:
+                response = self._execute(timeout)
+            except TransportError as e:
+                if attempt + 1 == retries or not is_retryable(e):
+                    raise
+                logger.warning(f"Retrying Elasticsearch request after: {e}")
             else:
-                return response
+                if response is not None:
+                    return response
+                logger.info(f"Failure using these: Index='{self._index_name}', Body={self.to_dict()}")
+            if attempt + 1 < retries:
+                sleep(get_backoff_seconds(attempt))
         logger.error(f"Unable to reach elasticsearch cluster. {retries} attempt(s) made.")
         return None
 
@@ -84,14 +105,63 @@ class _Search(Search):
     def handle_execute(self, retries: int = 5, timeout: str = "90s") -> Response:
         return self._handle_execute_errors(retries, timeout)
 
+    def handle_execute_in_background(self, retries: int = 5, timeout: str = "90s") -> "BackgroundSearch":
+        """
+        Starts handle_execute on a thread of the shared pool and returns straight away.  The view stays synchronous:
+        its own thread does other work, such as querying Postgres on its database connection, while the search runs,
+        then blocks on BackgroundSearch.result for the response.
+        """
+        return BackgroundSearch(
+            get_es_executor().submit(measure_es_requests, partial(self.handle_execute, retries, timeout))
+        )
+
+
+class BackgroundSearch:
+    """A search started by handle_execute_in_background"""
+
+    def __init__(self, future: Future):
+        self.future = future
+
+    def result(self) -> Response:
+        """Waits for the search's response and adds its Elasticsearch request metrics to the calling thread's"""
+        response, metrics = self.future.result()
+        add_es_request_metrics(metrics)
+        return response
+
+
+class _Search(_ExecuteMixin, Search):
     def handle_count(self, retries: int = 5, timeout: str = "90s") -> int:
         self._handle_execute_errors(retries, timeout)
         return self.count()
 
 
+class _MultiSearch(_ExecuteMixin, MultiSearch):
+    """
+    Sends every search added to it to Elasticsearch in a single _msearch request; handle_execute returns their
+    responses in the order they were added.  Use it for independent searches made while handling one request.
+    """
+
+    def _execute(self, timeout: str) -> List[Response]:
+        # _msearch takes no timeout parameter, so it is set in the body of each search instead
+        multi_search = self._clone()
+        multi_search._searches = [search.extra(timeout=timeout) for search in self._searches]
+        return multi_search.execute()
+
+    def handle_execute(self, retries: int = 5, timeout: str = "90s") -> List[Response]:
+        return self._handle_execute_errors(retries, timeout)
+
+
 class TransactionSearch(_Search):
     _index_name = f"{settings.ES_TRANSACTIONS_QUERY_ALIAS_PREFIX}*"
 
 
 class AwardSearch(_Search):
     _index_name = f"{settings.ES_AWARDS_QUERY_ALIAS_PREFIX}*"
+
+
+class TransactionMultiSearch(_MultiSearch):
+    _index_name = f"{settings.ES_TRANSACTIONS_QUERY_ALIAS_PREFIX}*"
+
+
+class AwardMultiSearch(_MultiSearch):
+    _index_name = f"{settings.ES_AWARDS_QUERY_ALIAS_PREFIX}*"
@@ -1,8 +1,9 @@
 import logging
+import multiprocessing
 
 from datetime import datetime
 from django.conf import settings
-from django.db import connection
+from django.db import connection, connections
 
 from usaspending_api.common.exceptions import InvalidParameterException
 from usaspending_api.common.helpers.sql_helpers import read_sql_file
@@ -66,3 +67,37 @@ def update_c_to_d_linkages(type):
     logger.info("Count of unlinked %s records after updates: %s" % (type, str(ending_unlinked_count)))
 
     logger.info("Finished all queries in %s seconds" % str(datetime.now() - total_start))
+
+
+def award_partition_expression(award_key_column, partitions):
+    """
+    SQL expression that assigns every row to one of `partitions` buckets (0 based) by its award key.  Partitioning on
+    the award key rather than the transaction id keeps all transactions for an award in the same worker so two
+    workers never race to create the same award.
+    """
+    return f"abs(mod(hashtext(coalesce({award_key_column}, '')), {int(partitions)}))"
+
+
+def award_partition_filter(award_key_column, partition, partitions):
+    return f"{award_partition_expression(award_key_column, partitions)} = {int(partition)}"
+
+
+def _call_and_close_connections(func, args):
+    try:
+        return func(*args)
+    finally:
+        connections.close_all()
+
+
+def run_in_worker_processes(func, args_list, workers):
+    """
+    Calls func(*args) for each entry in args_list using a pool of `workers` processes and returns the results in
+    order.  Django database connections are closed before forking so that every worker opens its own connection
+    rather than sharing the parent's socket.  func must be importable at module level so it can be pickled.
+    """
+    if workers <= 1:
+        return [func(*args) for args in args_list]
+
+    connections.close_all()
+    with multiprocessing.Pool(workers) as pool:
+        return pool.starmap(_call_and_close_connections, [(func, args) for args in args_list])
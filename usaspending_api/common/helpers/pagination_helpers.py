@@ -0,0 +1,54 @@
+import base64
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+from typing import List
+
+from usaspending_api.common.exceptions import InvalidParameterException
+
+
+def encode_cursor(values: list) -> str:
+    """
+    Opaque cursor for the sort values of the last record of a page.  Dates and decimals become strings, which Postgres
+    and Elasticsearch both compare against their columns as the original types.
+    """
+    return base64.urlsafe_b64encode(json.dumps(values, cls=DjangoJSONEncoder).encode()).decode()
+
+
+def decode_cursor(cursor: str, length: int) -> list:
+    """Sort values of a cursor made by encode_cursor; it must hold exactly length of them"""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except ValueError:  # Includes binascii.Error and UnicodeDecodeError
+        values = None
+    if not isinstance(values, list) or len(values) != length:
+        raise InvalidParameterException("Invalid cursor; use the next_cursor of the previous page")
+    return values
+
+
+def keyset_filter(fields: List[str], values: list, order: str) -> Q:
+    """
+    Filter for the records that come after the one whose sort values are values, when ordered by fields in order with
+    NULLS LAST.  The last field must be unique and never null so that no two records tie.
+
+    Seeking past the previous page this way costs the same on every page, unlike an OFFSET that reads and discards
+    all the records before it.  A row comparison ("WHERE (sort, id) < (%s, %s)") would be shorter but treats NULL as
+    unknown instead of last, so each field gets a range condition its index can seek on instead:
+
+        (sort <= %s AND (sort < %s OR (sort = %s AND id < %s))) OR sort IS NULL
+    """
+    lookup = "gt" if order == "asc" else "lt"
+    field, value = fields[-1], values[-1]
+    after = Q(**{f"{field}__{lookup}": value})
+
+    for field, value in zip(reversed(fields[:-1]), reversed(values[:-1])):
+        if value is None:
+            after = Q(**{f"{field}__isnull": True}) & after
+        else:
+            after = (
+                Q(**{f"{field}__{lookup}e": value})
+                & (Q(**{f"{field}__{lookup}": value}) | (Q(**{field: value}) & after))
+            ) | Q(**{f"{field}__isnull": True})
+
+    return after
@@ -5,6 +5,8 @@ import logging
 import traceback
 from time import perf_counter  # Matches response time browsers return more accurately than now()
 
+from usaspending_api.common.elasticsearch.client import get_es_request_metrics, reset_es_request_metrics
+
 
 def get_remote_addr(request):
     """ Get IP address of user making request can be used for other logging"""
@@ -59,6 +61,7 @@ class LoggingMiddleware(MiddlewareMixin):
     def process_request(self, request):
         """Func called when a request is called on server, function stores request fields for logging"""
         self.start = perf_counter()
+        reset_es_request_metrics()
 
         self.log = {
             "path": request.path,
@@ -90,6 +93,8 @@ class LoggingMiddleware(MiddlewareMixin):
                 self.log["cache_key"] = response._headers["key"][1]
             if "cache-trace" in response._headers and len(response._headers["cache-trace"]) >= 2:
                 self.log["cache_trace"] = response._headers["cache-trace"][1]
+        self.log.update(getattr(response, "cache_metrics", {}))
+        self.log.update(get_es_request_metrics())
 
         if 100 <= status_code < 400:
             # Logged at an INFO level: 1xx (Informational), 2xx (Success), 3xx Redirection
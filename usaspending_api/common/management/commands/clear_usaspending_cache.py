@@ -2,6 +2,8 @@ import logging
 from django.core.management.base import BaseCommand
 from django.core.cache import caches
 
+from usaspending_api.common.cache import bump_data_generation
+
 
 class Command(BaseCommand):
     """
@@ -12,8 +14,20 @@ class Command(BaseCommand):
     help = "Clears the usaspending-cache"
     logger = logging.getLogger("console")
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--bump-generation",
+            action="store_true",
+            help="Start a new data generation instead of clearing the cache. Cached responses become stale and are "
+            "recomputed as they are requested, serving the stale copy to concurrent requests in the meantime.",
+        )
+
     def handle(self, *args, **options):
-        self.logger.info("Clearing usaspending-cache...")
         cache = caches["usaspending-cache"]
-        cache.clear()
+        if options["bump_generation"]:
+            self.logger.info("Starting a new usaspending-cache data generation...")
+            bump_data_generation(cache)
+        else:
+            self.logger.info("Clearing usaspending-cache...")
+            cache.clear()
         self.logger.info("Done.")
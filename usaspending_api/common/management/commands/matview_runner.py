@@ -6,6 +6,7 @@ import subprocess
 from django.core.management.base import BaseCommand
 from pathlib import Path
 
+from usaspending_api.common.cache import try_bump_data_generation
 from usaspending_api.common.data_connectors.async_sql_query import async_run_creates
 from usaspending_api.common.helpers.timing_helpers import ConsoleTimer as Timer
 from usaspending_api.common.matview_manager import (
@@ -66,6 +67,7 @@ class Command(BaseCommand):
             self.create_views()
             if not self.no_cleanup:
                 self.cleanup()
+            try_bump_data_generation()
 
     def generate_matview_sql(self):
         """Convert JSON definition files to SQL"""
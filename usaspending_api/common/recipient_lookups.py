@@ -1,5 +1,7 @@
-from django.db.models import CharField, Expression
+from collections import defaultdict
+from django.db.models import CharField, Expression, Q
 from psycopg2.sql import Identifier, Literal, SQL
+from typing import Iterable, Optional
 from usaspending_api.common.helpers.sql_helpers import convert_composable_query_to_string
 from usaspending_api.recipient.models import RecipientLookup, RecipientProfile
 from usaspending_api.recipient.v2.lookups import SPECIAL_CASES
@@ -97,6 +99,55 @@ def combine_recipient_hash_and_level(recipient_hash, recipient_level):
     return f"{recipient_hash}-{recipient_level.upper()}"
 
 
+# When a recipient has profiles at more than one level, link to the child profile over the standalone one over the
+# parent one
+RECIPIENT_LEVEL_PRECEDENCE = ("C", "R", "P")
+
+
+class RecipientIdLookup:
+    """
+    Recipient ids (hash + level) for every recipient profile matching any of the given recipient hashes or DUNS,
+    fetched with a single query so a page of results can be linked to recipient profiles without a query per row.
+    Recipients named in SPECIAL_CASES are never linked.
+    """
+
+    def __init__(self, recipient_hashes: Iterable = (), recipient_unique_ids: Iterable = ()):
+        self._by_hash = defaultdict(dict)
+        self._by_duns = defaultdict(dict)
+
+        recipient_hashes = {str(recipient_hash) for recipient_hash in recipient_hashes if recipient_hash}
+        recipient_unique_ids = {duns for duns in recipient_unique_ids if duns}
+        if not recipient_hashes and not recipient_unique_ids:
+            return
+
+        profiles = (
+            RecipientProfile.objects.filter(
+                Q(recipient_hash__in=recipient_hashes) | Q(recipient_unique_id__in=recipient_unique_ids)
+            )
+            .exclude(recipient_name__in=SPECIAL_CASES)
+            .values_list("recipient_hash", "recipient_unique_id", "recipient_level")
+        )
+        for recipient_hash, recipient_unique_id, recipient_level in profiles:
+            recipient_id = combine_recipient_hash_and_level(recipient_hash, recipient_level)
+            self._by_hash[str(recipient_hash)][recipient_level] = recipient_id
+            if recipient_unique_id:
+                self._by_duns[recipient_unique_id][recipient_level] = recipient_id
+
+    def get(self, recipient_hash=None, recipient_unique_id=None, recipient_level=None) -> Optional[str]:
+        """
+        Recipient id by hash, or failing that by DUNS, at recipient_level if provided or else at the first level in
+        RECIPIENT_LEVEL_PRECEDENCE that has a profile
+        """
+        if recipient_hash:
+            levels = self._by_hash.get(str(recipient_hash), {})
+        else:
+            levels = self._by_duns.get(recipient_unique_id, {}) if recipient_unique_id else {}
+
+        if recipient_level:
+            return levels.get(recipient_level.upper())
+        return next((levels[level] for level in RECIPIENT_LEVEL_PRECEDENCE if level in levels), None)
+
+
 def _annotate_recipient_id(field_name, queryset, annotation_sql):
     """
     Add recipient id (recipient hash + recipient level) to a queryset.  The assumption here is that
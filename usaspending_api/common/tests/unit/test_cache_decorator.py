@@ -0,0 +1,122 @@
+import json
+import threading
+import time
+import zlib
+
+import pytest
+
+from django.core.cache import caches
+from django.http import HttpResponse
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+from rest_framework.views import APIView
+
+from usaspending_api.common.cache import bump_data_generation, get_data_generations, try_bump_data_generation
+from usaspending_api.common.cache_decorator import cache_response, deserialize_response, serialize_response
+
+
+class CountingView(APIView):
+    authentication_classes = []
+    permission_classes = []
+    calls = 0
+    delay = 0
+
+    @cache_response(cache="default")
+    def post(self, request):
+        type(self).calls += 1
+        time.sleep(self.delay)
+        return Response({"calls": self.calls, "filters": request.data["filters"]})
+
+
+@pytest.fixture
+def view():
+    caches["default"].clear()
+    CountingView.calls = 0
+    CountingView.delay = 0
+    yield CountingView
+    caches["default"].clear()
+
+
+def content(response):
+    return json.loads(response.content)["calls"]
+
+
+def post(filters=None):
+    request = APIRequestFactory().post("/api/v2/test/", {"filters": filters or {}}, format="json")
+    return CountingView.as_view()(request)
+
+
+def test_second_request_hits_cache(view):
+    assert post()["Cache-Trace"] == "set-cache"
+    response = post()
+    assert response["Cache-Trace"] == "hit-cache"
+    assert content(response) == 1
+    assert post({"a": 1})["Cache-Trace"] == "set-cache"
+
+
+def test_new_generation_makes_cached_responses_stale(view):
+    post()
+    bump_data_generation(caches["default"])
+
+    response = post()
+    assert response["Cache-Trace"] == "set-cache"
+    assert content(response) == 2
+
+
+def test_stale_response_served_while_another_request_computes(view):
+    key = post()["key"]
+    bump_data_generation(caches["default"])
+    generation, _ = get_data_generations(caches["default"])
+    caches["default"].add(f"{key.rsplit(':', 1)[0]}:{generation}:lock", True)
+
+    response = post()
+    assert response["Cache-Trace"] == "stale-cache"
+    assert content(response) == 1
+    assert view.calls == 1
+
+
+def test_concurrent_misses_compute_once(view):
+    view.delay = 0.3
+    responses = []
+    threads = [threading.Thread(target=lambda: responses.append(post())) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert view.calls == 1
+    assert sorted(r["Cache-Trace"] for r in responses) == ["hit-cache"] * 4 + ["set-cache"]
+    assert all(content(r) == 1 for r in responses)
+
+
+def test_cached_entry_keeps_only_rendered_content(view, settings):
+    settings.CACHE_COMPRESSION_THRESHOLD = 1000
+    small = post()
+    large = post({"agencies": ["agency"] * 500})
+
+    assert large.cache_metrics["cache_bytes"] < len(large.content)
+    for response in (small, large):
+        value = caches["default"].get(response["key"])
+        status_code, content_type, compressed, cached_content = value
+        assert (status_code, content_type, compressed) == (200, "application/json", response is large)
+        assert (zlib.decompress(cached_content) if compressed else cached_content) == response.content
+
+        hit = post(json.loads(response.content)["filters"])
+        assert hit["Cache-Trace"] == "hit-cache"
+        assert hit.content == response.content
+        assert set(hit.cache_metrics) == {"cache_bytes", "cache_deserialize_ms"}
+
+
+def test_deserialize_ignores_other_formats():
+    assert deserialize_response(None) is None
+    assert deserialize_response({"calls": 1}) is None
+    response = deserialize_response(serialize_response(HttpResponse(b"ok", status=202, content_type="text/plain")))
+    assert (response.status_code, response["Content-Type"], response.content) == (202, "text/plain", b"ok")
+
+
+def test_unreachable_cache_does_not_fail_bump(monkeypatch):
+    def unreachable():
+        raise ConnectionError("Error 111 connecting to redis:6379. Connection refused.")
+
+    monkeypatch.setattr("usaspending_api.common.cache.bump_data_generation", unreachable)
+    assert try_bump_data_generation() is None
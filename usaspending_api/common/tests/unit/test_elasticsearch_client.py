@@ -0,0 +1,49 @@
+import os
+import pytest
+
+from elasticsearch import ConnectionError
+
+from usaspending_api.common.elasticsearch import client as es_client
+from usaspending_api.common.elasticsearch.client import get_es_client, get_es_request_metrics, reset_es_request_metrics
+
+
+@pytest.fixture
+def unreachable_cluster(monkeypatch, settings):
+    settings.ES_HOSTNAME = "http://localhost:1"
+    settings.ES_TRANSPORT_MAX_RETRIES = 0
+    monkeypatch.setattr(es_client, "_shared_client", None)
+
+
+def test_client_is_shared(unreachable_cluster):
+    client = get_es_client()
+    assert get_es_client() is client
+    connection = client.transport.connection_pool.connections[0]
+    assert isinstance(connection, es_client.MeteredConnection)
+
+
+def test_forked_child_creates_its_own_client(unreachable_cluster):
+    client = get_es_client()
+    read_end, write_end = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.write(write_end, b"1" if es_client._shared_client is None and get_es_client() is not client else b"0")
+        os._exit(0)
+    os.waitpid(pid, 0)
+    assert os.read(read_end, 1) == b"1"
+    assert get_es_client() is client
+
+
+def test_request_metrics(unreachable_cluster):
+    reset_es_request_metrics()
+    assert get_es_request_metrics() == {}
+
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            get_es_client().info()
+
+    metrics = get_es_request_metrics()
+    assert metrics["es_requests"] == 2
+    assert metrics["es_connections_opened"] + metrics["es_connections_reused"] == 2
+
+    reset_es_request_metrics()
+    assert get_es_request_metrics() == {}
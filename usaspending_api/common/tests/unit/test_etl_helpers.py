@@ -0,0 +1,28 @@
+import os
+
+from usaspending_api.common.helpers.etl_helpers import award_partition_filter, run_in_worker_processes
+
+
+def _square_with_pid(value):
+    return value * value, os.getpid()
+
+
+def test_award_partition_filter():
+    assert (
+        award_partition_filter("unique_award_key", 2, 4) == "abs(mod(hashtext(coalesce(unique_award_key, '')), 4)) = 2"
+    )
+
+
+def test_run_in_worker_processes_serially():
+    results = run_in_worker_processes(_square_with_pid, [(1,), (2,), (3,)], 1)
+
+    assert [result[0] for result in results] == [1, 4, 9]
+    assert {result[1] for result in results} == {os.getpid()}
+
+
+def test_run_in_worker_processes_in_parallel():
+    results = run_in_worker_processes(_square_with_pid, [(1,), (2,), (3,), (4,)], 2)
+
+    # Results come back in the order the arguments were provided, from processes other than this one
+    assert [result[0] for result in results] == [1, 4, 9, 16]
+    assert os.getpid() not in {result[1] for result in results}
@@ -0,0 +1,50 @@
+from usaspending_api.common.cache import memoize_per_generation
+
+
+def memoized_counter(generation):
+    loads = []
+
+    def load():
+        loads.append(generation["token"])
+        return len(loads)
+
+    def get_generation():
+        if generation["token"] is None:
+            raise ConnectionError("cache unreachable")
+        return generation["token"]
+
+    return memoize_per_generation(load, get_generation), loads
+
+
+def test_loaded_once_per_generation(settings):
+    settings.GENERATION_CHECK_INTERVAL = 0
+    generation = {"token": "one"}
+    counter, loads = memoized_counter(generation)
+
+    assert counter() == counter() == 1
+    generation["token"] = "two"
+    assert counter() == 2
+    assert loads == ["one", "two"]
+
+
+def test_generation_checked_once_per_interval(settings):
+    settings.GENERATION_CHECK_INTERVAL = 3600
+    generation = {"token": "one"}
+    counter, _ = memoized_counter(generation)
+
+    assert counter() == 1
+    generation["token"] = "two"
+    assert counter() == 1
+
+    counter.cache_clear()
+    assert counter() == 2
+
+
+def test_keeps_serving_when_generation_unavailable(settings):
+    settings.GENERATION_CHECK_INTERVAL = 0
+    generation = {"token": "one"}
+    counter, _ = memoized_counter(generation)
+
+    assert counter() == 1
+    generation["token"] = None
+    assert counter() == 1
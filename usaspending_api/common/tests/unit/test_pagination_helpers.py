@@ -0,0 +1,42 @@
+import pytest
+
+from datetime import date
+from decimal import Decimal
+
+from usaspending_api.common.exceptions import InvalidParameterException
+from usaspending_api.common.helpers.pagination_helpers import decode_cursor, encode_cursor, keyset_filter
+from usaspending_api.search.models import SubawardView
+
+
+def _where(q):
+    return str(SubawardView.objects.filter(q).values("subaward_id").query).split(" WHERE ")[1]
+
+
+def test_cursor_round_trip():
+    cursor = encode_cursor([date(2020, 1, 31), Decimal("12.50"), None, "ABC 123", 7])
+    assert decode_cursor(cursor, 5) == ["2020-01-31", "12.50", None, "ABC 123", 7]
+
+
+def test_invalid_cursor():
+    with pytest.raises(InvalidParameterException):
+        decode_cursor("not a cursor", 2)
+
+    with pytest.raises(InvalidParameterException):
+        decode_cursor(encode_cursor({"sort": 1}), 2)
+
+    with pytest.raises(InvalidParameterException):
+        decode_cursor(encode_cursor([1, 2, 3]), 2)
+
+
+def test_keyset_filter():
+    assert _where(keyset_filter(["subaward_id"], [7], "asc")) == '"subaward_view"."subaward_id" > 7'
+
+    assert _where(keyset_filter(["amount", "subaward_id"], ["12.50", 7], "desc")) == (
+        '(("subaward_view"."amount" <= 12.50 AND ("subaward_view"."amount" < 12.50 OR ("subaward_view"."amount" = 12.50'
+        ' AND "subaward_view"."subaward_id" < 7))) OR "subaward_view"."amount" IS NULL)'
+    )
+
+    # Records sorted after NULLs can only be more NULLs, ordered by the remaining fields
+    assert _where(keyset_filter(["amount", "subaward_id"], [None, 7], "asc")) == (
+        '("subaward_view"."amount" IS NULL AND "subaward_view"."subaward_id" > 7)'
+    )
@@ -2,7 +2,10 @@ import pytest
 
 from model_mommy import mommy
 
-from usaspending_api.common.recipient_lookups import obtain_recipient_uri
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from usaspending_api.common.recipient_lookups import obtain_recipient_uri, RecipientIdLookup
 
 
 @pytest.fixture
@@ -101,3 +104,54 @@ def test_parent_recipient_with_id_and_name(recipient_lookup):
     }
     expected_result = "01c03484-d1bd-41cc-2aca-4b427a2d0611-P"
     assert obtain_recipient_uri(**child_recipient_parameters) == expected_result
+
+
+@pytest.mark.django_db
+def test_recipient_id_lookup_uses_one_query_and_level_precedence():
+    mommy.make(
+        "recipient.RecipientProfile",
+        recipient_hash="00000000-0000-0000-0000-000000000001",
+        recipient_level="P",
+        recipient_unique_id="111",
+        recipient_name="Parent And Child",
+    )
+    mommy.make(
+        "recipient.RecipientProfile",
+        recipient_hash="00000000-0000-0000-0000-000000000001",
+        recipient_level="C",
+        recipient_unique_id="111",
+        recipient_name="Parent And Child",
+    )
+    mommy.make(
+        "recipient.RecipientProfile",
+        recipient_hash="00000000-0000-0000-0000-000000000002",
+        recipient_level="R",
+        recipient_unique_id="222",
+        recipient_name="Standalone",
+    )
+    mommy.make(
+        "recipient.RecipientProfile",
+        recipient_hash="00000000-0000-0000-0000-000000000003",
+        recipient_level="R",
+        recipient_unique_id="333",
+        recipient_name="MULTIPLE RECIPIENTS",
+    )
+
+    with CaptureQueriesContext(connection) as queries:
+        lookup = RecipientIdLookup(
+            recipient_hashes=["00000000-0000-0000-0000-000000000002"], recipient_unique_ids=["111", "333", None]
+        )
+    assert len(queries) == 1
+
+    assert lookup.get(recipient_unique_id="111") == "00000000-0000-0000-0000-000000000001-C"
+    assert lookup.get(recipient_unique_id="111", recipient_level="p") == "00000000-0000-0000-0000-000000000001-P"
+    assert lookup.get(recipient_hash="00000000-0000-0000-0000-000000000002") == "00000000-0000-0000-0000-000000000002-R"
+    assert lookup.get(recipient_unique_id="333") is None
+    assert lookup.get(recipient_unique_id=None) is None
+
+
+@pytest.mark.django_db
+def test_recipient_id_lookup_without_keys_skips_query():
+    with CaptureQueriesContext(connection) as queries:
+        assert RecipientIdLookup(recipient_unique_ids=[None]).get(recipient_unique_id=None) is None
+    assert len(queries) == 0
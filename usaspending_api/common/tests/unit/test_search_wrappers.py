@@ -0,0 +1,150 @@
+import pytest
+import threading
+
+from collections import Counter
+from elasticsearch import ConnectionError, ConnectionTimeout, NotFoundError, SSLError, TransportError
+
+from usaspending_api.awards.v2.lookups.elasticsearch_lookups import INDEX_ALIASES_TO_AWARD_TYPES
+from usaspending_api.common.elasticsearch.search_wrappers import (
+    is_retryable,
+    TransactionMultiSearch,
+    TransactionSearch,
+)
+from usaspending_api.search.v2.elasticsearch_helper import get_download_ids
+
+
+class LocalElasticsearch:
+    """Stand-in client that counts requests and answers every search with its partition number"""
+
+    def __init__(self, total=0):
+        self.total = total
+        self.requests = Counter()
+        self.msearch_bodies = []
+
+    def search(self, index, body, **params):
+        self.requests["search"] += 1
+        self.search_thread = threading.current_thread().name
+        buckets = {category: {"doc_count": 0} for category in INDEX_ALIASES_TO_AWARD_TYPES}
+        buckets["contracts"]["doc_count"] = self.total
+        return {"hits": {"hits": []}, "aggregations": {"types": {"buckets": buckets}}}
+
+    def msearch(self, index, body, **params):
+        assert not params, "_msearch does not accept a timeout parameter"
+        self.requests["msearch"] += 1
+        self.msearch_bodies.append(body)
+        searches = body[1::2]
+        return {
+            "responses": [
+                {
+                    "hits": {"hits": []},
+                    "aggregations": {
+                        "results": {"buckets": [{"key": search["aggs"]["results"]["terms"]["include"]["partition"]}]}
+                    },
+                }
+                for search in searches
+            ]
+        }
+
+
+@pytest.fixture
+def local_client(monkeypatch):
+    client = LocalElasticsearch()
+    monkeypatch.setattr(
+        "usaspending_api.common.elasticsearch.search_wrappers._ExecuteMixin._create_es_client",
+        staticmethod(lambda: client),
+    )
+    return client
+
+
+def test_multi_search_is_one_request(local_client):
+    multi_search = TransactionMultiSearch()
+    for partition in range(3):
+        search = TransactionSearch().extra(size=0)
+        search.aggs.bucket("results", "terms", field="transaction_id", include={"partition": partition})
+        multi_search = multi_search.add(search)
+
+    responses = multi_search.handle_execute(timeout="30s")
+
+    assert local_client.requests == Counter({"msearch": 1})
+    assert [r.aggregations.results.buckets[0].key for r in responses] == [0, 1, 2]
+    assert all(search["timeout"] == "30s" for search in local_client.msearch_bodies[0][1::2])
+
+
+def test_get_download_ids_partitions_share_a_request(local_client):
+    local_client.total = 25
+    assert list(get_download_ids(["pop tart"], "transaction_id", size=10)) == [[0], [1], [2]]
+    assert local_client.requests == Counter({"search": 1, "msearch": 1})
+
+
+class FlakySearch(TransactionSearch):
+    def __init__(self, errors, **kwargs):
+        super().__init__(**kwargs)
+        self.errors = errors
+        self.attempts = 0
+
+    def _clone(self):
+        return self
+
+    def _execute(self, timeout):
+        self.attempts += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return "response"
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr("usaspending_api.common.elasticsearch.search_wrappers.sleep", sleeps.append)
+    return sleeps
+
+
+def test_retryable_errors_are_retried_with_backoff(local_client, sleeps, settings):
+    settings.ES_RETRY_BACKOFF_SECONDS = 1
+    settings.ES_RETRY_MAX_BACKOFF_SECONDS = 3
+    search = FlakySearch([ConnectionTimeout("TIMEOUT", "", None), TransportError(503, "", None)] * 2)
+
+    assert search.handle_execute(retries=5) == "response"
+    assert search.attempts == 5
+    assert len(sleeps) == 4
+    assert all(0 <= s <= ceiling for s, ceiling in zip(sleeps, [1, 2, 3, 3]))
+
+
+def test_other_errors_are_not_retried(local_client, sleeps):
+    search = FlakySearch([TransportError(400, "search_phase_execution_exception", None)])
+    with pytest.raises(TransportError):
+        search.handle_execute(retries=5)
+    assert search.attempts == 1
+    assert sleeps == []
+
+    search = FlakySearch([ConnectionError("N/A", "", None)] * 3)
+    with pytest.raises(ConnectionError):
+        search.handle_execute(retries=3)
+    assert search.attempts == 3
+    assert len(sleeps) == 2
+
+
+def test_is_retryable():
+    assert is_retryable(ConnectionTimeout("TIMEOUT", "", None))
+    assert is_retryable(TransportError(429, "", None))
+    assert not is_retryable(SSLError("N/A", "", None))
+    assert not is_retryable(NotFoundError(404, "", None))
+
+
+def test_handle_execute_in_background(local_client, monkeypatch):
+    local_client.total = 3
+    released = threading.Event()
+    search = local_client.search
+
+    def blocked_search(*args, **kwargs):
+        assert released.wait(5)
+        return search(*args, **kwargs)
+
+    monkeypatch.setattr(local_client, "search", blocked_search)
+    background_search = TransactionSearch().handle_execute_in_background()
+    # the search can only finish after the caller has its thread back
+    released.set()
+    response = background_search.result()
+
+    assert response.aggregations.types.buckets.contracts.doc_count == 3
+    assert local_client.search_thread.startswith("elasticsearch")
@@ -38,6 +38,12 @@ def pytest_configure():
                 "Connection '{}' appears to be pointing to an AWS database: [{}]".format(connection_name, host)
             )
 
+    # Tests create their own rows, so reload data held in memory on every lookup rather than serving a previous test's
+    # rows (the cache is disabled under test, so every check finds a new generation).  The spending_over_time cube is
+    # keyed on a date in Postgres instead, so its tests clear it themselves.
+    settings.GENERATION_CHECK_INTERVAL = 0
+    settings.ES_SUM_CENTS_FIELDS = True  # Test indexes are always built with the cents fields
+
 
 def pytest_addoption(parser):
     parser.addoption("--local", action="store", default="true")
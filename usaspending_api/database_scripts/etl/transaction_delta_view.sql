@@ -81,6 +81,9 @@ SELECT
   UTM.face_value_loan_guarantee,
   UTM.original_loan_subsidy_cost,
   UTM.generated_pragmatic_obligation,
+  -- Integer cents, summed natively by Elasticsearch aggregations instead of scaling every value with a script
+  (UTM.face_value_loan_guarantee * 100)::BIGINT AS face_value_loan_guarantee_cents,
+  (UTM.generated_pragmatic_obligation * 100)::BIGINT AS generated_pragmatic_obligation_cents,
 
   UTM.awarding_agency_id,
   UTM.funding_agency_id,
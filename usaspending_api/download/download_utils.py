@@ -1,4 +1,9 @@
+import hashlib
+
 from datetime import datetime, timezone
+from django.db import connection
+from django.db.models import Max
+from usaspending_api.broker.models import ExternalDataLoadDate
 from usaspending_api.common.helpers.text_helpers import slugify_text_for_file_names
 from usaspending_api.common.logging import get_remote_addr
 from usaspending_api.download.helpers import write_to_download_log
@@ -78,3 +83,27 @@ def construct_data_date_range(provided_filters: dict) -> str:
     if provided_filters.get("quarter") != 1:
         string += f"-Q{provided_filters.get('quarter')}"
     return string
+
+
+def get_request_fingerprint(ordered_json_request: str) -> str:
+    """Indexed stand-in for json_request (already canonicalized by order_nested_object) when looking up download jobs"""
+    return hashlib.md5(ordered_json_request.encode("utf-8")).hexdigest()
+
+
+def lock_request_fingerprint(request_fingerprint: str) -> None:
+    """
+    Blocks until no other transaction holds the lock for request_fingerprint and holds it until the current
+    transaction ends, so that only one of several identical concurrent requests creates a download job
+    """
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_advisory_xact_lock(hashtext(%s))", [request_fingerprint])
+
+
+def get_data_freshness_cutoff() -> datetime:
+    """
+    Download jobs created before this may be missing data: the later of the start of today (which covers loads that
+    do not record a load date, like submissions) and the most recent external data load
+    """
+    start_of_today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    last_load_date = ExternalDataLoadDate.objects.aggregate(Max("last_load_date"))["last_load_date__max"]
+    return max(start_of_today, last_load_date) if last_load_date else start_of_today
@@ -1,3 +1,5 @@
+import csv
+import io
 import json
 import logging
 import multiprocessing
@@ -13,12 +15,13 @@ import tempfile
 import time
 import traceback
 
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from django.conf import settings
 
 from usaspending_api.awards.v2.filters.filter_helpers import add_date_range_comparison_types
 from usaspending_api.awards.v2.lookups.lookups import contract_type_mapping, assistance_type_mapping, idv_type_mapping
-from usaspending_api.common.csv_helpers import count_rows_in_delimited_file, partition_large_delimited_file
+from usaspending_api.common.csv_helpers import partition_large_delimited_file
 from usaspending_api.common.exceptions import InvalidParameterException
 from usaspending_api.common.helpers.orm_helpers import generate_raw_quoted_query
 from usaspending_api.common.helpers.text_helpers import slugify_text_for_file_names
@@ -27,7 +30,8 @@ from usaspending_api.download.download_utils import construct_data_date_range
 from usaspending_api.download.filestreaming import NAMING_CONFLICT_DISCRIMINATOR
 from usaspending_api.download.filestreaming.download_source import DownloadSource
 from usaspending_api.download.filestreaming.file_description import build_file_description, save_file_description
-from usaspending_api.download.filestreaming.zip_file import append_files_to_zip_file
+from usaspending_api.download.filestreaming.zip_file import append_files_to_zip_file, write_rows_to_zip_file
+from usaspending_api.download.helpers.elasticsearch_download_functions import download_id_tables
 from usaspending_api.download.helpers import (
     verify_requested_columns_available,
     multipart_upload,
@@ -70,20 +74,54 @@ def generate_download(download_job: DownloadJob, origination: Optional[str] = No
 
         write_to_log(message=f"Generating {file_name}", download_job=download_job)
 
-        # Generate sources from the JSON request object
-        sources = get_download_sources(json_request, origination)
-        for source in sources:
-            # Parse and write data to the file; if there are no matching columns for a source then add an empty file
-            source_column_count = len(source.columns(columns))
-            if source_column_count == 0:
-                create_empty_data_file(
-                    source, download_job, working_dir, piid, assistance_id, zip_file_path, file_format
-                )
-            else:
-                download_job.number_of_columns += source_column_count
-                parse_source(
-                    source, columns, download_job, working_dir, piid, assistance_id, zip_file_path, limit, file_format
-                )
+        # Elasticsearch-backed sources stage their ids in tables that are dropped once every export has run
+        with download_id_tables():
+            # Generate sources from the JSON request object
+            sources = get_download_sources(json_request, origination)
+            workers = get_source_worker_count(len([source for source in sources if source.columns(columns)]))
+            # Concurrent exports take turns adding their members to the zip file
+            archive_lock = multiprocessing.Lock()
+            zip_workers = get_zip_worker_count(workers)
+            running_exports = []
+            try:
+                for source in sources:
+                    # Parse and write data to the file; if there are no matching columns for a source then add an empty file
+                    source_column_count = len(source.columns(columns))
+                    if source_column_count == 0:
+                        create_empty_data_file(
+                            source,
+                            download_job,
+                            working_dir,
+                            piid,
+                            assistance_id,
+                            zip_file_path,
+                            file_format,
+                            archive_lock,
+                        )
+                        continue
+
+                    download_job.number_of_columns += source_column_count
+                    running_exports.append(
+                        start_source_export(
+                            source,
+                            columns,
+                            download_job,
+                            piid,
+                            assistance_id,
+                            zip_file_path,
+                            limit,
+                            file_format,
+                            archive_lock,
+                            zip_workers,
+                        )
+                    )
+                    if len(running_exports) == workers:
+                        finish_source_export(running_exports.pop(0), download_job)
+                while running_exports:
+                    finish_source_export(running_exports.pop(0), download_job)
+            finally:
+                for export in running_exports:
+                    remove_export_query_temp_file(export)
         include_data_dictionary = json_request.get("include_data_dictionary")
         if include_data_dictionary:
             add_data_dictionary_to_zip(working_dir, zip_file_path)
@@ -240,15 +278,41 @@ def build_data_file_name(source, download_job, piid, assistance_id):
     return data_file_name
 
 
-def parse_source(source, columns, download_job, working_dir, piid, assistance_id, zip_file_path, limit, file_format):
-    """Write to delimited text file(s) and zip file(s) using the source data"""
+@dataclass
+class SourceExport:
+    """A download source being streamed into a zip file by its own process"""
+
+    source: DownloadSource
+    process: multiprocessing.Process
+    start_time: float
+    row_count: multiprocessing.Value
+    temp_file: int
+    temp_file_path: str
+
+
+def get_source_worker_count(source_count):
+    """Number of sources to export at once, bounded by DOWNLOAD_SOURCE_WORKERS and the CPUs available"""
+    return max(1, min(source_count, settings.DOWNLOAD_SOURCE_WORKERS, os.cpu_count() or 1))
+
+
+def get_zip_worker_count(source_workers):
+    """Number of deflate processes for each of source_workers sources exported at once, from DOWNLOAD_WORKER_BUDGET"""
+    return max(1, min(settings.DOWNLOAD_WORKER_BUDGET // source_workers, os.cpu_count() or 1))
+
+
+def start_source_export(
+    source, columns, download_job, piid, assistance_id, zip_file_path, limit, file_format, archive_lock, zip_workers
+):
+    """
+    Start streaming the source data into delimited text file(s) inside the zip file, deflated by zip_workers processes.
+    archive_lock is shared with any other process adding to the zip file at the same time.
+    """
 
     data_file_name = build_data_file_name(source, download_job, piid, assistance_id)
 
     source_query = source.row_emitter(columns)
     extension = FILE_FORMATS[file_format]["extension"]
     source.file_name = f"{data_file_name}.{extension}"
-    source_path = os.path.join(working_dir, source.file_name)
 
     write_to_log(message=f"Preparing to download data as {source.file_name}", download_job=download_job)
 
@@ -256,41 +320,39 @@ def parse_source(source, columns, download_job, working_dir, piid, assistance_id
     export_query = generate_export_query(source_query, limit, source, columns, file_format)
     temp_file, temp_file_path = generate_export_query_temp_file(export_query, download_job)
 
-    start_time = time.perf_counter()
-    try:
-        # Create a separate process to run the PSQL command; wait
-        psql_process = multiprocessing.Process(target=execute_psql, args=(temp_file_path, source_path, download_job))
-        psql_process.start()
-        wait_for_process(psql_process, start_time, download_job)
+    # Create a separate process to stream the PSQL output into the zip file
+    row_count = multiprocessing.Value("q", 0)
+    psql_process = multiprocessing.Process(
+        target=stream_psql_to_zip_file,
+        args=(
+            temp_file_path,
+            zip_file_path,
+            data_file_name,
+            file_format,
+            row_count,
+            download_job,
+            archive_lock,
+            zip_workers,
+        ),
+    )
+    psql_process.start()
+    return SourceExport(source, psql_process, time.perf_counter(), row_count, temp_file, temp_file_path)
 
-        delim = FILE_FORMATS[file_format]["delimiter"]
 
-        # Log how many rows we have
-        write_to_log(message="Counting rows in delimited text file", download_job=download_job)
-        try:
-            download_job.number_of_rows += count_rows_in_delimited_file(
-                filename=source_path, has_header=True, delimiter=delim
-            )
-        except Exception:
-            write_to_log(
-                message="Unable to obtain delimited text file line count", is_error=True, download_job=download_job
-            )
-        download_job.save()
-
-        # Create a separate process to split the large data files into smaller file and write to zip; wait
-        zip_process = multiprocessing.Process(
-            target=split_and_zip_data_files,
-            args=(zip_file_path, source_path, data_file_name, file_format, download_job),
-        )
-        zip_process.start()
-        wait_for_process(zip_process, start_time, download_job)
+def finish_source_export(export, download_job):
+    """Wait for the source export to complete and record its rows"""
+    try:
+        wait_for_process(export.process, export.start_time, download_job)
+        download_job.number_of_rows += export.row_count.value
         download_job.save()
-    except Exception as e:
-        raise e
     finally:
-        # Remove temporary files
-        os.close(temp_file)
-        os.remove(temp_file_path)
+        remove_export_query_temp_file(export)
+
+
+def remove_export_query_temp_file(export):
+    if os.path.exists(export.temp_file_path):
+        os.close(export.temp_file)
+        os.remove(export.temp_file_path)
 
 
 def split_and_zip_data_files(zip_file_path, source_path, data_file_name, file_format, download_job=None):
@@ -314,7 +376,7 @@ def split_and_zip_data_files(zip_file_path, source_path, data_file_name, file_fo
         # Zip the split files into one zipfile
         write_to_log(message="Beginning zipping and compression", download_job=download_job)
         log_time = time.perf_counter()
-        append_files_to_zip_file(list_of_files, zip_file_path)
+        append_files_to_zip_file(list_of_files, zip_file_path, FILE_FORMATS[file_format]["compression_level"])
 
         if download_job:
             write_to_log(
@@ -497,21 +559,64 @@ def _top_level_split(sql, splitter):
     raise Exception(f"SQL string ${sql} cannot be split on ${splitter}")
 
 
-def execute_psql(temp_sql_file_path, source_path, download_job):
-    """Executes a single PSQL command within its own Subprocess"""
+def stream_psql_to_zip_file(
+    temp_sql_file_path,
+    zip_file_path,
+    data_file_name,
+    file_format,
+    row_count,
+    download_job,
+    archive_lock=None,
+    zip_workers=1,
+):
+    """
+    Executes a single PSQL command within its own Subprocess and reads its output exactly once: rows are counted as
+    they arrive and written into the zip file, starting a new member every EXCEL_ROW_LIMIT rows
+    (e.g. `Assistance_prime_transactions_delta_1.csv`).  Complete members are deflated into the zip file by zip_workers
+    processes, holding archive_lock while they do, while psql keeps streaming.  The row count is returned through the
+    shared row_count value.
+    """
     try:
         log_time = time.perf_counter()
+        delim = FILE_FORMATS[file_format]["delimiter"]
+        extension = FILE_FORMATS[file_format]["extension"]
 
-        cat_command = subprocess.Popen(["cat", temp_sql_file_path], stdout=subprocess.PIPE)
-        subprocess.check_output(
-            ["psql", "-q", "-o", source_path, retrieve_db_string(), "-v", "ON_ERROR_STOP=1"],
-            stdin=cat_command.stdout,
-            stderr=subprocess.STDOUT,
-        )
+        with open(temp_sql_file_path, "r") as sql_file, tempfile.TemporaryFile() as psql_errors:
+            psql_process = subprocess.Popen(
+                ["psql", "-q", retrieve_db_string(), "-v", "ON_ERROR_STOP=1"],
+                stdin=sql_file,
+                stdout=subprocess.PIPE,
+                stderr=psql_errors,
+            )
+            try:
+                rows = csv.reader(io.TextIOWrapper(psql_process.stdout, encoding="utf-8", newline=""), delimiter=delim)
+                row_count.value = write_rows_to_zip_file(
+                    rows,
+                    zip_file_path,
+                    f"{data_file_name}_%s.{extension}",
+                    EXCEL_ROW_LIMIT,
+                    delim,
+                    FILE_FORMATS[file_format]["compression_level"],
+                    workers=zip_workers,
+                    lock=archive_lock,
+                )
+            except Exception:
+                psql_process.kill()
+                raise
+            finally:
+                psql_process.stdout.close()
+                psql_process.wait()
+
+            if psql_process.returncode != 0:
+                psql_errors.seek(0)
+                raise subprocess.CalledProcessError(
+                    psql_process.returncode, psql_process.args, output=psql_errors.read()
+                )
 
         duration = time.perf_counter() - log_time
         write_to_log(
-            message=f"Wrote {os.path.basename(source_path)}, took {duration:.4f} seconds", download_job=download_job
+            message=f"Wrote {row_count.value:,} rows of {data_file_name} to the zip file, took {duration:.4f} seconds",
+            download_job=download_job,
         )
     except Exception as e:
         if not settings.IS_LOCAL:
@@ -574,6 +679,7 @@ def create_empty_data_file(
     assistance_id: str,
     zip_file_path: str,
     file_format: str,
+    archive_lock: Optional["multiprocessing.synchronize.Lock"] = None,
 ) -> None:
     data_file_name = build_data_file_name(source, download_job, piid, assistance_id)
     extension = FILE_FORMATS[file_format]["extension"]
@@ -583,4 +689,4 @@ def create_empty_data_file(
         message=f"Skipping download of {source.file_name} due to no valid columns provided", download_job=download_job
     )
     Path(source_path).touch()
-    append_files_to_zip_file([source_path], zip_file_path)
+    append_files_to_zip_file([source_path], zip_file_path, lock=archive_lock)
@@ -1,8 +1,17 @@
+import contextlib
+import csv
+import io
+import itertools
+import multiprocessing
 import os
+import tempfile
 import zipfile
 
+# Shared by the processes of a member pool (see _write_rows_to_zip_file_by_member) to take turns adding to the archive
+_archive_lock = None
 
-def append_files_to_zip_file(file_paths, zip_file_path):
+
+def append_files_to_zip_file(file_paths, zip_file_path, compression_level=None, lock=None):
     """
     Create zip archive at the specified zip_file_path if it does not exist, and add all the files at provided
     file_paths to it.
@@ -12,8 +21,112 @@ def append_files_to_zip_file(file_paths, zip_file_path):
     it will throw a UserWarning and duplicate the file.
     Use caution in this case by removing the zip in the finally of an exception and also checking for and removing
     the zip if it exists before you begin to create it from scratch
+
+    compression_level is the zlib level (0-9, None for the zlib default).  lock, a multiprocessing.Lock, is held
+    while the zip file is open so that several processes can add members to the same zip file in turn.
+    """
+    with lock or contextlib.nullcontext():
+        with zipfile.ZipFile(
+            zip_file_path, "a", compression=zipfile.ZIP_DEFLATED, compresslevel=compression_level, allowZip64=True
+        ) as zip_file:
+            for file_path in file_paths:
+                archive_name = os.path.basename(file_path)
+                zip_file.write(file_path, archive_name)
+
+
+def _set_archive_lock(lock):
+    global _archive_lock
+    _archive_lock = lock
+
+
+def _move_file_to_zip_file(file_path, zip_file_path, compression_level):
+    append_files_to_zip_file([file_path], zip_file_path, compression_level, _archive_lock)
+    os.remove(file_path)
+
+
+def write_rows_to_zip_file(
+    rows, zip_file_path, output_name_template, row_limit, delimiter=",", compression_level=None, workers=1, lock=None
+):
+    """
+    Write delimited rows straight into a zip archive without an intermediate file, starting a new archive member
+    named by the %s-style output_name_template (numbered from 1) every row_limit rows.  The first row is treated as the
+    header and repeated at the top of every member.  Returns the number of data rows written.
+
+    With workers > 1, or a lock shared with other processes adding to the same zip file, each member is instead
+    written uncompressed to a temporary directory beside zip_file_path and, once complete, added to the zip file by a
+    pool of workers processes while the next member is written.  The lock is only held while one member is added, so
+    the processes writing the zip file take turns a member at a time, and at most workers + 1 uncompressed members are
+    on disk at once.  Members are then in the order they were added rather than by number.
+
+    Members are added in append mode, the same as append_files_to_zip_file.
     """
-    with zipfile.ZipFile(zip_file_path, "a", compression=zipfile.ZIP_DEFLATED, allowZip64=True) as zip_file:
-        for file_path in file_paths:
-            archive_name = os.path.basename(file_path)
-            zip_file.write(file_path, archive_name)
+    rows = iter(rows)
+    headers = next(rows, None)
+    if workers > 1 or lock is not None:
+        return _write_rows_to_zip_file_by_member(
+            rows, headers, zip_file_path, output_name_template, row_limit, delimiter, compression_level, workers, lock
+        )
+
+    row_count = 0
+    with zipfile.ZipFile(
+        zip_file_path, "a", compression=zipfile.ZIP_DEFLATED, compresslevel=compression_level, allowZip64=True
+    ) as zip_file:
+        partition_number = 1
+        member, writer = _open_delimited_member(zip_file, output_name_template % partition_number, delimiter, headers)
+        try:
+            for row in rows:
+                if row_count == row_limit * partition_number:
+                    member.close()
+                    partition_number += 1
+                    archive_name = output_name_template % partition_number
+                    member, writer = _open_delimited_member(zip_file, archive_name, delimiter, headers)
+                writer.writerow(row)
+                row_count += 1
+        finally:
+            member.close()
+    return row_count
+
+
+def _write_rows_to_zip_file_by_member(
+    rows, headers, zip_file_path, output_name_template, row_limit, delimiter, compression_level, workers, lock
+):
+    zip_dir = os.path.dirname(os.path.abspath(zip_file_path))
+    with tempfile.TemporaryDirectory(prefix="zip_parts_", dir=zip_dir) as part_dir:
+        with multiprocessing.Pool(workers, _set_archive_lock, (lock or multiprocessing.Lock(),)) as pool:
+            row_count, partition_number = 0, 1
+            pending = []
+            partition_rows = itertools.islice(rows, row_limit)
+            while True:
+                file_path = os.path.join(part_dir, output_name_template % partition_number)
+                with open(file_path, "w", encoding="utf-8", newline="") as member:
+                    writer = csv.writer(member, delimiter=delimiter)
+                    if headers is not None:
+                        writer.writerow(headers)
+                    partition_row_count = 0
+                    for row in partition_rows:
+                        writer.writerow(row)
+                        partition_row_count += 1
+                row_count += partition_row_count
+
+                pending.append(pool.apply_async(_move_file_to_zip_file, (file_path, zip_file_path, compression_level)))
+                if len(pending) > workers:
+                    pending.pop(0).get()
+
+                # Only start another member once there is a row to put in it
+                next_row = next(rows, None) if partition_row_count == row_limit else None
+                if next_row is None:
+                    break
+                partition_number += 1
+                partition_rows = itertools.chain([next_row], itertools.islice(rows, row_limit - 1))
+
+            for result in pending:
+                result.get()
+    return row_count
+
+
+def _open_delimited_member(zip_file, archive_name, delimiter, headers):
+    member = io.TextIOWrapper(zip_file.open(archive_name, "w", force_zip64=True), encoding="utf-8", newline="")
+    writer = csv.writer(member, delimiter=delimiter)
+    if headers is not None:
+        writer.writerow(headers)
+    return member, writer
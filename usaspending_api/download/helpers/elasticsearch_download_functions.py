@@ -1,7 +1,12 @@
-import itertools
+import io
 import logging
+import psycopg2
+import threading
+import time
 from abc import ABCMeta, abstractmethod
-from typing import Union
+from contextlib import contextmanager
+from typing import Iterator, List, Union
+from uuid import uuid4
 
 from django.conf import settings
 from django.db.models import QuerySet
@@ -13,6 +18,95 @@ from usaspending_api.search.models import AwardSearchView, UniversalTransactionV
 
 logger = logging.getLogger(__name__)
 
+# Ids are staged in a regular (unlogged) table because the export query runs in a separate psql session that would
+# not see a TEMPORARY table created here.  The table is created on the database the export query runs against
+# (DOWNLOAD_DATABASE_URL), not Django's default database, so that database must accept writes.  Table names carry their
+# creation time (temp_download_ids_<epoch>_<uuid>) so that tables left behind by a worker killed before
+# download_id_tables exits can be found and dropped later.
+DOWNLOAD_ID_TABLE_PREFIX = "temp_download_ids_"
+
+_download_id_tables = threading.local()
+
+
+@contextmanager
+def download_database_cursor():
+    """Autocommitting cursor on the database that download export queries run against"""
+    # Imported here because download_generation imports this module
+    from usaspending_api.download.filestreaming import download_generation
+
+    db_connection = psycopg2.connect(dsn=download_generation.retrieve_db_string())
+    try:
+        db_connection.autocommit = True
+        with db_connection.cursor() as cursor:
+            yield cursor
+    finally:
+        db_connection.close()
+
+
+@contextmanager
+def download_id_tables():
+    """
+    Drops the id tables created by Elasticsearch download queries inside the block once it exits; wrap everything
+    from building the download sources through running their export queries
+    """
+    _download_id_tables.names = []
+    try:
+        yield
+    finally:
+        table_names, _download_id_tables.names = _download_id_tables.names, None
+        if table_names:
+            with download_database_cursor() as cursor:
+                for table_name in table_names:
+                    cursor.execute(f"DROP TABLE IF EXISTS {table_name}")
+
+
+def download_id_table_created_at(table_name: str) -> int:
+    """Epoch seconds from the name of a table made by load_download_id_table; 0 for a name without a timestamp"""
+    created_at, separator, _ = table_name[len(DOWNLOAD_ID_TABLE_PREFIX) :].partition("_")
+    return int(created_at) if separator and created_at.isdigit() else 0
+
+
+def drop_stale_download_id_tables(max_age_hours: int = None) -> List[str]:
+    """
+    Drops the id tables created more than max_age_hours (default DOWNLOAD_ID_TABLE_MAX_AGE_HOURS) ago, which were
+    left behind by downloads whose process was killed, and returns their names
+    """
+    max_age_hours = settings.DOWNLOAD_ID_TABLE_MAX_AGE_HOURS if max_age_hours is None else max_age_hours
+    cutoff = time.time() - max_age_hours * 60 * 60
+    with download_database_cursor() as cursor:
+        cursor.execute(
+            "SELECT tablename FROM pg_tables WHERE schemaname = current_schema() AND tablename LIKE %s",
+            [DOWNLOAD_ID_TABLE_PREFIX.replace("_", "\\_") + "%"],
+        )
+        stale_tables = [name for (name,) in cursor.fetchall() if download_id_table_created_at(name) < cutoff]
+        for table_name in stale_tables:
+            cursor.execute(f"DROP TABLE IF EXISTS {table_name}")
+    if stale_tables:
+        logger.info(f"Dropped {len(stale_tables)} download id tables older than {max_age_hours} hours")
+    return stale_tables
+
+
+def load_download_id_table(id_chunks: Iterator[List[int]]) -> str:
+    """
+    COPY each chunk of ids into a new table on the download database as it arrives from Elasticsearch and return the
+    table's name.  The table is dropped when the enclosing download_id_tables block exits.
+    """
+    table_name = f"{DOWNLOAD_ID_TABLE_PREFIX}{int(time.time())}_{uuid4().hex}"
+    if getattr(_download_id_tables, "names", None) is None:
+        logger.warning(f"{table_name} was created outside of download_id_tables() and will not be dropped")
+    else:
+        _download_id_tables.names.append(table_name)
+
+    id_count = 0
+    with download_database_cursor() as cursor:
+        cursor.execute(f"CREATE UNLOGGED TABLE {table_name} (id INTEGER NOT NULL)")
+        for chunk in id_chunks:
+            cursor.copy_from(io.StringIO("".join(f"{i}\n" for i in chunk)), table_name, columns=("id",))
+            id_count += len(chunk)
+        cursor.execute(f"ANALYZE {table_name}")
+    logger.info(f"Loaded {id_count} ids into {table_name}")
+    return table_name
+
 
 class _ElasticsearchDownload(metaclass=ABCMeta):
     _source_field = None
@@ -58,16 +152,42 @@ class _ElasticsearchDownload(metaclass=ABCMeta):
             yield results
 
     @classmethod
-    def _get_download_ids(cls, filters: dict, size: int = 10000) -> QuerySet:
+    def _get_download_ids_search_after_generator(cls, search: Union[AwardSearch, TransactionSearch], size: int):
         """
-        Takes a dictionary of the different download filters and returns a flattened list of ids.
+        Same as _get_download_ids_generator, but pages through the matching documents sorted on the (unique) id
+        field with search_after instead of splitting a terms aggregation into partitions, so there is no need to
+        count the results first and every page is a cheap sorted search.
+        """
+        max_retries = 10
+        search = search.sort(cls._source_field).extra(size=size, track_total_hits=False)
+        remaining = settings.MAX_DOWNLOAD_LIMIT
+        search_after = None
+        while remaining > 0:
+            page = search if search_after is None else search.extra(search_after=search_after)
+            response = page.handle_execute(retries=max_retries)
+            if response is None:
+                raise Exception("Breaking generator, unable to reach cluster")
+            hits = response.to_dict()["hits"]["hits"][:remaining]
+            if not hits:
+                return
+
+            yield [hit["_source"][cls._source_field] for hit in hits]
+            remaining -= len(hits)
+            search_after = hits[-1]["sort"]
+
+    @classmethod
+    def _get_download_ids(cls, filters: dict, size: int = 10000) -> str:
+        """
+        Takes a dictionary of the different download filters, streams the matching ids into a table and returns
+        the table's name.
         """
         filter_query = cls._filter_query_func(filters)
         search = cls._search_type().filter(filter_query).source([cls._source_field])
-        ids = cls._get_download_ids_generator(search, size)
-        flat_ids = list(itertools.chain.from_iterable(ids))
-        logger.info(f"Found {len(flat_ids)} {cls._source_field} based on filters")
-        return flat_ids
+        if settings.DOWNLOAD_ES_ID_PAGING == "search_after":
+            ids = cls._get_download_ids_search_after_generator(search, size)
+        else:
+            ids = cls._get_download_ids_generator(search, size)
+        return load_download_id_table(ids)
 
     @classmethod
     @abstractmethod
@@ -83,8 +203,8 @@ class AwardsElasticsearchDownload(_ElasticsearchDownload):
     @classmethod
     def query(cls, filters: dict) -> QuerySet:
         base_queryset = AwardSearchView.objects.all()
-        flat_ids = cls._get_download_ids(filters)
-        queryset = base_queryset.extra(where=[f'"awards"."id" = ANY(SELECT UNNEST(ARRAY{flat_ids}::INTEGER[]))'])
+        id_table = cls._get_download_ids(filters)
+        queryset = base_queryset.extra(where=[f'"awards"."id" IN (SELECT id FROM {id_table})'])
         return queryset
 
 
@@ -96,8 +216,6 @@ class TransactionsElasticsearchDownload(_ElasticsearchDownload):
     @classmethod
     def query(cls, filters: dict) -> QuerySet:
         base_queryset = UniversalTransactionView.objects.all()
-        flat_ids = cls._get_download_ids(filters)
-        queryset = base_queryset.extra(
-            where=[f'"transaction_normalized"."id" = ANY(SELECT UNNEST(ARRAY{flat_ids}::INTEGER[]))']
-        )
+        id_table = cls._get_download_ids(filters)
+        queryset = base_queryset.extra(where=[f'"transaction_normalized"."id" IN (SELECT id FROM {id_table})'])
         return queryset
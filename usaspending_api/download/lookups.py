@@ -8,6 +8,7 @@ used by the db setup scripts *and* the application code.
 """
 
 from collections import namedtuple, OrderedDict
+from django.conf import settings
 
 from usaspending_api.accounts.models import AppropriationAccountBalances
 from usaspending_api.accounts.v2.filters.account_download import account_download_filter
@@ -302,10 +303,26 @@ CFO_CGACS_MAPPING = OrderedDict(
 )
 CFO_CGACS = list(CFO_CGACS_MAPPING.keys())
 
+# compression_level is the zlib level used when the files are deflated into the download zip
 FILE_FORMATS = {
-    "csv": {"delimiter": ",", "extension": "csv", "options": "WITH CSV HEADER"},
-    "tsv": {"delimiter": "\t", "extension": "tsv", "options": r"WITH CSV DELIMITER E'\t' HEADER"},
-    "pstxt": {"delimiter": "|", "extension": "txt", "options": "WITH CSV DELIMITER '|' HEADER"},
+    "csv": {
+        "delimiter": ",",
+        "extension": "csv",
+        "options": "WITH CSV HEADER",
+        "compression_level": settings.DOWNLOAD_COMPRESSION_LEVELS["csv"],
+    },
+    "tsv": {
+        "delimiter": "\t",
+        "extension": "tsv",
+        "options": r"WITH CSV DELIMITER E'\t' HEADER",
+        "compression_level": settings.DOWNLOAD_COMPRESSION_LEVELS["tsv"],
+    },
+    "pstxt": {
+        "delimiter": "|",
+        "extension": "txt",
+        "options": "WITH CSV DELIMITER '|' HEADER",
+        "compression_level": settings.DOWNLOAD_COMPRESSION_LEVELS["pstxt"],
+    },
 }
 
 VALID_ACCOUNT_SUBMISSION_TYPES = ("account_balances", "object_class_program_activity", "award_financial")
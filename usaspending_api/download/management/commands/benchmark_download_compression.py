@@ -0,0 +1,113 @@
+"""
+Times how long the streaming download path (write_rows_to_zip_file) takes to compress a large generated delimited
+file at several zlib levels, serially and with a pool of deflate workers, and reports the compression ratio of each.
+Used to choose the compression_level of each FILE_FORMATS entry and DOWNLOAD_WORKER_BUDGET.
+"""
+
+import csv
+import logging
+import os
+import random
+import tempfile
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from time import perf_counter
+
+from usaspending_api.download.filestreaming.download_generation import EXCEL_ROW_LIMIT
+from usaspending_api.download.filestreaming.zip_file import write_rows_to_zip_file
+from usaspending_api.download.lookups import FILE_FORMATS
+
+
+logger = logging.getLogger("console")
+
+AGENCIES = (
+    "Department of Defense",
+    "Department of Energy",
+    "Department of Health and Human Services",
+    "National Aeronautics and Space Administration",
+    "Small Business Administration",
+)
+STATES = ("CA", "DC", "MD", "NY", "TX", "VA")
+
+
+def write_generated_rows(file_path, row_count, delimiter):
+    """Writes row_count rows shaped like a prime award transaction download to file_path"""
+    random.seed(0)
+    with open(file_path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f, delimiter=delimiter)
+        writer.writerow(
+            [
+                "award_id_piid",
+                "modification_number",
+                "federal_action_obligation",
+                "action_date",
+                "awarding_agency_name",
+                "recipient_name",
+                "recipient_state_code",
+                "award_description",
+            ]
+        )
+        for i in range(row_count):
+            agency = random.choice(AGENCIES)
+            writer.writerow(
+                [
+                    f"{random.choice(('W9', 'HHS', 'NN'))}{random.randint(10 ** 8, 10 ** 9):d}",
+                    random.choice(("0", "P00001", "A00002")),
+                    f"{random.uniform(-10 ** 5, 10 ** 7):.2f}",
+                    f"20{random.randint(10, 20)}-{random.randint(1, 12):02d}-{random.randint(1, 28):02d}",
+                    agency,
+                    f"RECIPIENT {random.randint(1, 50000)} INC",
+                    random.choice(STATES),
+                    f"{agency.upper()} AWARD {i} FOR {random.choice(('SERVICES', 'SUPPLIES', 'RESEARCH'))}",
+                ]
+            )
+
+
+class Command(BaseCommand):
+    help = "Benchmark compression level and worker count for streamed download zip files"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--file-format", choices=sorted(FILE_FORMATS), default="csv")
+        parser.add_argument(
+            "--rows", type=int, default=3 * EXCEL_ROW_LIMIT, help="Rows to generate; one member per EXCEL_ROW_LIMIT"
+        )
+        parser.add_argument("--levels", type=int, nargs="+", default=[1, 6, 9], help="zlib levels to compare")
+        parser.add_argument(
+            "--workers", type=int, nargs="+", default=[1, settings.DOWNLOAD_WORKER_BUDGET], help="Deflate workers"
+        )
+
+    def handle(self, *args, **options):
+        file_format = FILE_FORMATS[options["file_format"]]
+        delimiter = file_format["delimiter"]
+
+        with tempfile.TemporaryDirectory(prefix="benchmark_download_compression_") as directory:
+            source_path = os.path.join(directory, f"generated.{file_format['extension']}")
+            write_generated_rows(source_path, options["rows"], delimiter)
+            raw_size = os.path.getsize(source_path)
+            logger.info(
+                f"Generated {options['rows']:,} rows ({raw_size:,} bytes); "
+                f"configured level {file_format['compression_level']}, worker budget {settings.DOWNLOAD_WORKER_BUDGET}"
+            )
+
+            for compression_level in options["levels"]:
+                for workers in options["workers"]:
+                    zip_file_path = os.path.join(directory, f"benchmark_{compression_level}_{workers}.zip")
+                    start = perf_counter()
+                    with open(source_path, encoding="utf-8", newline="") as f:
+                        write_rows_to_zip_file(
+                            csv.reader(f, delimiter=delimiter),
+                            zip_file_path,
+                            f"benchmark_%s.{file_format['extension']}",
+                            EXCEL_ROW_LIMIT,
+                            delimiter,
+                            compression_level,
+                            workers=workers,
+                        )
+                    elapsed = perf_counter() - start
+                    zip_size = os.path.getsize(zip_file_path)
+                    logger.info(
+                        f"level {compression_level}, {workers} worker(s): {elapsed:.2f}s, {zip_size:,} bytes, "
+                        f"ratio {raw_size / zip_size:.2f}"
+                    )
+                    os.remove(zip_file_path)
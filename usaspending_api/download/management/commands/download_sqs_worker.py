@@ -15,6 +15,7 @@ from usaspending_api.common.sqs.sqs_work_dispatcher import (
     QueueWorkDispatcherError,
 )
 from usaspending_api.download.filestreaming.download_generation import generate_download
+from usaspending_api.download.helpers.elasticsearch_download_functions import drop_stale_download_id_tables
 from usaspending_api.common.sqs.sqs_job_logging import log_job_message
 from usaspending_api.download.helpers.monthly_helpers import download_job_to_log_dict
 from usaspending_api.download.lookups import JOB_STATUS_DICT
@@ -32,6 +33,9 @@ class Command(BaseCommand):
         else:
             tracer.writer._filters = [DatadogEagerlyDropTraceFilter()]
 
+        # Downloads normally drop their id tables as they finish, but not when their worker was killed
+        drop_stale_download_id_tables()
+
         queue = get_sqs_queue()
         log_job_message(logger=logger, message="Starting SQS polling", job_type=JOB_TYPE)
 
@@ -0,0 +1,22 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('download', '0003_auto_20180306_1726'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='downloadjob',
+            name='request_fingerprint',
+            field=models.TextField(blank=True, db_index=True, null=True),
+        ),
+        # Only jobs from the last day can still be fresh enough to reuse, so older jobs are not backfilled
+        migrations.RunSQL(
+            sql="UPDATE download_job SET request_fingerprint = md5(json_request) "
+            "WHERE json_request IS NOT NULL AND create_date >= now() - interval '1 day'",
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
@@ -0,0 +1,74 @@
+import json
+import pytest
+
+from datetime import datetime, timedelta, timezone
+from model_mommy import mommy
+from rest_framework import status
+
+from usaspending_api.broker.helpers.last_load_date import update_last_load_date
+from usaspending_api.download.download_utils import get_data_freshness_cutoff, get_request_fingerprint
+from usaspending_api.download.lookups import JOB_STATUS, JOB_STATUS_DICT
+from usaspending_api.download.models import DownloadJob
+from usaspending_api.download.v2.base_download_viewset import BaseDownloadViewSet
+
+REQUEST = {"filters": {"award_type_codes": ["A"]}, "columns": []}
+
+
+@pytest.fixture
+def queued_jobs(db, monkeypatch, settings):
+    for js in JOB_STATUS:
+        mommy.make("download.JobStatus", job_status_id=js.id, name=js.name, description=js.desc)
+    mommy.make("broker.ExternalDataType", external_data_type_id=1, name="fpds")
+    settings.IS_LOCAL = False
+    settings.DOWNLOAD_ENV = "test"
+    monkeypatch.setattr("usaspending_api.download.v2.base_download_viewset.get_file_path", lambda file_name: file_name)
+
+    queued = []
+    monkeypatch.setattr(BaseDownloadViewSet, "process_request", lambda self, download_job: queued.append(download_job))
+    return queued
+
+
+def _post(client, request=REQUEST):
+    resp = client.post("/api/v2/download/awards/", content_type="application/json", data=json.dumps(request))
+    assert resp.status_code == status.HTTP_200_OK
+    return resp.json()["file_name"]
+
+
+def test_fingerprint_is_stored_and_indexed_lookup_reuses_job(client, queued_jobs):
+    file_name = _post(client)
+    assert _post(client) == file_name
+    assert len(queued_jobs) == 1
+
+    job = DownloadJob.objects.get(file_name=file_name)
+    assert job.request_fingerprint == get_request_fingerprint(job.json_request)
+
+    assert _post(client, {**REQUEST, "filters": {"award_type_codes": ["B"]}}) != file_name
+    assert len(queued_jobs) == 2
+
+
+def test_failed_job_is_not_reused(client, queued_jobs):
+    file_name = _post(client)
+    DownloadJob.objects.filter(file_name=file_name).update(job_status_id=JOB_STATUS_DICT["failed"])
+    assert _post(client) != file_name
+    assert len(queued_jobs) == 2
+
+
+def test_job_created_before_latest_load_is_not_reused(client, queued_jobs):
+    file_name = _post(client)
+    update_last_load_date("fpds", datetime.now(timezone.utc) + timedelta(seconds=1))
+    assert _post(client) != file_name
+    assert len(queued_jobs) == 2
+
+
+@pytest.mark.django_db
+def test_data_freshness_cutoff():
+    start_of_today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    assert get_data_freshness_cutoff() == start_of_today
+
+    mommy.make("broker.ExternalDataType", external_data_type_id=1, name="fpds")
+    mommy.make("broker.ExternalDataType", external_data_type_id=2, name="fabs")
+    update_last_load_date("fpds", start_of_today - timedelta(hours=1))
+    assert get_data_freshness_cutoff() == start_of_today
+
+    update_last_load_date("fabs", start_of_today + timedelta(hours=1))
+    assert get_data_freshness_cutoff() == start_of_today + timedelta(hours=1)
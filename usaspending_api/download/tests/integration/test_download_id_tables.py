@@ -0,0 +1,76 @@
+import pytest
+import time
+
+from django.conf import settings
+from django.db import connections, DEFAULT_DB_ALIAS
+
+from usaspending_api.common.helpers.sql_helpers import build_dsn_string
+from usaspending_api.download.filestreaming import download_generation
+from usaspending_api.download.helpers.elasticsearch_download_functions import (
+    download_database_cursor,
+    download_id_tables,
+    drop_stale_download_id_tables,
+    load_download_id_table,
+)
+
+
+def _download_id_table_names():
+    with connections[DEFAULT_DB_ALIAS].cursor() as cursor:
+        cursor.execute("SELECT tablename FROM pg_tables WHERE tablename LIKE 'temp\\_download\\_ids\\_%' ORDER BY 1")
+        return [name for (name,) in cursor.fetchall()]
+
+
+@pytest.fixture
+def download_database(monkeypatch):
+    """Point the download export queries at the test database of the given alias"""
+
+    def _download_database(alias):
+        dsn = build_dsn_string(connections[alias].settings_dict)
+        monkeypatch.setattr(download_generation, "retrieve_db_string", lambda: dsn)
+
+    return _download_database
+
+
+@pytest.mark.django_db(transaction=True)
+def test_download_id_tables_dropped_on_exit(download_database):
+    download_database(DEFAULT_DB_ALIAS)
+    with download_id_tables():
+        table_name = load_download_id_table(iter([[1, 2], [3]]))
+        with connections[DEFAULT_DB_ALIAS].cursor() as cursor:
+            cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
+            assert cursor.fetchone()[0] == 3
+    assert _download_id_table_names() == []
+
+
+@pytest.mark.django_db(transaction=True)
+def test_drop_stale_download_id_tables(download_database):
+    download_database(DEFAULT_DB_ALIAS)
+    stale = f"temp_download_ids_{int(time.time()) - 3 * 60 * 60}_{'a' * 32}"
+    legacy = f"temp_download_ids_{'b' * 32}"
+    with connections[DEFAULT_DB_ALIAS].cursor() as cursor:
+        for table_name in (stale, legacy):
+            cursor.execute(f"CREATE UNLOGGED TABLE {table_name} (id INTEGER NOT NULL)")
+    with download_id_tables():
+        fresh = load_download_id_table(iter([[1]]))
+
+        assert sorted(drop_stale_download_id_tables(max_age_hours=2)) == sorted([stale, legacy])
+        assert _download_id_table_names() == [fresh]
+
+
+@pytest.mark.skipif("data_broker" not in settings.DATABASES, reason="needs a second database")
+@pytest.mark.django_db(transaction=True)
+def test_download_id_tables_on_separate_download_database(download_database):
+    """The ids are staged where the export query runs, which need not be Django's default database"""
+    download_database("data_broker")
+    with download_id_tables():
+        table_name = load_download_id_table(iter([[1, 2], [3]]))
+
+        assert _download_id_table_names() == []
+        with download_database_cursor() as cursor:
+            cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
+            assert cursor.fetchone()[0] == 3
+
+        assert drop_stale_download_id_tables(max_age_hours=0) == [table_name]
+        with download_database_cursor() as cursor:
+            cursor.execute("SELECT to_regclass(%s)", [table_name])
+            assert cursor.fetchone()[0] is None
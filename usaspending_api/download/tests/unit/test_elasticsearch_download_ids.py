@@ -0,0 +1,56 @@
+from types import SimpleNamespace
+
+from usaspending_api.download.helpers.elasticsearch_download_functions import (
+    AwardsElasticsearchDownload,
+    download_id_table_created_at,
+)
+
+
+class LocalSearch:
+    """Stand-in for an AwardSearch that pages through sorted ids the way Elasticsearch applies search_after"""
+
+    def __init__(self, ids, executed, options=None):
+        self.ids = sorted(ids)
+        self.executed = executed
+        self.options = options or {}
+
+    def sort(self, field):
+        return LocalSearch(self.ids, self.executed, {**self.options, "sort": field})
+
+    def extra(self, **kwargs):
+        return LocalSearch(self.ids, self.executed, {**self.options, **kwargs})
+
+    def handle_execute(self, retries):
+        self.executed.append(self.options)
+        after = self.options.get("search_after", [None])[0]
+        ids = [i for i in self.ids if after is None or i > after][: self.options["size"]]
+        hits = [{"_source": {"award_id": i}, "sort": [i]} for i in ids]
+        return SimpleNamespace(to_dict=lambda: {"hits": {"hits": hits}})
+
+
+def test_search_after_generator_pages_all_ids(settings):
+    settings.MAX_DOWNLOAD_LIMIT = 500000
+    executed = []
+    search = LocalSearch(range(25), executed)
+
+    chunks = list(AwardsElasticsearchDownload._get_download_ids_search_after_generator(search, 10))
+
+    assert chunks == [list(range(10)), list(range(10, 20)), list(range(20, 25))]
+    assert [e.get("search_after") for e in executed] == [None, [9], [19], [24]]
+    assert all(e["sort"] == "award_id" and e["track_total_hits"] is False for e in executed)
+
+
+def test_search_after_generator_stops_at_download_limit(settings):
+    settings.MAX_DOWNLOAD_LIMIT = 15
+    search = LocalSearch(range(25), [])
+
+    chunks = list(AwardsElasticsearchDownload._get_download_ids_search_after_generator(search, 10))
+
+    assert chunks == [list(range(10)), list(range(10, 15))]
+
+
+def test_download_id_table_created_at():
+    assert download_id_table_created_at("temp_download_ids_1600000000_0123456789abcdef0123456789abcdef") == 1600000000
+    # tables named before their creation time was recorded are treated as the oldest
+    assert download_id_table_created_at("temp_download_ids_0123456789abcdef0123456789abcdef") == 0
+    assert download_id_table_created_at("temp_download_ids_12345678901234567890123456789012") == 0
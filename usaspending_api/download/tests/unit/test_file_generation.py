@@ -127,3 +127,26 @@ def test_idv_treasury_account_funding_csv_sources():
     VALUE_MAPPINGS["idv_federal_account_funding"]["filter_function"] = original
     assert csv_sources[0].file_type == "treasury_account"
     assert csv_sources[0].source_type == "idv_federal_account_funding"
+
+
+def test_get_source_worker_count(settings, monkeypatch):
+    monkeypatch.setattr(download_generation.os, "cpu_count", lambda: 8)
+    settings.DOWNLOAD_SOURCE_WORKERS = 3
+    assert download_generation.get_source_worker_count(0) == 1
+    assert download_generation.get_source_worker_count(2) == 2
+    assert download_generation.get_source_worker_count(5) == 3
+
+    monkeypatch.setattr(download_generation.os, "cpu_count", lambda: 2)
+    assert download_generation.get_source_worker_count(5) == 2
+
+
+def test_get_zip_worker_count(settings, monkeypatch):
+    monkeypatch.setattr(download_generation.os, "cpu_count", lambda: 8)
+    settings.DOWNLOAD_WORKER_BUDGET = 6
+    assert download_generation.get_zip_worker_count(1) == 6
+    assert download_generation.get_zip_worker_count(2) == 3
+    assert download_generation.get_zip_worker_count(4) == 1
+    assert download_generation.get_zip_worker_count(8) == 1
+
+    monkeypatch.setattr(download_generation.os, "cpu_count", lambda: 2)
+    assert download_generation.get_zip_worker_count(1) == 2
@@ -0,0 +1,44 @@
+import multiprocessing
+import pytest
+import subprocess
+import zipfile
+
+from unittest.mock import patch
+from tempfile import NamedTemporaryFile
+
+from usaspending_api.download.filestreaming import download_generation
+
+
+def _fake_psql(command):
+    """Replaces the psql invocation with a shell command while keeping the pipes set up by the caller"""
+    popen = subprocess.Popen
+
+    def _popen(args, **kwargs):
+        return popen(["sh", "-c", command] if args[0] == "psql" else args, **kwargs)
+
+    return patch.object(download_generation.subprocess, "Popen", side_effect=_popen)
+
+
+def test_stream_psql_to_zip_file():
+    row_count = multiprocessing.Value("q", 0)
+    with NamedTemporaryFile() as sql_file, NamedTemporaryFile() as zip_file:
+        with _fake_psql("printf 'a,b\\n1,\"x\\ny\"\\n2,z\\n3,w\\n'"), patch.object(
+            download_generation, "EXCEL_ROW_LIMIT", 2
+        ):
+            download_generation.stream_psql_to_zip_file(sql_file.name, zip_file.name, "data", "csv", row_count, None)
+
+        assert row_count.value == 3
+        with zipfile.ZipFile(zip_file.name, "r") as zf:
+            assert zf.namelist() == ["data_1.csv", "data_2.csv"]
+            assert zf.read("data_1.csv").decode() == 'a,b\r\n1,"x\ny"\r\n2,z\r\n'
+            assert zf.read("data_2.csv").decode() == "a,b\r\n3,w\r\n"
+
+
+def test_stream_psql_to_zip_file_psql_error():
+    row_count = multiprocessing.Value("q", 0)
+    with NamedTemporaryFile() as sql_file, NamedTemporaryFile() as zip_file:
+        with _fake_psql("echo 'ERROR: bad query' >&2; exit 3"), pytest.raises(subprocess.CalledProcessError) as e:
+            download_generation.stream_psql_to_zip_file(sql_file.name, zip_file.name, "data", "csv", row_count, None)
+
+    assert e.value.returncode == 3
+    assert e.value.output == b"ERROR: bad query\n"
@@ -1,8 +1,9 @@
+import multiprocessing
 import os
 import zipfile
 
-from tempfile import NamedTemporaryFile
-from usaspending_api.download.filestreaming.zip_file import append_files_to_zip_file
+from tempfile import NamedTemporaryFile, TemporaryDirectory
+from usaspending_api.download.filestreaming.zip_file import append_files_to_zip_file, write_rows_to_zip_file
 
 
 def test_append_files_to_zip_file():
@@ -20,3 +21,82 @@ def test_append_files_to_zip_file():
                         os.path.basename(include_file_1.name),
                         os.path.basename(include_file_2.name),
                     ]
+
+
+def test_write_rows_to_zip_file():
+    rows = [["id", "name"]] + [[str(i), f"name, {i}"] for i in range(5)]
+    with NamedTemporaryFile() as zip_file:
+        row_count = write_rows_to_zip_file(rows, zip_file.name, "data_%s.csv", row_limit=2)
+
+        assert row_count == 5
+        with zipfile.ZipFile(zip_file.name, "r") as zf:
+            assert [z.filename for z in zf.filelist] == ["data_1.csv", "data_2.csv", "data_3.csv"]
+            assert zf.read("data_1.csv").decode() == 'id,name\r\n0,"name, 0"\r\n1,"name, 1"\r\n'
+            assert zf.read("data_3.csv").decode() == 'id,name\r\n4,"name, 4"\r\n'
+
+
+def test_write_rows_to_zip_file_in_parallel():
+    rows = [["id", "name"]] + [[str(i), f"name, {i}"] for i in range(6)]
+    with TemporaryDirectory() as directory:
+        serial_zip_file_path = os.path.join(directory, "serial.zip")
+        parallel_zip_file_path = os.path.join(directory, "parallel.zip")
+        assert write_rows_to_zip_file(rows, serial_zip_file_path, "data_%s.csv", row_limit=2) == 6
+        assert write_rows_to_zip_file(rows, parallel_zip_file_path, "data_%s.csv", row_limit=2, workers=2) == 6
+
+        with zipfile.ZipFile(serial_zip_file_path, "r") as serial, zipfile.ZipFile(parallel_zip_file_path, "r") as zf:
+            assert zf.testzip() is None
+            # no empty member is started when the rows end exactly on a member boundary
+            assert sorted(zf.namelist()) == serial.namelist() == ["data_1.csv", "data_2.csv", "data_3.csv"]
+            for name in zf.namelist():
+                assert zf.read(name) == serial.read(name)
+        assert sorted(os.listdir(directory)) == ["parallel.zip", "serial.zip"]
+
+
+def test_write_rows_to_zip_file_header_only():
+    with NamedTemporaryFile() as zip_file:
+        assert write_rows_to_zip_file([["id", "name"]], zip_file.name, "data_%s.txt", 2, delimiter="|") == 0
+
+        with zipfile.ZipFile(zip_file.name, "r") as zf:
+            assert zf.read("data_1.txt").decode() == "id|name\r\n"
+
+    with NamedTemporaryFile() as zip_file:
+        assert write_rows_to_zip_file([["id", "name"]], zip_file.name, "data_%s.txt", 2, "|", workers=2) == 0
+
+        with zipfile.ZipFile(zip_file.name, "r") as zf:
+            assert zf.namelist() == ["data_1.txt"]
+            assert zf.read("data_1.txt").decode() == "id|name\r\n"
+
+
+def test_write_rows_to_zip_file_from_several_processes():
+    """Processes sharing a lock take turns adding their members to the same zip file"""
+    lock = multiprocessing.Lock()
+    with TemporaryDirectory() as directory:
+        zip_file_path = os.path.join(directory, "download.zip")
+        append_files_to_zip_file([], zip_file_path)
+        processes = [
+            multiprocessing.Process(
+                target=write_rows_to_zip_file,
+                args=([["id"]] + [[f"{name}{i}"] for i in range(5)], zip_file_path, f"{name}_%s.csv", 2),
+                kwargs={"workers": 2, "lock": lock},
+            )
+            for name in ("contracts", "assistance")
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+            assert process.exitcode == 0
+
+        with zipfile.ZipFile(zip_file_path, "r") as zf:
+            assert zf.testzip() is None
+            assert sorted(zf.namelist()) == [
+                "assistance_1.csv",
+                "assistance_2.csv",
+                "assistance_3.csv",
+                "contracts_1.csv",
+                "contracts_2.csv",
+                "contracts_3.csv",
+            ]
+            assert zf.read("contracts_2.csv") == b"id\r\ncontracts2\r\ncontracts3\r\n"
+            assert zf.read("assistance_3.csv") == b"id\r\nassistance4\r\n"
+        assert os.listdir(directory) == ["download.zip"]
@@ -1,9 +1,9 @@
 import json
 
-from datetime import datetime, timezone
 from typing import Optional
 
 from django.conf import settings
+from django.db import transaction
 from rest_framework.exceptions import NotFound
 from rest_framework.request import Request
 from rest_framework.response import Response
@@ -12,7 +12,13 @@ from rest_framework.views import APIView
 from usaspending_api.common.api_versioning import api_transformations, API_TRANSFORM_FUNCTIONS
 from usaspending_api.common.helpers.dict_helpers import order_nested_object
 from usaspending_api.common.sqs.sqs_handler import get_sqs_queue
-from usaspending_api.download.download_utils import create_unique_filename, log_new_download_job
+from usaspending_api.download.download_utils import (
+    create_unique_filename,
+    get_data_freshness_cutoff,
+    get_request_fingerprint,
+    lock_request_fingerprint,
+    log_new_download_job,
+)
 from usaspending_api.download.filestreaming import download_generation
 from usaspending_api.download.filestreaming.s3_handler import S3Handler
 from usaspending_api.download.helpers import write_to_download_log as write_to_log
@@ -43,27 +49,39 @@ class BaseDownloadViewSet(APIView):
 
         json_request["request_type"] = request_type
         ordered_json_request = json.dumps(order_nested_object(json_request))
+        request_fingerprint = get_request_fingerprint(ordered_json_request)
+
+        with transaction.atomic():
+            # Identical concurrent requests queue up here so that only the first one creates (and queues) a job;
+            # the others find it below, whether it has finished or not
+            lock_request_fingerprint(request_fingerprint)
+
+            # Check if the same request has been called since the data was last loaded
+            cached_download = (
+                DownloadJob.objects.filter(
+                    request_fingerprint=request_fingerprint, create_date__gte=get_data_freshness_cutoff()
+                )
+                .exclude(job_status_id=JOB_STATUS_DICT["failed"])
+                .order_by("-create_date")
+                .values("download_job_id", "file_name")
+                .first()
+            )
 
-        # Check if the same request has been called today
-        # TODO!!! Use external_data_load_date to determine data freshness
-        updated_date_timestamp = datetime.strftime(datetime.now(timezone.utc), "%Y-%m-%d")
-        cached_download = (
-            DownloadJob.objects.filter(json_request=ordered_json_request, update_date__gte=updated_date_timestamp)
-            .exclude(job_status_id=JOB_STATUS_DICT["failed"])
-            .values("download_job_id", "file_name")
-            .first()
-        )
-
-        if cached_download and not settings.IS_LOCAL:
-            # By returning the cached files, there should be no duplicates on a daily basis
-            write_to_log(message=f"Generating file from cached download job ID: {cached_download['download_job_id']}")
-            cached_filename = cached_download["file_name"]
-            return self.get_download_response(file_name=cached_filename)
-
-        final_output_zip_name = create_unique_filename(json_request, origination=origination)
-        download_job = DownloadJob.objects.create(
-            job_status_id=JOB_STATUS_DICT["ready"], file_name=final_output_zip_name, json_request=ordered_json_request
-        )
+            if cached_download and not settings.IS_LOCAL:
+                # By returning the cached files, there should be no duplicates between loads
+                write_to_log(
+                    message=f"Generating file from cached download job ID: {cached_download['download_job_id']}"
+                )
+                cached_filename = cached_download["file_name"]
+                return self.get_download_response(file_name=cached_filename)
+
+            final_output_zip_name = create_unique_filename(json_request, origination=origination)
+            download_job = DownloadJob.objects.create(
+                job_status_id=JOB_STATUS_DICT["ready"],
+                file_name=final_output_zip_name,
+                json_request=ordered_json_request,
+                request_fingerprint=request_fingerprint,
+            )
 
         log_new_download_job(request, download_job)
         self.process_request(download_job)
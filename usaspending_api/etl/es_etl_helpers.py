@@ -9,13 +9,17 @@ import subprocess
 from collections import defaultdict
 from datetime import datetime
 from django.conf import settings
-from django.core.management import call_command
+from django.db.models import Case, Max, TextField, Value, When
+from django.db.models.functions import Concat, Upper
 from elasticsearch import helpers, TransportError
-from time import perf_counter, sleep
+from time import perf_counter
 
 from usaspending_api.awards.v2.lookups.elasticsearch_lookups import INDEX_ALIASES_TO_AWARD_TYPES
+from usaspending_api.broker.helpers.deleted_record_journal import journal_deletion_files
+from usaspending_api.broker.models import DeletedRecord, DeletedRecordFile
 from usaspending_api.common.csv_helpers import count_rows_in_delimited_file
-from usaspending_api.common.helpers.s3_helpers import retrieve_s3_bucket_object_list, access_s3_object
+from usaspending_api.common.elasticsearch.client import instantiate_elasticsearch_client
+from usaspending_api.common.helpers.s3_helpers import retrieve_s3_bucket_object_list
 from usaspending_api.common.helpers.sql_helpers import get_database_dsn_string
 
 # ==============================================================================
@@ -63,6 +67,8 @@ VIEW_COLUMNS = [
     "face_value_loan_guarantee",
     "original_loan_subsidy_cost",
     "generated_pragmatic_obligation",
+    "face_value_loan_guarantee_cents",
+    "generated_pragmatic_obligation_cents",
     "awarding_agency_id",
     "funding_agency_id",
     "awarding_toptier_agency_name",
@@ -197,6 +203,12 @@ COPY_SQL = """"COPY (
 ) TO STDOUT DELIMITER ',' CSV HEADER" > '{filename}'
 """
 
+STREAM_SQL = """
+SELECT {columns}
+FROM {view}
+WHERE {type_fy}fiscal_year={fy}{update_date}
+"""
+
 CHECK_IDS_SQL = """
 WITH temp_{view_type}_ids AS (
   SELECT *
@@ -229,6 +241,14 @@ AWARD_DESC_CATEGORIES = {
 UNIVERSAL_TRANSACTION_ID_NAME = "generated_unique_transaction_id"
 UNIVERSAL_AWARD_ID_NAME = "generated_unique_award_id"
 
+# Prefix added to the ids read from each kind of deletion file to build the generated_unique_transaction_id
+DELETED_ID_PREFIXES = {"detached_award_proc_unique": "CONT_TX_", "afa_generated_unique": "ASST_TX_"}
+
+ES_DELETE_SLICE_SIZE = 1000  # ids looked up per search and delete actions sent per _bulk request
+
+# Documents read at a time when bulk requests are sent from several threads (see post_to_elasticsearch)
+PARALLEL_INDEX_CHUNK_SIZE = 10000
+
 
 class DataJob:
     def __init__(self, *args):
@@ -270,6 +290,15 @@ def convert_postgres_json_array_as_string_to_list(json_array_as_string: str) ->
     return result
 
 
+# Need a specific converter to handle converting strings to correct data types (e.g. string -> array)
+ARRAY_CONVERTERS = {
+    "business_categories": convert_postgres_array_as_string_to_list,
+    "tas_paths": convert_postgres_array_as_string_to_list,
+    "tas_components": convert_postgres_array_as_string_to_list,
+    "federal_accounts": convert_postgres_json_array_as_string_to_list,
+}
+
+
 def process_guarddog(process_list):
     """
         pass in a list of multiprocess Process objects.
@@ -287,19 +316,32 @@ def process_guarddog(process_list):
     return False
 
 
+def get_etl_view_details(load_type):
+    """Returns the ETL view name, the type of record it holds and the prefix of its fiscal_year column"""
+    if load_type == "awards":
+        return settings.ES_AWARDS_ETL_VIEW_NAME, "award", ""
+    return settings.ES_TRANSACTIONS_ETL_VIEW_NAME, "transaction", "transaction_"
+
+
+def configure_stream_sql(config, columns):
+    """
+    Creates the SELECT used to stream a fiscal year of the ETL view. Every column is cast to text so Postgres renders
+    values exactly as it does in a COPY to CSV and the resulting documents match the CSV round trip.
+    """
+    update_date_str = UPDATE_DATE_SQL.format(config["starting_date"].strftime("%Y-%m-%d"))
+    view_name, _, type_fy = get_etl_view_details(config["load_type"])
+    columns_sql = ", ".join('"{col}"::TEXT AS "{col}"'.format(col=col) for col in columns)
+    return STREAM_SQL.format(
+        columns=columns_sql, view=view_name, type_fy=type_fy, fy=config["fiscal_year"], update_date=update_date_str
+    )
+
+
 def configure_sql_strings(config, filename, deleted_ids):
     """
     Populates the formatted strings defined globally in this file to create the desired SQL
     """
     update_date_str = UPDATE_DATE_SQL.format(config["starting_date"].strftime("%Y-%m-%d"))
-    if config["load_type"] == "awards":
-        view_name = settings.ES_AWARDS_ETL_VIEW_NAME
-        view_type = "award"
-        type_fy = ""
-    else:
-        view_name = settings.ES_TRANSACTIONS_ETL_VIEW_NAME
-        view_type = "transaction"
-        type_fy = "transaction_"
+    view_name, view_type, type_fy = get_etl_view_details(config["load_type"])
 
     copy_sql = COPY_SQL.format(
         fy=config["fiscal_year"], update_date=update_date_str, filename=filename, view=view_name, type_fy=type_fy
@@ -337,43 +379,39 @@ def db_rows_to_dict(cursor):
 
 
 def download_db_records(fetch_jobs, done_jobs, config):
-    # There has been a recurring issue with .empty() returning true when the queue actually
-    # contains multiple jobs. Wait a few seconds before starting to see if it helps
-    sleep(5)
-    printf({"msg": "Queue has items: {}".format(not fetch_jobs.empty()), "f": "Download"})
-    while not fetch_jobs.empty():
-        if done_jobs.full():
-            printf({"msg": "Paused downloading new CSVs so ES indexing can catch up", "f": "Download"})
-            sleep(60)
-        else:
-            start = perf_counter()
-            job = fetch_jobs.get_nowait()
-            printf({"msg": 'Preparing to download "{}"'.format(job.csv), "job": job.name, "f": "Download"})
-
-            sql_config = {
-                "starting_date": config["starting_date"],
-                "fiscal_year": job.fy,
-                "process_deletes": config["process_deletes"],
-                "load_type": config["load_type"],
-            }
-            copy_sql, _, count_sql = configure_sql_strings(sql_config, job.csv, [])
+    """
+    Copies one fiscal year CSV per job from fetch_jobs until the "Null Job" is read.  Several of these can share the
+    same queues; done_jobs is bounded so a full queue blocks the download until ES indexing catches up.
+    """
+    while True:
+        job = fetch_jobs.get()
+        if job.name is None:
+            break
+
+        start = perf_counter()
+        printf({"msg": 'Preparing to download "{}"'.format(job.csv), "job": job.name, "f": "Download"})
+
+        sql_config = {
+            "starting_date": config["starting_date"],
+            "fiscal_year": job.fy,
+            "process_deletes": config["process_deletes"],
+            "load_type": config["load_type"],
+        }
+        copy_sql, _, count_sql = configure_sql_strings(sql_config, job.csv, [])
 
-            if os.path.isfile(job.csv):
-                os.remove(job.csv)
+        if os.path.isfile(job.csv):
+            os.remove(job.csv)
 
-            job.count = download_csv(count_sql, copy_sql, job.csv, job.name, config["skip_counts"], config["verbose"])
-            done_jobs.put(job)
-            printf(
-                {
-                    "msg": 'CSV "{}" copy took {} seconds'.format(job.csv, perf_counter() - start),
-                    "job": job.name,
-                    "f": "Download",
-                }
-            )
-            sleep(1)
+        job.count = download_csv(count_sql, copy_sql, job.csv, job.name, config["skip_counts"], config["verbose"])
+        done_jobs.put(job)
+        printf(
+            {
+                "msg": 'CSV "{}" copy took {} seconds'.format(job.csv, perf_counter() - start),
+                "job": job.name,
+                "f": "Download",
+            }
+        )
 
-    # This "Null Job" is used to notify the other (ES data load) process this is the final job
-    done_jobs.put(DataJob(None, None, None, None))
     printf({"msg": "PostgreSQL COPY operations complete", "f": "Download"})
     return
 
@@ -399,16 +437,9 @@ def download_csv(count_sql, copy_sql, filename, job_id, skip_counts, verbose):
 
 def csv_chunk_gen(filename, chunksize, job_id, load_type):
     printf({"msg": "Opening {} (batch size = {})".format(filename, chunksize), "job": job_id, "f": "ES Ingest"})
-    # Need a specific converter to handle converting strings to correct data types (e.g. string -> array)
-    converters = {
-        "business_categories": convert_postgres_array_as_string_to_list,
-        "tas_paths": convert_postgres_array_as_string_to_list,
-        "tas_components": convert_postgres_array_as_string_to_list,
-        "federal_accounts": convert_postgres_json_array_as_string_to_list,
-    }
     # Panda's data type guessing causes issues for Elasticsearch. Explicitly cast using dictionary
-    dtype = {k: str for k in VIEW_COLUMNS if k not in converters}
-    for file_df in pd.read_csv(filename, dtype=dtype, converters=converters, header=0, chunksize=chunksize):
+    dtype = {k: str for k in VIEW_COLUMNS if k not in ARRAY_CONVERTERS}
+    for file_df in pd.read_csv(filename, dtype=dtype, converters=ARRAY_CONVERTERS, header=0, chunksize=chunksize):
         file_df = file_df.where(cond=(pd.notnull(file_df)), other=None)
         if load_type == "transactions":
             # Route all transaction documents with the same recipient to the same shard
@@ -420,23 +451,73 @@ def csv_chunk_gen(filename, chunksize, job_id, load_type):
         yield file_df.to_dict(orient="records")
 
 
-def es_data_loader(client, fetch_jobs, done_jobs, config):
-    if config["create_new_index"]:
-        # ensure template for index is present and the latest version
-        call_command("es_configure", "--template-only", "--load_type={}".format(config["load_type"]))
+def convert_db_row_to_document(row, load_type):
+    """
+    Mirrors the CSV path: empty values become None, Postgres arrays become lists and transaction documents get the
+    recipient routing key
+    """
+    document = {}
+    for column, value in row.items():
+        if column in ARRAY_CONVERTERS:
+            value = ARRAY_CONVERTERS[column](value or "")
+        elif value == "":
+            value = None
+        document[column] = value
+    if load_type == "transactions":
+        # See csv_chunk_gen: transactions are routed to shards by recipient
+        document["routing"] = document["recipient_agg_key"]
+    return document
+
+
+def stream_db_records(job, config, chunksize):
+    """
+    Yields lists of up to chunksize Elasticsearch-ready documents for the job's fiscal year, read straight from the
+    ETL view through a server-side cursor. Only one chunk is held in memory at a time and nothing touches disk.
+    """
+    view_name, _, _ = get_etl_view_details(config["load_type"])
+    sql_config = {
+        "starting_date": config["starting_date"],
+        "fiscal_year": job.fy,
+        "load_type": config["load_type"],
+    }
+    printf(
+        {
+            "msg": "Streaming rows from {} (batch size = {})".format(view_name, chunksize),
+            "job": job.name,
+            "f": "ES Ingest",
+        }
+    )
+
+    with psycopg2.connect(dsn=get_database_dsn_string()) as connection:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT * FROM {} LIMIT 0".format(view_name))
+            columns = [col[0] for col in cursor.description]
+
+        with connection.cursor(name="es_stream_{}".format(job.name)) as cursor:
+            cursor.itersize = min(chunksize, 10000)
+            cursor.execute(configure_stream_sql(sql_config, columns))
+            while True:
+                rows = cursor.fetchmany(chunksize)
+                if not rows:
+                    break
+                yield [convert_db_row_to_document(dict(zip(columns, row)), config["load_type"]) for row in rows]
+
+
+def es_data_loader(done_jobs, config):
+    """
+    Indexes jobs from done_jobs until the "Null Job" is read.  Each ingest process builds its own client since the
+    connection pool of a client created in the parent would be shared with every other forked process.
+    """
+    client = instantiate_elasticsearch_client()
     while True:
-        if not done_jobs.empty():
-            job = done_jobs.get_nowait()
-            if job.name is None:
-                break
-
-            printf({"msg": "Starting new job", "job": job.name, "f": "ES Ingest"})
-            post_to_elasticsearch(client, job, config)
-            if os.path.exists(job.csv):
-                os.remove(job.csv)
-        else:
-            printf({"msg": "No Job. Sleeping 45s", "f": "ES Ingest"})
-            sleep(45)
+        job = done_jobs.get()
+        if job.name is None:
+            break
+
+        printf({"msg": "Starting new job", "job": job.name, "f": "ES Ingest"})
+        post_to_elasticsearch(client, job, config)
+        if os.path.exists(job.csv):
+            os.remove(job.csv)
 
     printf({"msg": "Completed Elasticsearch data load", "f": "ES Ingest"})
     return
@@ -457,6 +538,28 @@ def streaming_post_to_es(client, chunk, index_name: str, type: str, job_id=None)
     return success, failed
 
 
+def parallel_post_to_es(client, chunk, index_name: str, thread_count: int, job_id=None):
+    """
+    Like streaming_post_to_es, but bulk requests are sent from thread_count threads. parallel_bulk only queues a
+    handful of pending bulk requests at a time so a slow cluster pushes back on the producer; pass a generator of
+    documents rather than a list so that the push back reaches the database cursor.
+    """
+    success, failed = 0, 0
+    try:
+        for ok, _item in helpers.parallel_bulk(
+            client, chunk, index=index_name, thread_count=thread_count, queue_size=thread_count * 2
+        ):
+            success = [success, success + 1][ok]
+            failed = [failed + 1, failed][ok]
+
+    except Exception as e:
+        print("Fatal error: \n\n{}...\n\n{}".format(str(e)[:5000], "*" * 80))
+        raise SystemExit(1)
+
+    printf({"msg": "Success: {}, Fails: {}".format(success, failed), "job": job_id, "f": "ES Ingest"})
+    return success, failed
+
+
 def put_alias(client, index, alias_name, alias_body):
     client.indices.put_alias(index, alias_name, body=alias_body)
 
@@ -530,21 +633,12 @@ def swap_aliases(client, index, load_type):
         printf({"msg": "ERROR: Unable to delete indexes: {}".format(old_indexes), "f": "ES Alias Drop"})
 
 
-def post_to_elasticsearch(client, job, config, chunksize=250000):
-    printf({"msg": 'Populating ES Index "{}"'.format(job.index), "job": job.name, "f": "ES Ingest"})
-    start = perf_counter()
-    try:
-        does_index_exist = client.indices.exists(job.index)
-    except Exception as e:
-        print(e)
-        raise SystemExit(1)
-    if not does_index_exist:
-        printf({"msg": 'Creating index "{}"'.format(job.index), "job": job.name, "f": "ES Ingest"})
-        client.indices.create(index=job.index)
-        client.indices.refresh(job.index)
-
-    csv_generator = csv_chunk_gen(job.csv, chunksize, job.name, config["load_type"])
-    for count, chunk in enumerate(csv_generator):
+def prepare_es_chunks(client, job, config, chunk_generator, chunksize):
+    """
+    Yields each non-empty chunk of documents from chunk_generator once the earlier versions of its documents have been
+    deleted from the index (when processing deletes), logging progress along the way
+    """
+    for count, chunk in enumerate(chunk_generator):
         if len(chunk) == 0:
             printf({"msg": "No documents to add/delete for chunk #{}".format(count), "f": "ES Ingest", "job": job.name})
             continue
@@ -567,7 +661,7 @@ def post_to_elasticsearch(client, job, config, chunksize=250000):
                 "f": "ES Ingest",
             }
         )
-        streaming_post_to_es(client, chunk, job.index, config["load_type"], job.name)
+        yield chunk
         printf(
             {
                 "msg": "Iteration group #{} took {}s".format(count, perf_counter() - iteration),
@@ -575,6 +669,58 @@ def post_to_elasticsearch(client, job, config, chunksize=250000):
                 "f": "ES Ingest",
             }
         )
+
+
+def post_to_elasticsearch(client, job, config, chunksize=250000):
+    printf({"msg": 'Populating ES Index "{}"'.format(job.index), "job": job.name, "f": "ES Ingest"})
+    start = perf_counter()
+    index_threads = config.get("index_threads", 1)
+    if index_threads > 1:
+        chunksize = min(chunksize, PARALLEL_INDEX_CHUNK_SIZE)
+    try:
+        does_index_exist = client.indices.exists(job.index)
+    except Exception as e:
+        print(e)
+        raise SystemExit(1)
+    if not does_index_exist:
+        printf({"msg": 'Creating index "{}"'.format(job.index), "job": job.name, "f": "ES Ingest"})
+        # Another ingest process may have created the index since the check above
+        client.indices.create(index=job.index, ignore=400)
+        client.indices.refresh(job.index)
+
+    if config.get("stream"):
+        if not config["skip_counts"]:
+            sql_config = {
+                "starting_date": config["starting_date"],
+                "fiscal_year": job.fy,
+                "process_deletes": False,
+                "load_type": config["load_type"],
+            }
+            _, _, count_sql = configure_sql_strings(sql_config, None, [])
+            job.count = execute_sql_statement(count_sql, True, config["verbose"])[0]["count"]
+        chunk_generator = stream_db_records(job, config, chunksize)
+    else:
+        chunk_generator = csv_chunk_gen(job.csv, chunksize, job.name, config["load_type"])
+
+    chunks = prepare_es_chunks(client, job, config, chunk_generator, chunksize)
+    if index_threads > 1:
+        # parallel_bulk pulls documents from the generator only as its queue has room, so memory stays bounded by
+        # one chunk plus the queued bulk requests
+        success, failed = parallel_post_to_es(
+            client, (document for chunk in chunks for document in chunk), job.index, index_threads, job.name
+        )
+        streamed_count = success + failed
+    else:
+        streamed_count = 0
+        for chunk in chunks:
+            streaming_post_to_es(client, chunk, job.index, config["load_type"], job.name)
+            streamed_count += len(chunk)
+
+    if config.get("stream") and not config["skip_counts"] and job.count != streamed_count:
+        msg = "Mismatch between streamed and DB rows! Expected: {} | Actual {}"
+        printf({"msg": msg.format(job.count, streamed_count), "job": job.name, "f": "ES Ingest"})
+        raise SystemExit(1)
+
     printf(
         {
             "msg": "Elasticsearch Index loading took {}s".format(perf_counter() - start),
@@ -586,7 +732,7 @@ def post_to_elasticsearch(client, job, config, chunksize=250000):
 
 def deleted_transactions(client, config):
     deleted_ids = gather_deleted_ids(config)
-    id_list = [{"key": deleted_id, "col": UNIVERSAL_TRANSACTION_ID_NAME} for deleted_id in deleted_ids]
+    id_list = [{"key": deleted_id, "col": UNIVERSAL_TRANSACTION_ID_NAME} for deleted_id, _ in deleted_ids.iterator()]
     delete_from_es(client, id_list, None, config, None)
 
 
@@ -596,7 +742,7 @@ def deleted_awards(client, config):
     if we can't find the awards in the database, then we have to delete them from es
     """
     deleted_ids = gather_deleted_ids(config)
-    id_list = [{"key": deleted_id, "col": UNIVERSAL_TRANSACTION_ID_NAME} for deleted_id in deleted_ids]
+    id_list = [{"key": deleted_id, "col": UNIVERSAL_TRANSACTION_ID_NAME} for deleted_id, _ in deleted_ids.iterator()]
     award_ids = get_deleted_award_ids(client, id_list, config, settings.ES_TRANSACTIONS_QUERY_ALIAS_PREFIX + "-*")
     if (len(award_ids)) == 0:
         printf({"msg": "No related awards require deletion. ", "f": "ES Delete", "job": None})
@@ -632,6 +778,9 @@ def gather_deleted_ids(config):
     """
     Connect to S3 and gather all of the transaction ids stored in CSV files
     generated by the broker when transactions are removed from the DB.
+
+    Returns a query of (prefixed transaction id, last modified) over the deleted record journal, so callers stream the
+    ids from its index instead of holding them all in memory.
     """
 
     if not config["process_deletes"]:
@@ -655,33 +804,35 @@ def gather_deleted_ids(config):
     if config["verbose"]:
         printf({"msg": f"Found {len(filtered_csv_list)} csv files"})
 
-    deleted_ids = {}
-
-    for obj in filtered_csv_list:
-        object_data = access_s3_object(bucket_name=config["s3_bucket"], obj=obj)
-
-        # Ingests the CSV into a dataframe. pandas thinks some ids are dates, so disable parsing
-        data = pd.read_csv(object_data, dtype=str)
+    # Files read on an earlier run are already in the journal so only new ones are downloaded
+    journal_deletion_files(config["s3_bucket"], filtered_csv_list)
 
-        if "detached_award_proc_unique" in data:
-            new_ids = ["CONT_TX_" + x.upper() for x in data["detached_award_proc_unique"].values]
-        elif "afa_generated_unique" in data:
-            new_ids = ["ASST_TX_" + x.upper() for x in data["afa_generated_unique"].values]
-        else:
-            printf({"msg": f"  [Missing valid col] in {obj.key}"})
+    journal_files = DeletedRecordFile.objects.filter(
+        file_key__endswith=".csv", last_modified__gte=config["starting_date"], id_column__in=DELETED_ID_PREFIXES
+    ).exclude(file_key__startswith="staging")
 
-        for uid in new_ids:
-            if uid in deleted_ids:
-                if deleted_ids[uid]["timestamp"] < obj.last_modified:
-                    deleted_ids[uid]["timestamp"] = obj.last_modified
-            else:
-                deleted_ids[uid] = {"timestamp": obj.last_modified}
+    # Prefixed and de-duplicated by the database, which keeps the newest timestamp of each id
+    uid = Case(
+        *[
+            When(deleted_record_file__id_column=id_column, then=Concat(Value(prefix), Upper("unique_id")))
+            for id_column, prefix in DELETED_ID_PREFIXES.items()
+        ],
+        output_field=TextField(),
+    )
+    deleted_ids = (
+        DeletedRecord.objects.filter(deleted_record_file__in=journal_files)
+        .annotate(uid=uid)
+        .values("uid")
+        .annotate(last_modified=Max("deleted_record_file__last_modified"))
+        .values_list("uid", "last_modified")
+        .order_by()
+    )
 
     if config["verbose"]:
-        for uid, deleted_dict in deleted_ids.items():
-            printf({"msg": "id: {} last modified: {}".format(uid, str(deleted_dict["timestamp"]))})
+        for uid, last_modified in deleted_ids.iterator():
+            printf({"msg": "id: {} last modified: {}".format(uid, str(last_modified))})
 
-    printf({"msg": "Gathering {} deleted transactions took {}s".format(len(deleted_ids), perf_counter() - start)})
+    printf({"msg": "Gathering {} deleted transactions took {}s".format(deleted_ids.count(), perf_counter() - start)})
     return deleted_ids
 
 
@@ -690,8 +841,8 @@ def filter_query(column, values, query_type="match_phrase"):
     return {"query": {"bool": {"should": [queries]}}}
 
 
-def delete_query(response):
-    return {"query": {"ids": {"values": [i["_id"] for i in response["hits"]["hits"]]}}}
+def terms_query(field, values):
+    return {"query": {"terms": {field: [str(i) for i in values]}}}
 
 
 def chunks(l, n):
@@ -700,6 +851,50 @@ def chunks(l, n):
         yield l[i : i + n]
 
 
+def get_exact_match_field(client, index, column):
+    """
+    Returns the field that holds column as an exact (non-analyzed) value in every index matching index, preferring the
+    column itself over its ".keyword" sub-field, or None when column is only mapped as text.  Exact fields can be
+    searched with a single terms query instead of one match_phrase clause per id.
+    """
+    candidates = (column, "{}.keyword".format(column))
+    response = client.indices.get_field_mapping(fields=",".join(candidates), index=index)
+    if not response:
+        return None
+    for field in candidates:
+        leaf = field.split(".")[-1]
+        if all(
+            field in index_mapping["mappings"]
+            and index_mapping["mappings"][field]["mapping"][leaf]["type"] not in ("text", "object", "nested")
+            for index_mapping in response.values()
+        ):
+            return field
+    return None
+
+
+def search_by_column(client, index, column, values, config, source=False):
+    """
+    Yields every hit whose column matches one of values.  Ids are looked up ES_DELETE_SLICE_SIZE at a time with a
+    terms query when column has an exact field, otherwise with the slower match_phrase clauses.
+    """
+    exact_field = get_exact_match_field(client, index, column)
+    for v in chunks(values, ES_DELETE_SLICE_SIZE):
+        body = terms_query(exact_field, v) if exact_field else filter_query(column, v)
+        body["_source"] = source
+        response = client.search(index=index, body=json.dumps(body), size=config["max_query_size"])
+        yield from response["hits"]["hits"]
+
+
+def delete_actions(client, index, col_to_items_dict, config, job_id):
+    for column, values in col_to_items_dict.items():
+        printf({"msg": 'Deleting {} of "{}"'.format(len(values), column), "f": "ES Delete", "job": job_id})
+        for hit in search_by_column(client, index, column, values, config):
+            action = {"_op_type": "delete", "_index": hit["_index"], "_id": hit["_id"]}
+            if "_routing" in hit:
+                action["routing"] = hit["_routing"]
+            yield action
+
+
 def delete_from_es(client, id_list, job_id, config, index=None):
     """
     id_list = [{key:'key1',col:'tranaction_id'},
@@ -709,6 +904,9 @@ def delete_from_es(client, id_list, job_id, config, index=None):
     id_list = [{key:'key1',col:'award_id'},
                {key:'key2',col:'generated_unique_award_id'}],
                ...]
+
+    Matching documents are removed with _bulk delete actions addressed by _index, _id and routing, and the index is
+    refreshed once at the end rather than after every slice of ids.
     """
     start = perf_counter()
 
@@ -716,34 +914,24 @@ def delete_from_es(client, id_list, job_id, config, index=None):
 
     if index is None:
         index = "{}-*".format(config["root_index"])
-    start_ = client.count(index=index)["count"]
-    printf({"msg": "Starting amount of indices ----- {}".format(start_), "f": "ES Delete", "job": job_id})
     col_to_items_dict = defaultdict(list)
     for l in id_list:
         col_to_items_dict[l["col"]].append(l["key"])
 
-    for column, values in col_to_items_dict.items():
-        printf({"msg": 'Deleting {} of "{}"'.format(len(values), column), "f": "ES Delete", "job": job_id})
-        values_generator = chunks(values, 1000)
-        for v in values_generator:
-            # IMPORTANT: This delete routine looks at just 1 index at a time. If there are duplicate records across
-            # multiple indexes, those duplicates will not be caught by this routine. It is left as is because at the
-            # time of this comment, we are migrating to using a single index.
-            body = filter_query(column, v)
-            response = client.search(index=index, body=json.dumps(body), size=config["max_query_size"])
-            delete_body = delete_query(response)
-            try:
-                client.delete_by_query(
-                    index=index, body=json.dumps(delete_body), refresh=True, size=config["max_query_size"]
-                )
-            except Exception as e:
-                printf({"msg": "[ERROR][ERROR][ERROR]\n{}".format(str(e)), "f": "ES Delete", "job": job_id})
-    end_ = client.count(index=index)["count"]
+    deleted, failed = 0, 0
+    actions = delete_actions(client, index, col_to_items_dict, config, job_id)
+    for ok, item in helpers.streaming_bulk(client, actions, chunk_size=ES_DELETE_SLICE_SIZE, raise_on_error=False):
+        if ok:
+            deleted += 1
+        else:
+            failed += 1
+            printf({"msg": "[ERROR][ERROR][ERROR]\n{}".format(item), "f": "ES Delete", "job": job_id})
+    client.indices.refresh(index=index)
 
     t = perf_counter() - start
-    total = str(start_ - end_)
-    printf({"msg": "ES Deletes took {}s. Deleted {} records".format(t, total), "f": "ES Delete", "job": job_id})
-    return
+    msg = "ES Deletes took {}s. Deleted {} records ({} failed)".format(t, deleted, failed)
+    printf({"msg": msg, "f": "ES Delete", "job": job_id})
+    return deleted
 
 
 def get_deleted_award_ids(client, id_list, config, index=None):
@@ -751,21 +939,19 @@ def get_deleted_award_ids(client, id_list, config, index=None):
         id_list = [{key:'key1',col:'transaction_id'},
                    {key:'key2',col:'generated_unique_transaction_id'}],
                    ...]
+
+        Returns the distinct award ids of every matching transaction, in the order they were found
      """
     if index is None:
         index = "{}-*".format(config["root_index"])
     col_to_items_dict = defaultdict(list)
     for l in id_list:
         col_to_items_dict[l["col"]].append(l["key"])
-    awards = []
+    awards = {}
     for column, values in col_to_items_dict.items():
-        values_generator = chunks(values, 1000)
-        for v in values_generator:
-            body = filter_query(column, v)
-            response = client.search(index=index, body=json.dumps(body), size=config["max_query_size"])
-            if response["hits"]["total"]["value"] != 0:
-                awards = [x["_source"]["generated_unique_award_id"] for x in response["hits"]["hits"]]
-    return awards
+        for hit in search_by_column(client, index, column, values, config, source=[UNIVERSAL_AWARD_ID_NAME]):
+            awards[hit["_source"][UNIVERSAL_AWARD_ID_NAME]] = None
+    return list(awards)
 
 
 def check_awards_for_deletes(id_list):
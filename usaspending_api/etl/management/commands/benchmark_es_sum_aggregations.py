@@ -0,0 +1,66 @@
+"""
+Compares the scripted sum of an amount in cents with the native sum of its indexed cents companion (see
+elasticsearch_helper.CENTS_FIELDS) on the transaction index, to confirm the gain before enabling ES_SUM_CENTS_FIELDS.
+"""
+
+import logging
+
+from django.core.management.base import BaseCommand, CommandError
+from elasticsearch_dsl import A
+from statistics import median
+from time import perf_counter
+
+from usaspending_api.common.elasticsearch.search_wrappers import TransactionSearch
+from usaspending_api.search.v2.elasticsearch_helper import CENTS_FIELDS
+
+
+logger = logging.getLogger("console")
+
+
+def _percentile(values: list, percentile: int) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * percentile / 100))]
+
+
+class Command(BaseCommand):
+    help = "Benchmark scripted against native cents sums in Elasticsearch transaction aggregations"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--field", choices=sorted(CENTS_FIELDS), default="generated_pragmatic_obligation")
+        parser.add_argument("--group-by", default="awarding_toptier_agency_name.keyword", help="Terms field to sum by")
+        parser.add_argument("--fiscal-year", type=int, help="Only aggregate the transactions of this fiscal year")
+        parser.add_argument("--runs", type=int, default=20, help="Searches per variant, after one warm-up search")
+
+    def handle(self, *args, **options):
+        field = options["field"]
+        variants = {
+            "script": A("sum", field=field, script={"source": "_value * 100"}),
+            "native": A("sum", field=CENTS_FIELDS[field]),
+        }
+
+        results = {}
+        for name, sum_agg in variants.items():
+            search = TransactionSearch().extra(size=0).params(request_cache=False)
+            if options["fiscal_year"]:
+                search = search.filter("term", transaction_fiscal_year=options["fiscal_year"])
+            search.aggs.bucket("group_by", A("terms", field=options["group_by"], size=1000)).metric(
+                "sum_field", sum_agg
+            )
+
+            search.handle_execute()  # Warm-up, so both variants read from the same file system cache
+            took, elapsed, totals = [], [], None
+            for _ in range(options["runs"]):
+                start = perf_counter()
+                response = search.handle_execute()
+                elapsed.append((perf_counter() - start) * 1000)
+                took.append(response.took)
+                totals = {b.key: int(b.sum_field.value) for b in response.aggs.group_by.buckets}
+            results[name] = totals
+
+            logger.info(
+                f"{name:>6}: took median {median(took):.0f} ms, p95 {_percentile(took, 95):.0f} ms; "
+                f"round trip median {median(elapsed):.0f} ms, p95 {_percentile(elapsed, 95):.0f} ms"
+            )
+
+        if results["script"] != results["native"]:
+            raise CommandError(f"Sums differ between variants; has the index been rebuilt with {CENTS_FIELDS[field]}?")
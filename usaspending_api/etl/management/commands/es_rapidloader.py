@@ -20,11 +20,12 @@ class Command(BaseCommand):
     HIGHLEVEL PROCESS OVERVIEW
          1. Generate the full list of fiscal years to process as jobs
          2. Iterate by job
-           a. Download a CSV file by year (one at a time)
+           a. Download a CSV file by year (--download-workers at a time)
                i. Continue to download a CSV file until all years are downloaded
-           b. Upload a CSV to Elasticsearch
+           b. Upload a CSV to Elasticsearch (--ingest-workers at a time)
                i. Continue to upload a CSV file until all years are uploaded to ES
            c. Delete CSV file
+         With --stream, steps a and c are skipped and rows are streamed from the database straight into step b
     TO RELOAD ALL data:
         python3 manage.py es_rapidloader --index-name <NEW-INDEX-NAME> --create-new-index all
 
@@ -100,6 +101,31 @@ class Command(BaseCommand):
             "Only used when --create-new-index is provided.",
         )
 
+        parser.add_argument(
+            "--stream",
+            action="store_true",
+            help="Index rows read straight from the ETL view through a server-side cursor instead of first copying "
+            "each fiscal year to a CSV file and reading it back. Skips the CSV recount as well.",
+        )
+        parser.add_argument(
+            "--index-threads",
+            type=int,
+            default=1,
+            help="Number of threads sending bulk requests to Elasticsearch in parallel.",
+        )
+        parser.add_argument(
+            "--download-workers",
+            type=int,
+            default=1,
+            help="Number of processes copying fiscal year CSV files from the database at the same time.",
+        )
+        parser.add_argument(
+            "--ingest-workers",
+            type=int,
+            default=1,
+            help="Number of processes indexing fiscal year jobs into Elasticsearch at the same time.",
+        )
+
     def handle(self, *args, **options):
         elasticsearch_client = instantiate_elasticsearch_client()
         config = process_cli_parameters(options, elasticsearch_client)
@@ -134,6 +160,10 @@ def process_cli_parameters(options: dict, es_client) -> dict:
         "directory",
         "skip_counts",
         "load_type",
+        "stream",
+        "index_threads",
+        "download_workers",
+        "ingest_workers",
     )
     config = set_config(simple_args, options)
 
@@ -0,0 +1,60 @@
+"""
+Rebuilds the spending_by_category rollups from the view the transaction Elasticsearch index is loaded from.  Run it
+after every transaction index load so that the rollups and the index agree.
+"""
+
+import logging
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from usaspending_api.common.cache import try_bump_data_generation
+from usaspending_api.common.helpers.timing_helpers import ScriptTimer as Timer
+from usaspending_api.search.helpers.spending_by_category_rollups import ROLLUP_AGG_KEYS
+from usaspending_api.search.models import SpendingByCategoryRollup
+
+
+logger = logging.getLogger("console")
+
+# One pass over the view: every transaction is unpivoted into a row per aggregation key before grouping
+ROLLUP_SQL = """
+    INSERT INTO {table} (
+        agg_key_name, fiscal_year, awarding_toptier_agency_name, type, agg_key, generated_pragmatic_obligation
+    )
+    SELECT
+        k.agg_key_name,
+        t.transaction_fiscal_year,
+        t.awarding_toptier_agency_name,
+        t.type,
+        k.agg_key,
+        COALESCE(SUM(t.generated_pragmatic_obligation), 0)
+    FROM {view} AS t
+    CROSS JOIN LATERAL (VALUES {agg_keys}) AS k (agg_key_name, agg_key)
+    WHERE k.agg_key IS NOT NULL
+    GROUP BY k.agg_key_name, t.transaction_fiscal_year, t.awarding_toptier_agency_name, t.type, k.agg_key
+"""
+
+
+class Command(BaseCommand):
+    help = "Rebuild the spending_by_category rollups from {}".format(settings.ES_TRANSACTIONS_ETL_VIEW_NAME)
+
+    def handle(self, *args, **options):
+        table = SpendingByCategoryRollup._meta.db_table
+        sql = ROLLUP_SQL.format(
+            table=table,
+            view=settings.ES_TRANSACTIONS_ETL_VIEW_NAME,
+            agg_keys=", ".join(f"('{agg_key}', t.{agg_key})" for agg_key in ROLLUP_AGG_KEYS),
+        )
+
+        # Delete rather than truncate so requests keep reading the previous rollups until the new ones are committed
+        with Timer(f"Rebuild {table}"):
+            with transaction.atomic(), connection.cursor() as cursor:
+                cursor.execute(f"DELETE FROM {table}")
+                cursor.execute(sql)
+                logger.info(f"{cursor.rowcount:,} rollup rows written")
+
+        with connection.cursor() as cursor:
+            cursor.execute(f"VACUUM ANALYZE {table}")
+
+        try_bump_data_generation()
@@ -0,0 +1,127 @@
+"""
+Rebuilds the spending_over_time rollups from the view the transaction Elasticsearch index is loaded from.  Run it
+after every transaction index load so that the rollups and the index agree.
+
+Only fiscal years that changed since the previous run are rebuilt: those whose transaction count or obligation total
+no longer match the rollups (which catches deleted transactions) or that have transactions updated since then.  Finding
+them counts and sums every row of the view, a full scan of the transaction tables on every run; pass --fiscal-years
+to skip it when the changed years are already known.
+"""
+
+import logging
+
+from datetime import datetime, timezone
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from usaspending_api.broker.helpers.last_load_date import get_last_load_date, update_last_load_date
+from usaspending_api.common.cache import try_bump_data_generation
+from usaspending_api.common.helpers.timing_helpers import ScriptTimer as Timer
+from usaspending_api.search.helpers.spending_over_time_cube import CUBE_LOAD_KEY
+from usaspending_api.search.models import SpendingOverTimeRollup
+
+
+logger = logging.getLogger("console")
+
+LAST_LOAD_KEY = "spending_over_time_rollups"
+LAST_LOAD_LOOKBACK_MINUTES = 15
+
+# Scans the whole view: deleted transactions leave no row with a recent update_date behind, so they only show up as a
+# fiscal year whose count or total no longer matches its rollups
+CHANGED_FISCAL_YEARS_SQL = """
+    SELECT fiscal_year
+    FROM (
+        SELECT
+            transaction_fiscal_year AS fiscal_year,
+            COUNT(*) AS transaction_count,
+            COALESCE(SUM(generated_pragmatic_obligation), 0) AS obligation,
+            MAX(update_date) AS update_date
+        FROM {view}
+        GROUP BY transaction_fiscal_year
+    ) AS v
+    FULL OUTER JOIN (
+        SELECT fiscal_year, SUM(transaction_count) AS transaction_count, SUM(generated_pragmatic_obligation) AS obligation
+        FROM {table}
+        GROUP BY fiscal_year
+    ) AS r USING (fiscal_year)
+    WHERE v.transaction_count IS DISTINCT FROM r.transaction_count
+        OR v.obligation IS DISTINCT FROM r.obligation
+        OR v.update_date >= %(since)s
+    ORDER BY fiscal_year
+"""
+
+ROLLUP_SQL = """
+    INSERT INTO {table} (
+        fiscal_year, fiscal_month, awarding_toptier_agency_name, type, recipient_location_country_code,
+        recipient_location_state_code, transaction_count, generated_pragmatic_obligation
+    )
+    SELECT
+        transaction_fiscal_year,
+        EXTRACT(MONTH FROM fiscal_action_date),
+        awarding_toptier_agency_name,
+        type,
+        recipient_location_country_code,
+        recipient_location_state_code,
+        COUNT(*),
+        COALESCE(SUM(generated_pragmatic_obligation), 0)
+    FROM {view}
+    {where}
+    GROUP BY 1, 2, 3, 4, 5, 6
+"""
+
+
+class Command(BaseCommand):
+    help = "Rebuild the changed fiscal years of the spending_over_time rollups from {}".format(
+        settings.ES_TRANSACTIONS_ETL_VIEW_NAME
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--fiscal-years", type=int, nargs="+", help="Rebuild these fiscal years instead of the changed ones"
+        )
+        parser.add_argument("--full", action="store_true", help="Rebuild every fiscal year")
+
+    def handle(self, *args, **options):
+        table = SpendingOverTimeRollup._meta.db_table
+        view = settings.ES_TRANSACTIONS_ETL_VIEW_NAME
+        start_time = datetime.now(timezone.utc)
+
+        since = None if options["full"] else get_last_load_date(LAST_LOAD_KEY, LAST_LOAD_LOOKBACK_MINUTES)
+        if options["fiscal_years"]:
+            fiscal_years = options["fiscal_years"]
+        elif since is not None:
+            with Timer("Find changed fiscal years"), connection.cursor() as cursor:
+                cursor.execute(CHANGED_FISCAL_YEARS_SQL.format(view=view, table=table), {"since": since})
+                fiscal_years = [row[0] for row in cursor.fetchall()]
+            if not fiscal_years:
+                logger.info("No fiscal years changed since the last run")
+                update_last_load_date(LAST_LOAD_KEY, start_time)
+                return
+        else:
+            fiscal_years = None
+
+        if fiscal_years is None:
+            description, delete_where, view_where = "every fiscal year", "", ""
+        else:
+            description = f"fiscal years {', '.join(str(fy) for fy in fiscal_years)}"
+            delete_where = "WHERE fiscal_year = ANY(%(fiscal_years)s)"
+            view_where = "WHERE transaction_fiscal_year = ANY(%(fiscal_years)s)"
+        params = {"fiscal_years": fiscal_years}
+
+        # Delete rather than truncate so requests keep reading the previous rollups until the new ones are committed.
+        # API workers reload their cube once they see the rewrite time committed with them.
+        with Timer(f"Rebuild {table} for {description}"):
+            with transaction.atomic(), connection.cursor() as cursor:
+                cursor.execute(f"DELETE FROM {table} {delete_where}", params)
+                cursor.execute(ROLLUP_SQL.format(table=table, view=view, where=view_where), params)
+                logger.info(f"{cursor.rowcount:,} rollup rows written")
+                update_last_load_date(CUBE_LOAD_KEY, datetime.now(timezone.utc))
+
+        with connection.cursor() as cursor:
+            cursor.execute(f"VACUUM ANALYZE {table}")
+
+        try_bump_data_generation()
+
+        if not options["fiscal_years"]:
+            update_last_load_date(LAST_LOAD_KEY, start_time)
@@ -1,26 +1,30 @@
+import io
 import logging
 import re
 import signal
 
+from collections import Counter
 from datetime import datetime
 from django.core.management import call_command
 from django.core.management.base import CommandError
-from django.db import transaction
+from django.db import connection, transaction
 from usaspending_api.accounts.models import AppropriationAccountBalances, TreasuryAppropriationAccount
-from usaspending_api.awards.models import Award, FinancialAccountsByAwards
+from usaspending_api.awards.models import FinancialAccountsByAwards
+from usaspending_api.common.cache import try_bump_data_generation
 from usaspending_api.common.helpers.dict_helpers import upper_case_dict_values
 from usaspending_api.etl.broker_etl_helpers import dictfetchall
 from usaspending_api.etl.helpers import get_fiscal_quarter
 from usaspending_api.etl.management import load_base
 from usaspending_api.etl.management.helpers.load_submission import (
     CertifiedAwardFinancial,
+    CertifiedAwardFinancialIterator,
     defc_exists,
-    get_object_class,
-    get_or_create_program_activity,
     get_publish_history_table,
-    get_disaster_emergency_fund,
+    LoadReport,
+    SubmissionLookupCache,
 )
 from usaspending_api.etl.management.load_base import load_data_into_model
+from usaspending_api.etl.transaction_loaders.data_load_helpers import format_value_for_copy
 from usaspending_api.financial_activities.models import FinancialAccountsByProgramActivityObjectClass
 from usaspending_api.references.helpers import retrive_agency_name_from_code
 from usaspending_api.submissions.models import SubmissionAttributes
@@ -29,6 +33,9 @@ from usaspending_api.submissions.models import SubmissionAttributes
 # This dictionary will hold a map of tas_id -> treasury_account to ensure we don't keep hitting the databroker DB for
 # account data
 TAS_ID_TO_ACCOUNT = {}
+TAS_ID_TO_RENDERING_LABEL = {}
+
+BULK_CREATE_BATCH_SIZE = 5000
 
 logger = logging.getLogger("script")
 
@@ -46,6 +53,12 @@ class Command(load_base.Command):
 
     def add_arguments(self, parser):
         parser.add_argument("submission_id", help="Broker submission_id to load", type=int)
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=BULK_CREATE_BATCH_SIZE,
+            help="Number of File A and File B records written per INSERT",
+        )
         super(Command, self).add_arguments(parser)
 
     @transaction.atomic
@@ -106,6 +119,8 @@ class Command(load_base.Command):
             raise RuntimeError(f"d2_submission {submission_data['d2_submission']} is not allowed")
 
         submission_attributes = get_submission_attributes(submission_id, submission_data)
+        lookup_cache = SubmissionLookupCache(submission_attributes)
+        batch_size = options["batch_size"]
 
         logger.info("Getting File A data")
         db_cursor.execute("SELECT * FROM certified_appropriation WHERE submission_id = %s", [submission_id])
@@ -115,7 +130,7 @@ class Command(load_base.Command):
         )
         logger.info("Loading File A data")
         start_time = datetime.now()
-        load_file_a(submission_attributes, appropriation_data, db_cursor)
+        load_file_a(submission_attributes, appropriation_data, db_cursor, batch_size)
         logger.info(f"Finished loading File A data, took {datetime.now() - start_time}")
 
         logger.info("Getting File B data")
@@ -126,11 +141,11 @@ class Command(load_base.Command):
         )
         logger.info("Loading File B data")
         start_time = datetime.now()
-        load_file_b(submission_attributes, prg_act_obj_cls_data, db_cursor)
+        load_file_b(submission_attributes, prg_act_obj_cls_data, db_cursor, lookup_cache, batch_size)
         logger.info(f"Finished loading File B data, took {datetime.now() - start_time}")
 
         logger.info("Getting File C data")
-        certified_award_financial = CertifiedAwardFinancial(submission_attributes)
+        certified_award_financial = CertifiedAwardFinancial(submission_attributes, lookup_cache)
         logger.info(
             f"Acquired File C (award financial) data for {submission_id}, "
             f"there are {certified_award_financial.count:,} rows."
@@ -142,6 +157,7 @@ class Command(load_base.Command):
 
         # Once all the files have been processed, run any global cleanup/post-load tasks.
         # Cleanup not specific to this submission is run in the `.handle` method
+        transaction.on_commit(try_bump_data_generation)
         logger.info(f"Successfully loaded submission {submission_id}.")
 
 
@@ -155,36 +171,57 @@ def update_skipped_tas(row, tas_rendering_label, skipped_tas):
         skipped_tas[tas_rendering_label]["rows"] += [row["row_number"]]
 
 
-def get_treasury_appropriation_account_tas_lookup(tas_lookup_id, db_cursor):
-    """Get the matching TAS object from the broker database and save it to our running list."""
-    if tas_lookup_id in TAS_ID_TO_ACCOUNT:
-        return TAS_ID_TO_ACCOUNT[tas_lookup_id]
-    # Checks the broker DB tas_lookup table for the tas_id and returns the matching TAS object in the datastore
-    db_cursor.execute(
-        "SELECT * FROM tas_lookup WHERE (financial_indicator2 <> 'F' OR financial_indicator2 IS NULL) "
-        "AND account_num = %s",
-        [tas_lookup_id],
-    )
-    tas_data = dictfetchall(db_cursor)
-
-    if tas_data is None or len(tas_data) == 0:
-        return None, f"Account number {tas_lookup_id} not found in Broker"
-
-    tas_rendering_label = TreasuryAppropriationAccount.generate_tas_rendering_label(
-        ata=tas_data[0]["allocation_transfer_agency"],
-        aid=tas_data[0]["agency_identifier"],
-        typecode=tas_data[0]["availability_type_code"],
-        bpoa=tas_data[0]["beginning_period_of_availa"],
-        epoa=tas_data[0]["ending_period_of_availabil"],
-        mac=tas_data[0]["main_account_code"],
-        sub=tas_data[0]["sub_account_code"],
-    )
+def get_tas_rendering_labels(tas_ids, db_cursor):
+    """
+    Get the tas_rendering_label of each of these broker tas_lookup account numbers with a single broker query, or None
+    for account numbers not found in the broker.  Labels already looked up are kept for later calls.
+    """
+    missing = list({tas_id for tas_id in tas_ids if tas_id not in TAS_ID_TO_RENDERING_LABEL})
+    if missing:
+        db_cursor.execute(
+            "SELECT DISTINCT ON (account_num) * FROM tas_lookup "
+            "WHERE (financial_indicator2 <> 'F' OR financial_indicator2 IS NULL) AND account_num = ANY(%s) "
+            "ORDER BY account_num",
+            [missing],
+        )
+        for tas_data in dictfetchall(db_cursor):
+            tas_rendering_label = TreasuryAppropriationAccount.generate_tas_rendering_label(
+                ata=tas_data["allocation_transfer_agency"],
+                aid=tas_data["agency_identifier"],
+                typecode=tas_data["availability_type_code"],
+                bpoa=tas_data["beginning_period_of_availa"],
+                epoa=tas_data["ending_period_of_availabil"],
+                mac=tas_data["main_account_code"],
+                sub=tas_data["sub_account_code"],
+            )
+            TAS_ID_TO_RENDERING_LABEL[tas_data["account_num"]] = tas_rendering_label
+    return {tas_id: TAS_ID_TO_RENDERING_LABEL.get(tas_id) for tas_id in tas_ids}
 
-    TAS_ID_TO_ACCOUNT[tas_lookup_id] = (
-        TreasuryAppropriationAccount.objects.filter(tas_rendering_label=tas_rendering_label).first(),
-        tas_rendering_label,
-    )
-    return TAS_ID_TO_ACCOUNT[tas_lookup_id]
+
+def get_treasury_accounts(tas_ids, db_cursor):
+    """
+    Get the matching TAS object and tas_rendering_label of each of these broker tas_lookup account numbers, with one
+    broker query and one TreasuryAppropriationAccount query for those not already in our running list.  Account
+    numbers not found in the broker have no TAS object and a message in place of the label.
+    """
+    missing = {tas_id for tas_id in tas_ids if tas_id not in TAS_ID_TO_ACCOUNT}
+    tas_rendering_labels = get_tas_rendering_labels(missing, db_cursor) if missing else {}
+
+    # Ordered so that the lowest id is kept for duplicate labels, as first() would
+    accounts = {}
+    for treasury_account in TreasuryAppropriationAccount.objects.filter(
+        tas_rendering_label__in={label for label in tas_rendering_labels.values() if label is not None}
+    ).order_by("-treasury_account_identifier"):
+        accounts[treasury_account.tas_rendering_label] = treasury_account
+
+    for tas_id, tas_rendering_label in tas_rendering_labels.items():
+        if tas_rendering_label is not None:
+            TAS_ID_TO_ACCOUNT[tas_id] = accounts.get(tas_rendering_label), tas_rendering_label
+
+    return {
+        tas_id: TAS_ID_TO_ACCOUNT.get(tas_id, (None, f"Account number {tas_id} not found in Broker"))
+        for tas_id in tas_ids
+    }
 
 
 def get_submission_attributes(submission_id, submission_data):
@@ -223,9 +260,10 @@ def get_submission_attributes(submission_id, submission_data):
     return new_submission
 
 
-def load_file_a(submission_attributes, appropriation_data, db_cursor):
+def load_file_a(submission_attributes, appropriation_data, db_cursor, batch_size=BULK_CREATE_BATCH_SIZE):
     """ Process and load file A broker data (aka TAS balances, aka appropriation account balances). """
     reverse = re.compile("gross_outlay_amount_by_tas_cpe")
+    report = LoadReport("File A")
 
     # dictionary to capture TAS that were skipped and some metadata
     # tas = top-level key
@@ -233,37 +271,43 @@ def load_file_a(submission_attributes, appropriation_data, db_cursor):
     # rows = row numbers skipped, corresponding to the original row numbers in the file that was submitted
     skipped_tas = {}
 
+    with report.phase("lookups"):
+        treasury_accounts = get_treasury_accounts([row.get("tas_id") for row in appropriation_data], db_cursor)
+
     # Create account objects
-    for row in appropriation_data:
+    appropriation_balances_list = []
+    with report.phase("prepare"):
+        for row in appropriation_data:
 
-        # Check and see if there is an entry for this TAS
-        treasury_account, tas_rendering_label = get_treasury_appropriation_account_tas_lookup(
-            row.get("tas_id"), db_cursor
-        )
-        if treasury_account is None:
-            update_skipped_tas(row, tas_rendering_label, skipped_tas)
-            continue
-
-        # Now that we have the account, we can load the appropriation balances
-        # TODO: Figure out how we want to determine what row is overriden by what row
-        # If we want to correlate, the following attributes are available in the data broker data that might be useful:
-        # appropriation_id, row_number appropriation_balances = somethingsomething get appropriation balances...
-        appropriation_balances = AppropriationAccountBalances()
-
-        value_map = {
-            "treasury_account_identifier": treasury_account,
-            "submission": submission_attributes,
-            "reporting_period_start": submission_attributes.reporting_period_start,
-            "reporting_period_end": submission_attributes.reporting_period_end,
-        }
+            # Check and see if there is an entry for this TAS
+            treasury_account, tas_rendering_label = treasury_accounts[row.get("tas_id")]
+            if treasury_account is None:
+                update_skipped_tas(row, tas_rendering_label, skipped_tas)
+                continue
 
-        field_map = {}
+            # Now that we have the account, we can load the appropriation balances
+            # TODO: Figure out how we want to determine what row is overriden by what row
+            # If we want to correlate, the following attributes are available in the data broker data that might be
+            # useful: appropriation_id, row_number appropriation_balances = somethingsomething get appropriation
+            # balances...
+            appropriation_balances = AppropriationAccountBalances()
 
-        load_data_into_model(
-            appropriation_balances, row, field_map=field_map, value_map=value_map, save=True, reverse=reverse
-        )
+            value_map = {
+                "treasury_account_identifier": treasury_account,
+                "submission": submission_attributes,
+                "reporting_period_start": submission_attributes.reporting_period_start,
+                "reporting_period_end": submission_attributes.reporting_period_end,
+            }
+
+            field_map = {}
 
-    AppropriationAccountBalances.populate_final_of_fy()
+            load_data_into_model(appropriation_balances, row, field_map=field_map, value_map=value_map, reverse=reverse)
+            appropriation_balances_list.append(appropriation_balances)
+
+    with report.phase("write"):
+        AppropriationAccountBalances.objects.bulk_create(appropriation_balances_list, batch_size=batch_size)
+    with report.phase("final_of_fy"):
+        AppropriationAccountBalances.populate_final_of_fy()
 
     for key in skipped_tas:
         logger.info(f"Skipped {skipped_tas[key]['count']:,} rows due to missing TAS: {key}")
@@ -274,6 +318,10 @@ def load_file_a(submission_attributes, appropriation_data, db_cursor):
 
     logger.info(f"Skipped a total of {total_tas_skipped:,} TAS rows for File A")
 
+    report.rows_written = len(appropriation_balances_list)
+    report.rows_skipped = total_tas_skipped
+    report.log(logger)
+
 
 def get_file_b(submission_attributes, db_cursor):
     """
@@ -411,9 +459,12 @@ def get_file_b(submission_attributes, db_cursor):
     return data
 
 
-def load_file_b(submission_attributes, prg_act_obj_cls_data, db_cursor):
+def load_file_b(
+    submission_attributes, prg_act_obj_cls_data, db_cursor, lookup_cache, batch_size=BULK_CREATE_BATCH_SIZE
+):
     """ Process and load file B broker data (aka TAS balances by program activity and object class). """
     reverse = re.compile(r"(_(cpe|fyb)$)|^transaction_obligated_amount$")
+    report = LoadReport("File B")
 
     # dictionary to capture TAS that were skipped and some metadata
     # tas = top-level key
@@ -421,40 +472,56 @@ def load_file_b(submission_attributes, prg_act_obj_cls_data, db_cursor):
     # rows = row numbers skipped, corresponding to the original row numbers in the file that was submitted
     skipped_tas = {}
 
-    test_counter = 0
-    for row in prg_act_obj_cls_data:
-        test_counter += 1
-        try:
-            # Check and see if there is an entry for this TAS
-            treasury_account, tas_rendering_label = get_treasury_appropriation_account_tas_lookup(
-                row.get("tas_id"), db_cursor
+    with report.phase("lookups"):
+        treasury_accounts = get_treasury_accounts([row.get("tas_id") for row in prg_act_obj_cls_data], db_cursor)
+
+        # the account balances rows (aka "File A" records) of the submission, by TAS
+        account_balances_by_tas = {}
+        for account_balances in AppropriationAccountBalances.objects.filter(
+            submission_id=submission_attributes.submission_id
+        ):
+            account_balances_by_tas.setdefault(account_balances.treasury_account_identifier_id, []).append(
+                account_balances
             )
+
+        # Rows whose TAS is not found are skipped below, so their program activities must not be created
+        lookup_cache.create_missing_program_activities(
+            row for row in prg_act_obj_cls_data if treasury_accounts[row.get("tas_id")][0] is not None
+        )
+
+    financial_by_prg_act_obj_cls_list = []
+    with report.phase("prepare"):
+        for row in prg_act_obj_cls_data:
+            # Check and see if there is an entry for this TAS
+            treasury_account, tas_rendering_label = treasury_accounts[row.get("tas_id")]
             if treasury_account is None:
                 update_skipped_tas(row, tas_rendering_label, skipped_tas)
                 continue
-        except Exception:  # TODO: What is this trying to catch, actually?
-            continue
 
-        # get the corresponding account balances row (aka "File A" record)
-        account_balances = AppropriationAccountBalances.objects.get(
-            treasury_account_identifier=treasury_account, submission_id=submission_attributes.submission_id
+            # get the corresponding account balances row (aka "File A" record)
+            account_balances = get_account_balances(account_balances_by_tas, treasury_account)
+
+            financial_by_prg_act_obj_cls = FinancialAccountsByProgramActivityObjectClass()
+
+            value_map = {
+                "submission": submission_attributes,
+                "reporting_period_start": submission_attributes.reporting_period_start,
+                "reporting_period_end": submission_attributes.reporting_period_end,
+                "treasury_account": treasury_account,
+                "appropriation_account_balances": account_balances,
+                "object_class": lookup_cache.get_object_class(row["object_class"], row["by_direct_reimbursable_fun"]),
+                "program_activity": lookup_cache.get_program_activity(row),
+                "disaster_emergency_fund": lookup_cache.get_disaster_emergency_fund(row),
+            }
+            load_data_into_model(financial_by_prg_act_obj_cls, row, value_map=value_map, reverse=reverse)
+            financial_by_prg_act_obj_cls_list.append(financial_by_prg_act_obj_cls)
+
+    with report.phase("write"):
+        FinancialAccountsByProgramActivityObjectClass.objects.bulk_create(
+            financial_by_prg_act_obj_cls_list, batch_size=batch_size
         )
-
-        financial_by_prg_act_obj_cls = FinancialAccountsByProgramActivityObjectClass()
-
-        value_map = {
-            "submission": submission_attributes,
-            "reporting_period_start": submission_attributes.reporting_period_start,
-            "reporting_period_end": submission_attributes.reporting_period_end,
-            "treasury_account": treasury_account,
-            "appropriation_account_balances": account_balances,
-            "object_class": get_object_class(row["object_class"], row["by_direct_reimbursable_fun"]),
-            "program_activity": get_or_create_program_activity(row, submission_attributes),
-            "disaster_emergency_fund": get_disaster_emergency_fund(row),
-        }
-        load_data_into_model(financial_by_prg_act_obj_cls, row, value_map=value_map, save=True, reverse=reverse)
-
-    FinancialAccountsByProgramActivityObjectClass.populate_final_of_fy()
+    with report.phase("final_of_fy"):
+        FinancialAccountsByProgramActivityObjectClass.populate_final_of_fy()
 
     for key in skipped_tas:
         logger.info(f"Skipped {skipped_tas[key]['count']:,} rows due to missing TAS: {key}")
@@ -465,49 +532,152 @@ def load_file_b(submission_attributes, prg_act_obj_cls_data, db_cursor):
 
     logger.info(f"Skipped a total of {total_tas_skipped:,} TAS rows for File B")
 
+    report.rows_written = len(financial_by_prg_act_obj_cls_list)
+    report.rows_skipped = total_tas_skipped
+    report.log(logger)
 
-def find_matching_award(piid=None, parent_piid=None, fain=None, uri=None):
-    """
-        Check for a distinct award that matches based on the parameters provided
 
-        :param piid: PIID associated with a contract
-        :param parent_piid: Parent Award ID associated with a contract
-        :param fain: FAIN associated with a financial assistance award
-        :param uri: URI associated with a financial assistancw award
-        :return: Award object containing an exact matched award OR None if no exact match found
-    """
-    filters = {"latest_transaction_id__isnull": False}
-
-    if not (piid or fain or uri):
-        return None
-
-    # check piid and parent_piid
-    if piid:
-        filters["piid"] = piid
-        if parent_piid:
-            filters["parent_award_piid"] = parent_piid
-    elif fain and not uri:
-        # if only the fain is populated, filter on that
-        filters["fain"] = fain
-    elif not fain and uri:
-        # if only the uri is populated, filter on that
-        filters["uri"] = uri
-    else:
-        # if both fain and uri are populated, filter on fain first for an exact match. if no exact match found,
-        # then try filtering on the uri
-        filters["fain"] = fain
-        fain_award_count = Award.objects.filter(**filters).count()
+def get_account_balances(account_balances_by_tas, treasury_account):
+    """The one File A record of a TAS, raising the same errors AppropriationAccountBalances.objects.get would"""
+    account_balances = account_balances_by_tas.get(treasury_account.treasury_account_identifier, [])
+    if not account_balances:
+        raise AppropriationAccountBalances.DoesNotExist(
+            f"AppropriationAccountBalances matching query does not exist for TAS {treasury_account.tas_rendering_label}"
+        )
+    if len(account_balances) > 1:
+        raise AppropriationAccountBalances.MultipleObjectsReturned(
+            f"get() returned {len(account_balances)} AppropriationAccountBalances for TAS "
+            f"{treasury_account.tas_rendering_label}"
+        )
+    return account_balances[0]
+
+
+# Shape of the staged File C rows: the financial_accounts_by_awards columns plus what is needed to resolve their TAS
+CREATE_TEMP_FILE_C_TABLE_SQL = """
+    drop table if exists temp_load_file_c;
+    create temporary table temp_load_file_c as
+    select  0 as load_index, null::text as tas_id, null::text as tas_rendering_label, {columns}
+    from    financial_accounts_by_awards
+    where   false
+"""
+
+MATCH_TREASURY_ACCOUNTS_SQL = """
+    update  temp_load_file_c as t
+    set     treasury_account_id = taa.treasury_account_identifier
+    from    (
+                select      distinct on (tas_rendering_label) tas_rendering_label, treasury_account_identifier
+                from        treasury_appropriation_account
+                where       tas_rendering_label in (select tas_rendering_label from temp_load_file_c)
+                order by    tas_rendering_label, treasury_account_identifier
+            ) as taa
+    where   taa.tas_rendering_label = t.tas_rendering_label
+"""
+
+DELETE_SKIPPED_TAS_SQL = """
+    delete from temp_load_file_c
+    where       treasury_account_id is null
+    returning   coalesce(tas_rendering_label, 'Account number ' || tas_id || ' not found in Broker')
+"""
+
+# Same precedence as the row by row matching this replaced.  Only an award with a latest transaction matches, and only
+# if it is the one award matching the row's:
+#   - piid, and also parent_award_id when the row has one
+#   - otherwise fain, or uri when there is no unique fain match
+MATCH_AWARDS_SQL = """
+    with piid_awards as (
+        select      k.piid, k.parent_award_id, min(a.id) as award_id
+        from        (select distinct piid, parent_award_id from temp_load_file_c where piid <> '') as k
+                    inner join awards as a on
+                        a.piid = k.piid and
+                        (coalesce(k.parent_award_id, '') = '' or a.parent_award_piid = k.parent_award_id)
+        where       a.latest_transaction_id is not null
+        group by    k.piid, k.parent_award_id
+        having      count(*) = 1
+    ), fain_awards as (
+        select      fain, min(id) as award_id
+        from        awards
+        where       fain in (select fain from temp_load_file_c where coalesce(piid, '') = '' and fain <> '') and
+                    latest_transaction_id is not null
+        group by    fain
+        having      count(*) = 1
+    ), uri_awards as (
+        select      uri, min(id) as award_id
+        from        awards
+        where       uri in (select uri from temp_load_file_c where coalesce(piid, '') = '' and uri <> '') and
+                    latest_transaction_id is not null
+        group by    uri
+        having      count(*) = 1
+    )
+    update  temp_load_file_c as t
+    set     award_id = m.award_id
+    from    (
+                select      s.load_index,
+                            case
+                                when coalesce(s.piid, '') <> '' then p.award_id
+                                else coalesce(f.award_id, u.award_id)
+                            end as award_id
+                from        temp_load_file_c as s
+                            left outer join piid_awards as p on
+                                p.piid = s.piid and p.parent_award_id is not distinct from s.parent_award_id
+                            left outer join fain_awards as f on f.fain = s.fain
+                            left outer join uri_awards as u on u.uri = s.uri
+            ) as m
+    where   m.load_index = t.load_index and m.award_id is not null
+"""
+
+# SubmissionLookupCache.get_disaster_emergency_fund leaves the code null when it is not a known DEFC
+CLEAR_UNKNOWN_DEFC_SQL = """
+    update  temp_load_file_c as t
+    set     disaster_emergency_fund_code = null
+    where   disaster_emergency_fund_code is not null and
+            not exists (select from disaster_emergency_fund_code where code = t.disaster_emergency_fund_code)
+"""
+
+INSERT_FILE_C_SQL = """
+    insert into financial_accounts_by_awards ({columns})
+    select {columns} from temp_load_file_c order by load_index
+"""
+
+# Any column that is not populated from the broker row is set by the statements above
+FILE_C_COLUMNS = [f for f in FinancialAccountsByAwards._meta.concrete_fields if not f.primary_key]
+
+
+def stage_file_c_rows(cursor, rows, first_load_index, submission_attributes, db_cursor):
+    """COPY a batch of broker File C rows, prepared the way they were loaded row by row, into temp_load_file_c"""
+    reverse = re.compile(r"(_(cpe|fyb)$)|^transaction_obligated_amount$")
+    tas_rendering_labels = get_tas_rendering_labels([row.get("tas_id") for row in rows], db_cursor)
 
-        if fain_award_count != 1:
-            del filters["fain"]
-            filters["uri"] = uri
+    buffer = io.StringIO()
+    for load_index, row in enumerate(rows, first_load_index):
+        award_financial_data = FinancialAccountsByAwards()
+        value_map_faba = {
+            "award": None,
+            "submission": submission_attributes,
+            "reporting_period_start": submission_attributes.reporting_period_start,
+            "reporting_period_end": submission_attributes.reporting_period_end,
+            "treasury_account": None,
+            "object_class": row.get("object_class"),
+            "program_activity": row.get("program_activity"),
+            "disaster_emergency_fund": None,
+        }
+        load_data_into_model(award_financial_data, row, value_map=value_map_faba, reverse=reverse)
+        award_financial_data.disaster_emergency_fund_id = row.get("disaster_emergency_fund_code")
+
+        tas_id = row.get("tas_id")
+        values = [load_index, str(tas_id), tas_rendering_labels[tas_id]] + [
+            field.get_db_prep_save(field.pre_save(award_financial_data, True), connection) for field in FILE_C_COLUMNS
+        ]
+        buffer.write("\t".join(format_value_for_copy(value) for value in values))
+        buffer.write("\n")
+
+    buffer.seek(0)
+    cursor.copy_expert(
+        f"COPY temp_load_file_c (load_index, tas_id, tas_rendering_label, {_file_c_column_list()}) FROM STDIN", buffer
+    )
 
-    awards = Award.objects.filter(**filters).all()
 
-    if len(awards) == 1:
-        return awards[0]
-    else:
-        return None
+def _file_c_column_list():
+    return ", ".join(f'"{field.column}"' for field in FILE_C_COLUMNS)
 
 
 def load_file_c(submission_attributes, db_cursor, certified_award_financial):
@@ -515,84 +685,50 @@ def load_file_c(submission_attributes, db_cursor, certified_award_financial):
     Process and load file C broker data.
     Note: this should run AFTER the D1 and D2 files are loaded because we try to join to those records to retrieve some
     additional information about the awarding sub-tier agency.
-    """
-    # this matches the file b reverse directive, but am repeating it here to ensure that we don't overwrite it as we
-    # change up the order of file loading
 
+    The rows are staged in a temp table in batches, their TAS and awards are then matched with one statement each, and
+    they are written to financial_accounts_by_awards with a single INSERT ... SELECT.
+    """
     if certified_award_financial.count == 0:
         logger.warning("No File C (award financial) data found, skipping...")
         return
 
-    reverse = re.compile(r"(_(cpe|fyb)$)|^transaction_obligated_amount$")
-
-    # dictionary to capture TAS that were skipped and some metadata
-    # tas = top-level key
-    # count = number of rows skipped
-    # rows = row numbers skipped, corresponding to the original row numbers in the file that was submitted
-    skipped_tas = {}
     total_rows = certified_award_financial.count
     start_time = datetime.now()
-    awards_touched = []
-
-    for index, row in enumerate(certified_award_financial, 1):
-        if not (index % 100):
-            logger.info(f"C File Load: Loading row {index:,} of {total_rows:,} ({datetime.now() - start_time})")
-
-        upper_case_dict_values(row)
-
-        # Check and see if there is an entry for this TAS
-        treasury_account, tas_rendering_label = get_treasury_appropriation_account_tas_lookup(
-            row.get("tas_id"), db_cursor
-        )
-        if treasury_account is None:
-            update_skipped_tas(row, tas_rendering_label, skipped_tas)
-            continue
-
-        # Find a matching transaction record, so we can use its subtier agency information to match to (or create) an
-        # Award record.
-
-        # Find the award that this award transaction belongs to. If it doesn't exist, create it.
-        filters = {}
-        if row.get("piid"):
-            filters["piid"] = row.get("piid")
-            filters["parent_piid"] = row.get("parent_award_id")
-        else:
-            if row.get("fain") and not row.get("uri"):
-                filters["fain"] = row.get("fain")
-            elif row.get("uri") and not row.get("fain"):
-                filters["uri"] = row.get("uri")
-            else:
-                filters["fain"] = row.get("fain")
-                filters["uri"] = row.get("uri")
-
-        award = find_matching_award(**filters)
-
-        if award:
-            awards_touched += [award]
-
-        award_financial_data = FinancialAccountsByAwards()
-
-        value_map_faba = {
-            "award": award,
-            "submission": submission_attributes,
-            "reporting_period_start": submission_attributes.reporting_period_start,
-            "reporting_period_end": submission_attributes.reporting_period_end,
-            "treasury_account": treasury_account,
-            "object_class": row.get("object_class"),
-            "program_activity": row.get("program_activity"),
-            "disaster_emergency_fund": get_disaster_emergency_fund(row),
-        }
-
-        # Still using the cpe|fyb regex compiled above for reverse
-        load_data_into_model(award_financial_data, row, value_map=value_map_faba, save=True, reverse=reverse)
-
-    for key in skipped_tas:
-        logger.info(f"Skipped {skipped_tas[key]['count']:,} rows due to missing TAS: {key}")
-
-    total_tas_skipped = 0
-    for key in skipped_tas:
-        total_tas_skipped += skipped_tas[key]["count"]
-
-    logger.info(f"Skipped a total of {total_tas_skipped:,} TAS rows for File C")
-
-    return [award.id for award in awards_touched if award]
+    batch_size = CertifiedAwardFinancialIterator.chunk_size
+
+    with connection.cursor() as cursor:
+        cursor.execute(CREATE_TEMP_FILE_C_TABLE_SQL.format(columns=_file_c_column_list()))
+
+        batch, staged = [], 0
+        for row in certified_award_financial:
+            upper_case_dict_values(row)
+            batch.append(row)
+            if len(batch) == batch_size:
+                stage_file_c_rows(cursor, batch, staged, submission_attributes, db_cursor)
+                staged += len(batch)
+                batch = []
+                logger.info(f"C File Load: Staged row {staged:,} of {total_rows:,} ({datetime.now() - start_time})")
+        if batch:
+            stage_file_c_rows(cursor, batch, staged, submission_attributes, db_cursor)
+        cursor.execute("analyze temp_load_file_c")
+
+        cursor.execute(MATCH_TREASURY_ACCOUNTS_SQL)
+        cursor.execute(DELETE_SKIPPED_TAS_SQL)
+        skipped_tas = Counter(row[0] for row in cursor.fetchall())
+        for key, count in skipped_tas.items():
+            logger.info(f"Skipped {count:,} rows due to missing TAS: {key}")
+        logger.info(f"Skipped a total of {sum(skipped_tas.values()):,} TAS rows for File C")
+
+        cursor.execute(MATCH_AWARDS_SQL)
+        logger.info(f"C File Load: Matched {cursor.rowcount:,} rows to awards ({datetime.now() - start_time})")
+        cursor.execute(CLEAR_UNKNOWN_DEFC_SQL)
+
+        cursor.execute(INSERT_FILE_C_SQL.format(columns=_file_c_column_list()))
+        logger.info(f"C File Load: Inserted {cursor.rowcount:,} rows ({datetime.now() - start_time})")
+
+        cursor.execute("select distinct award_id from temp_load_file_c where award_id is not null")
+        awards_touched = [row[0] for row in cursor.fetchall()]
+        cursor.execute("drop table temp_load_file_c")
+
+    return awards_touched
@@ -2,66 +2,25 @@ import numpy as np
 import pandas as pd
 
 from collections import deque
+from contextlib import contextmanager
 from datetime import timedelta
 from django.conf import settings
 from django.db import connections
 from django.db.models import Max
 from django.utils.functional import cached_property
+from time import perf_counter
 from usaspending_api.references.models import ObjectClass, RefProgramActivity, DisasterEmergencyFundCode
 from usaspending_api.submissions.models import SubmissionAttributes
 
 
-class Bunch:
-    """Generic class to hold a group of attributes."""
-
-    def __init__(self, **kwds):
-        self.__dict__.update(kwds)
-
-
-def get_or_create_program_activity(row, submission_attributes):
-    # We do it this way rather than .get_or_create because we do not want to duplicate existing pk's with null values
-    filters = {
-        "program_activity_code": row["program_activity_code"],
-        "program_activity_name": row["program_activity_name"].upper()
-        if row["program_activity_name"]
-        else row["program_activity_name"],
-        "budget_year": submission_attributes.reporting_fiscal_year,
-        "responsible_agency_id": row["agency_identifier"],
-        "allocation_transfer_agency_id": row["allocation_transfer_agency"],
-        "main_account_code": row["main_account_code"],
-    }
-    prg_activity = RefProgramActivity.objects.filter(**filters).first()
-    if prg_activity is None and row["program_activity_code"] is not None:
-        # If the PA has a blank name, create it with the value in the row.
-        # PA loader should overwrite the names for the unique PAs from the official
-        # domain values list if the title needs updating, but for now grab it from the submission
-        prg_activity = RefProgramActivity.objects.create(**filters)
-        # logger.warning('Created missing program activity record for {}'.format(str(filters)))
-
-    return prg_activity
-
-
-def get_disaster_emergency_fund(row):
-    """ ENABLE_CARES_ACT_FEATURES: Once disaster_emergency_fund_code goes live in Broker, remove this if statement. """
-    if "disaster_emergency_fund_code" in row:
-        return DisasterEmergencyFundCode.objects.filter(code=row["disaster_emergency_fund_code"]).first()
-    else:
-        return None
-
-
-def get_object_class_row(row):
-    """Lookup an object class record.
-
-       (As ``get_object_class``, but arguments are bunched into a ``row`` object.)
-
-        Args:
-            row.object_class: object class from the broker
-            row.by_direct_reimbursable_fun: direct/reimbursable flag from the broker
-                (used only when the object_class is 3 digits instead of 4)
+def get_object_class_key(row_object_class, row_direct_reimbursable):
+    """
+    The object class and direct/reimbursable flag of an ObjectClass record, from a broker row's object class and
+    direct/reimbursable flag (used only when the object_class is 3 digits instead of 4)
     """
 
     # Object classes are numeric strings so let's ensure the one we're passed is actually a string before we begin.
-    object_class = str(row.object_class).zfill(3) if type(row.object_class) is int else row.object_class
+    object_class = str(row_object_class).zfill(3) if type(row_object_class) is int else row_object_class
 
     # As per DEV-4030, "000" object class is a special case due to common spreadsheet mangling issues.  If
     # we receive an object class that is all zeroes, convert it to "000".  This also handles the special
@@ -79,7 +38,7 @@ def get_object_class_row(row):
     else:
         # the object class field is the 3 digit version, so grab direct/reimbursable information from a separate field
         try:
-            direct_reimbursable = ocdr.BY_DIRECT_REIMBURSABLE_FUN_MAPPING[row.by_direct_reimbursable_fun]
+            direct_reimbursable = ocdr.BY_DIRECT_REIMBURSABLE_FUN_MAPPING[row_direct_reimbursable]
         except KeyError:
             # So Broker sort of validates this data, but not really.  It warns submitters that their data
             # is bad but doesn't force them to actually fix it.  As such, we are going to just ignore
@@ -87,33 +46,117 @@ def get_object_class_row(row):
             # and I don't have a better one.
             direct_reimbursable = None
 
-    # This will throw an exception if the object class does not exist which is the new desired behavior.
-    try:
-        return ObjectClass.objects.get(object_class=object_class, direct_reimbursable=direct_reimbursable)
-    except ObjectClass.DoesNotExist:
-        raise ObjectClass.DoesNotExist(
-            f"Unable to find object class for object_class={object_class}, direct_reimbursable={direct_reimbursable}."
-        )
-
+    return object_class, direct_reimbursable
 
-def get_object_class(row_object_class, row_direct_reimbursable):
-    """Lookup an object class record.
 
-        Args:
-            row_object_class: object class from the broker
-            row_direct_reimbursable: direct/reimbursable flag from the broker
-                (used only when the object_class is 3 digits instead of 4)
+class SubmissionLookupCache:
+    """
+    Object classes, program activities and DEFC for the rows of one submission.  These reference tables are small, so
+    they are read once when the submission starts loading rather than queried for every row.
     """
 
-    row = Bunch(object_class=row_object_class, by_direct_reimbursable_fun=row_direct_reimbursable)
-    return get_object_class_row(row)
+    program_activity_fields = (
+        "program_activity_code",
+        "program_activity_name",
+        "budget_year",
+        "responsible_agency_id",
+        "allocation_transfer_agency_id",
+        "main_account_code",
+    )
+
+    def __init__(self, submission_attributes):
+        self.budget_year = str(submission_attributes.reporting_fiscal_year)
+        self.object_classes = {(oc.object_class, oc.direct_reimbursable): oc for oc in ObjectClass.objects.all()}
+        self.disaster_emergency_funds = {defc.code: defc for defc in DisasterEmergencyFundCode.objects.all()}
+
+        # Ordered so that the lowest id is kept for duplicates, as first() would
+        self.program_activities = {}
+        for program_activity in RefProgramActivity.objects.filter(budget_year=self.budget_year).order_by("-id"):
+            key = tuple(getattr(program_activity, field) for field in self.program_activity_fields)
+            self.program_activities[key] = program_activity
+
+    def get_object_class(self, row_object_class, row_direct_reimbursable):
+        """This will throw an exception if the object class does not exist which is the new desired behavior."""
+        object_class, direct_reimbursable = get_object_class_key(row_object_class, row_direct_reimbursable)
+        try:
+            return self.object_classes[(object_class, direct_reimbursable)]
+        except KeyError:
+            raise ObjectClass.DoesNotExist(
+                f"Unable to find object class for object_class={object_class}, direct_reimbursable={direct_reimbursable}."
+            )
+
+    def _program_activity_filters(self, row):
+        return {
+            "program_activity_code": row["program_activity_code"],
+            "program_activity_name": row["program_activity_name"].upper()
+            if row["program_activity_name"]
+            else row["program_activity_name"],
+            "budget_year": self.budget_year,
+            "responsible_agency_id": row["agency_identifier"],
+            "allocation_transfer_agency_id": row["allocation_transfer_agency"],
+            "main_account_code": row["main_account_code"],
+        }
+
+    def create_missing_program_activities(self, rows):
+        """
+        Create, in one INSERT, the program activities of rows that are not in RefProgramActivity yet.  PA loader should
+        overwrite the names for the unique PAs from the official domain values list if the title needs updating, but
+        for now grab it from the submission.  Rows without a program activity code do not get one.
+        """
+        missing = {}
+        for row in rows:
+            filters = self._program_activity_filters(row)
+            key = tuple(filters.values())
+            if key not in self.program_activities and filters["program_activity_code"] is not None:
+                missing[key] = RefProgramActivity(**filters)
+
+        for program_activity in RefProgramActivity.objects.bulk_create(missing.values()):
+            key = tuple(getattr(program_activity, field) for field in self.program_activity_fields)
+            self.program_activities[key] = program_activity
+
+    def get_program_activity(self, row):
+        """Call create_missing_program_activities for the row first"""
+        return self.program_activities.get(tuple(self._program_activity_filters(row).values()))
+
+    def get_disaster_emergency_fund(self, row):
+        """ENABLE_CARES_ACT_FEATURES: Once disaster_emergency_fund_code goes live in Broker, remove this if statement."""
+        if "disaster_emergency_fund_code" in row:
+            return self.disaster_emergency_funds.get(row["disaster_emergency_fund_code"])
+        else:
+            return None
+
+
+class LoadReport:
+    """Rows written and time spent in each phase of loading one file, logged once the file is loaded"""
+
+    def __init__(self, file_name):
+        self.file_name = file_name
+        self.phases = {}
+        self.rows_written = 0
+        self.rows_skipped = 0
+
+    @contextmanager
+    def phase(self, name):
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + perf_counter() - start
+
+    def log(self, logger):
+        phases = ", ".join(f"{name} {seconds:.2f}s" for name, seconds in self.phases.items())
+        logger.info(
+            f"{self.file_name}: wrote {self.rows_written:,} rows, skipped {self.rows_skipped:,} "
+            f"in {sum(self.phases.values()):.2f}s ({phases})"
+        )
 
 
 class CertifiedAwardFinancialIterator:
     chunk_size = 100000
 
-    def __init__(self, submission_attributes):
+    def __init__(self, submission_attributes, lookup_cache):
         self.submission_attributes = submission_attributes
+        self.lookup_cache = lookup_cache
 
         # For managing state.
         self._last_id = None
@@ -141,9 +184,12 @@ class CertifiedAwardFinancialIterator:
         award_financial_frame = pd.read_sql(sql, connections["data_broker"])
 
         if award_financial_frame.size > 0:
-            award_financial_frame["object_class"] = award_financial_frame.apply(get_object_class_row, axis=1)
+            award_financial_frame["object_class"] = award_financial_frame.apply(
+                lambda row: self.lookup_cache.get_object_class(row.object_class, row.by_direct_reimbursable_fun), axis=1
+            )
+            self.lookup_cache.create_missing_program_activities(award_financial_frame.to_dict(orient="records"))
             award_financial_frame["program_activity"] = award_financial_frame.apply(
-                get_or_create_program_activity, axis=1, submission_attributes=self.submission_attributes
+                self.lookup_cache.get_program_activity, axis=1
             )
             award_financial_frame = award_financial_frame.replace({np.nan: None})
 
@@ -165,8 +211,9 @@ class CertifiedAwardFinancialIterator:
 class CertifiedAwardFinancial:
     """ Abstract away the messy details of how we retrieve and prepare certified_award_financial rows. """
 
-    def __init__(self, submission_attributes):
+    def __init__(self, submission_attributes, lookup_cache):
         self.submission_attributes = submission_attributes
+        self.lookup_cache = lookup_cache
 
     @cached_property
     def count(self):
@@ -189,7 +236,7 @@ class CertifiedAwardFinancial:
             return cursor.fetchall()[0][0]
 
     def __iter__(self):
-        return CertifiedAwardFinancialIterator(self.submission_attributes)
+        return CertifiedAwardFinancialIterator(self.submission_attributes, self.lookup_cache)
 
 
 def calculate_load_submissions_since_datetime():
@@ -1,6 +1,8 @@
+from django.core.management import call_command
+from django.db import connections
 from multiprocessing import Process, Queue
+from multiprocessing.connection import wait
 from pathlib import Path
-from time import sleep
 
 from usaspending_api import settings
 from usaspending_api.broker.helpers.last_load_date import update_last_load_date
@@ -25,8 +27,18 @@ class Rapidloader:
         self.elasticsearch_client = elasticsearch_client
 
     def run_load_steps(self) -> None:
+        download_workers = self.config.get("download_workers", 1)
+        ingest_workers = self.config.get("ingest_workers", 1)
+        streaming = self.config.get("stream")
+
         download_queue = Queue()  # Queue for jobs which need a csv downloaded
-        es_ingest_queue = Queue(20)  # Queue for jobs which have a csv and are ready for ES ingest
+        if streaming:
+            # Streamed jobs read straight from the database during ES ingest so there is nothing to download first
+            es_ingest_queue = Queue()
+        else:
+            # Queue for jobs which have a csv and are ready for ES ingest.  Bounded so downloads block (rather than
+            # fill the disk) when indexing falls behind
+            es_ingest_queue = Queue(max(20, ingest_workers))
 
         job_number = 0
         for fiscal_year in self.config["fiscal_years"]:
@@ -40,47 +52,73 @@ class Rapidloader:
 
             if Path(filename).exists():
                 Path(filename).unlink()
-            download_queue.put(new_job)
+            (es_ingest_queue if streaming else download_queue).put(new_job)
 
         printf({"msg": "There are {} jobs to process".format(job_number)})
 
-        process_list = [
-            Process(
-                name="Download Process",
-                target=download_db_records,
-                args=(download_queue, es_ingest_queue, self.config),
-            ),
+        if self.config["create_new_index"]:
+            # ensure template for index is present and the latest version
+            call_command("es_configure", "--template-only", "--load_type={}".format(self.config["load_type"]))
+
+        download_processes = []
+        if not streaming:
+            for worker in range(download_workers):
+                # Each download process exits once it reads one of these "Null Jobs"
+                download_queue.put(DataJob(None, None, None, None))
+                download_processes.append(
+                    Process(
+                        name="Download Process {}".format(worker + 1),
+                        target=download_db_records,
+                        args=(download_queue, es_ingest_queue, self.config),
+                    )
+                )
+        ingest_processes = [
             Process(
-                name="ES Index Process",
+                name="ES Index Process {}".format(worker + 1),
                 target=es_data_loader,
-                args=(self.elasticsearch_client, download_queue, es_ingest_queue, self.config),
-            ),
+                args=(es_ingest_queue, self.config),
+            )
+            for worker in range(ingest_workers)
         ]
+        process_list = download_processes + ingest_processes
 
-        process_list[0].start()  # Start Download process
+        # Forked processes must open their own database connections rather than share the parent's
+        connections.close_all()
+        for process in download_processes:
+            process.start()
 
         if self.config["process_deletes"]:
-            process_list.append(
-                Process(
-                    name="S3 Deleted Records Scrapper Process",
-                    target=deleted_transactions if self.config["load_type"] == "transactions" else deleted_awards,
-                    args=(self.elasticsearch_client, self.config),
-                )
+            deletes_process = Process(
+                name="S3 Deleted Records Scrapper Process",
+                target=deleted_transactions if self.config["load_type"] == "transactions" else deleted_awards,
+                args=(self.elasticsearch_client, self.config),
             )
-            process_list[-1].start()  # start S3 csv fetch proces
-            while process_list[-1].is_alive():
-                printf({"msg": "Waiting to start ES ingest until S3 deletes are complete"})
-                sleep(7)
+            process_list.append(deletes_process)
+            printf({"msg": "Waiting to start ES ingest until S3 deletes are complete"})
+            deletes_process.start()
+            deletes_process.join()
+            if process_guarddog(download_processes + [deletes_process]):
+                raise SystemExit("Fatal error: review logs to determine why process died.")
 
-        process_list[1].start()  # start ES ingest process
+        for process in ingest_processes:
+            process.start()
 
+        ingest_released = False
         while True:
-            sleep(10)
             if process_guarddog(process_list):
                 raise SystemExit("Fatal error: review logs to determine why process died.")
-            elif all([not x.is_alive() for x in process_list]):
+
+            if not ingest_released and all(process.exitcode == 0 for process in download_processes):
+                # Every job is on the ingest queue so the "Null Jobs" go behind them, one per ingest process
+                for _ in ingest_processes:
+                    es_ingest_queue.put(DataJob(None, None, None, None))
+                ingest_released = True
+
+            running = [process.sentinel for process in process_list if process.is_alive()]
+            if not running:
                 printf({"msg": "All ETL processes completed execution with no error codes"})
                 break
+            wait(running)  # blocks until at least one process exits
 
     def complete_process(self) -> None:
         if self.config["create_new_index"]:
@@ -0,0 +1,51 @@
+import pytest
+
+from django.db import connection
+from model_mommy import mommy
+
+from usaspending_api.etl.management.commands.load_submission import (
+    _file_c_column_list,
+    CREATE_TEMP_FILE_C_TABLE_SQL,
+    MATCH_AWARDS_SQL,
+)
+
+
+def _match(rows):
+    with connection.cursor() as cursor:
+        cursor.execute(CREATE_TEMP_FILE_C_TABLE_SQL.format(columns=_file_c_column_list()))
+        for load_index, (piid, parent_award_id, fain, uri) in enumerate(rows):
+            cursor.execute(
+                "insert into temp_load_file_c (load_index, piid, parent_award_id, fain, uri) values (%s, %s, %s, %s, %s)",
+                [load_index, piid, parent_award_id, fain, uri],
+            )
+        cursor.execute(MATCH_AWARDS_SQL)
+        cursor.execute("select award_id from temp_load_file_c order by load_index")
+        return [row[0] for row in cursor.fetchall()]
+
+
+@pytest.mark.django_db
+def test_match_awards():
+    transaction = mommy.make("awards.TransactionNormalized")
+    mommy.make("awards.Award", id=1, piid="PIID1", parent_award_piid="PARENT1", latest_transaction=transaction)
+    mommy.make("awards.Award", id=2, piid="PIID1", parent_award_piid="PARENT2", latest_transaction=transaction)
+    mommy.make("awards.Award", id=3, piid="PIID3", latest_transaction=transaction)
+    mommy.make("awards.Award", id=4, piid="PIID4")  # No latest transaction, so never matched
+    mommy.make("awards.Award", id=5, fain="FAIN5", uri="URI5", latest_transaction=transaction)
+    mommy.make("awards.Award", id=6, fain="FAIN6", latest_transaction=transaction)
+    mommy.make("awards.Award", id=7, fain="FAIN6", uri="URI7", latest_transaction=transaction)
+
+    assert _match(
+        [
+            ("PIID1", "PARENT2", None, None),
+            ("PIID1", None, None, None),  # Two awards have this piid
+            ("PIID3", "", None, None),
+            ("PIID4", None, None, None),
+            ("PIID3", None, "FAIN5", None),  # The piid decides
+            (None, None, "FAIN5", None),
+            (None, None, None, "URI5"),
+            (None, None, "FAIN5", "URI7"),  # A unique fain match is preferred
+            (None, None, "FAIN6", "URI7"),  # Falling back to the uri when the fain is not unique
+            (None, None, "FAIN6", None),
+            (None, None, None, None),
+        ]
+    ) == [2, None, 3, None, 3, 5, 5, 5, 7, None, None]
@@ -2,7 +2,12 @@ import pytest
 
 from datetime import datetime, timedelta, timezone
 from model_mommy import mommy
-from usaspending_api.etl.management.helpers.load_submission import calculate_load_submissions_since_datetime
+from usaspending_api.etl.management.commands import load_submission
+from usaspending_api.etl.management.helpers.load_submission import (
+    calculate_load_submissions_since_datetime,
+    SubmissionLookupCache,
+)
+from usaspending_api.references.models import ObjectClass, RefProgramActivity
 
 
 @pytest.mark.django_db
@@ -14,3 +19,70 @@ def test_calculate_load_submissions_since_datetime():
 
     mommy.make("submissions.SubmissionAttributes", published_date="2000-01-01")
     assert calculate_load_submissions_since_datetime() == datetime(2000, 1, 1, tzinfo=timezone.utc) - timedelta(days=7)
+
+
+@pytest.mark.django_db
+def test_submission_lookup_cache(django_assert_num_queries):
+    object_class = mommy.make("references.ObjectClass", object_class="111", direct_reimbursable="D")
+    mommy.make("references.ObjectClass", object_class="000", direct_reimbursable=None)
+    defc = mommy.make("references.DisasterEmergencyFundCode", code="L")
+    existing = mommy.make(
+        "references.RefProgramActivity",
+        program_activity_code="0001",
+        program_activity_name="EXISTING",
+        budget_year="2020",
+        responsible_agency_id="020",
+        allocation_transfer_agency_id=None,
+        main_account_code="0100",
+    )
+    submission = mommy.make("submissions.SubmissionAttributes", reporting_fiscal_year=2020)
+
+    lookup_cache = SubmissionLookupCache(submission)
+    rows = [
+        {
+            "program_activity_code": code,
+            "program_activity_name": name,
+            "agency_identifier": "020",
+            "allocation_transfer_agency": None,
+            "main_account_code": "0100",
+            "disaster_emergency_fund_code": "L",
+        }
+        for code, name in [("0001", "Existing"), ("0002", "new"), ("0002", "NEW"), (None, "no code")]
+    ]
+
+    with django_assert_num_queries(1):
+        lookup_cache.create_missing_program_activities(rows)
+        assert lookup_cache.get_object_class("1111", None) == object_class
+        assert lookup_cache.get_object_class("111", "d") == object_class
+        assert lookup_cache.get_object_class("0", None).object_class == "000"
+        assert lookup_cache.get_program_activity(rows[0]) == existing
+        assert lookup_cache.get_program_activity(rows[1]) == lookup_cache.get_program_activity(rows[2])
+        assert lookup_cache.get_program_activity(rows[3]) is None
+        assert lookup_cache.get_disaster_emergency_fund(rows[0]) == defc
+        assert lookup_cache.get_disaster_emergency_fund({}) is None
+
+    assert RefProgramActivity.objects.filter(program_activity_code="0002", program_activity_name="NEW").count() == 1
+
+    with pytest.raises(ObjectClass.DoesNotExist):
+        lookup_cache.get_object_class("2111", None)
+
+
+@pytest.mark.django_db
+def test_load_file_b_skipped_tas_creates_no_program_activities(monkeypatch):
+    monkeypatch.setattr(load_submission, "get_tas_rendering_labels", lambda tas_ids, db_cursor: dict.fromkeys(tas_ids))
+    submission = mommy.make("submissions.SubmissionAttributes", reporting_fiscal_year=2020)
+    rows = [
+        {
+            "row_number": 1,
+            "tas_id": -1,
+            "program_activity_code": "0003",
+            "program_activity_name": "UNKNOWN TAS",
+            "agency_identifier": "020",
+            "allocation_transfer_agency": None,
+            "main_account_code": "0100",
+        }
+    ]
+
+    load_submission.load_file_b(submission, rows, None, SubmissionLookupCache(submission))
+
+    assert not RefProgramActivity.objects.filter(program_activity_code="0003").exists()
@@ -0,0 +1,155 @@
+import json
+import logging
+
+from collections import Counter
+from time import perf_counter
+from types import SimpleNamespace
+
+from elasticsearch.serializer import JSONSerializer
+
+from usaspending_api.etl.es_etl_helpers import (
+    delete_from_es,
+    get_deleted_award_ids,
+    get_exact_match_field,
+    UNIVERSAL_AWARD_ID_NAME,
+    UNIVERSAL_TRANSACTION_ID_NAME,
+)
+
+logger = logging.getLogger("console")
+
+INDEX_NAME = "test-transactions"
+
+config = {"root_index": "transaction-query", "max_query_size": 10000}
+
+
+class LocalElasticsearch:
+    """
+    In-memory stand-in for the few Elasticsearch APIs used by the delete path.  Every request is counted so tests can
+    check how many round trips and refreshes a delete costs.
+    """
+
+    def __init__(self, documents, field_types):
+        self.documents = {str(i): document for i, document in enumerate(documents)}
+        self.field_types = field_types
+        self.requests = Counter()
+        self.transport = SimpleNamespace(serializer=JSONSerializer())
+        self.indices = SimpleNamespace(get_field_mapping=self._get_field_mapping, refresh=self._refresh)
+
+    def _get_field_mapping(self, fields, index):
+        self.requests["get_field_mapping"] += 1
+        mappings = {
+            field: {"full_name": field, "mapping": {field.split(".")[-1]: {"type": self.field_types[field]}}}
+            for field in fields.split(",")
+            if field in self.field_types
+        }
+        return {INDEX_NAME: {"mappings": mappings}}
+
+    def _refresh(self, index):
+        self.requests["refresh"] += 1
+
+    def _matches(self, document, query):
+        if "terms" in query:
+            ((field, values),) = query["terms"].items()
+            return str(document.get(field.replace(".keyword", ""))) in values
+        phrases = [clause["match_phrase"] for clause in query["bool"]["should"][0]]
+        return any(str(document.get(field)) == value for phrase in phrases for field, value in phrase.items())
+
+    def search(self, index, body, size):
+        self.requests["search"] += 1
+        body = json.loads(body)
+        hits = [
+            {
+                "_index": INDEX_NAME,
+                "_id": doc_id,
+                "_routing": document["recipient_agg_key"],
+                "_source": {k: document[k] for k in body["_source"]} if body["_source"] else {},
+            }
+            for doc_id, document in self.documents.items()
+            if self._matches(document, body["query"])
+        ]
+        return {"hits": {"total": {"value": len(hits)}, "hits": hits[:size]}}
+
+    def bulk(self, body, *args, **kwargs):
+        self.requests["bulk"] += 1
+        items = []
+        for line in body.splitlines():
+            action = json.loads(line)["delete"]
+            found = self.documents.pop(action["_id"], None) is not None
+            assert action["routing"], "routed documents must be deleted with their routing key"
+            items.append({"delete": {**action, "status": 200 if found else 404}})
+        return {"errors": any(i["delete"]["status"] != 200 for i in items), "items": items}
+
+
+def make_documents(count):
+    return [
+        {
+            UNIVERSAL_TRANSACTION_ID_NAME: "CONT_TX_{}".format(i),
+            UNIVERSAL_AWARD_ID_NAME: "CONT_AWD_{}".format(i // 3),
+            "recipient_agg_key": "recipient-{}".format(i % 7),
+        }
+        for i in range(count)
+    ]
+
+
+def transaction_id_list(documents):
+    return [{"key": d[UNIVERSAL_TRANSACTION_ID_NAME], "col": UNIVERSAL_TRANSACTION_ID_NAME} for d in documents]
+
+
+def test_get_exact_match_field():
+    client = LocalElasticsearch([], {UNIVERSAL_TRANSACTION_ID_NAME: "text"})
+    assert get_exact_match_field(client, INDEX_NAME, UNIVERSAL_TRANSACTION_ID_NAME) is None
+
+    client.field_types["{}.keyword".format(UNIVERSAL_TRANSACTION_ID_NAME)] = "keyword"
+    field = get_exact_match_field(client, INDEX_NAME, UNIVERSAL_TRANSACTION_ID_NAME)
+    assert field == "{}.keyword".format(UNIVERSAL_TRANSACTION_ID_NAME)
+
+    client = LocalElasticsearch([], {"transaction_id": "integer"})
+    assert get_exact_match_field(client, INDEX_NAME, "transaction_id") == "transaction_id"
+
+
+def test_delete_from_es_refreshes_once():
+    documents = make_documents(2500)
+    client = LocalElasticsearch(documents, {UNIVERSAL_TRANSACTION_ID_NAME: "keyword"})
+
+    deleted = delete_from_es(client, transaction_id_list(documents[:2100]), None, config, INDEX_NAME)
+
+    assert deleted == 2100
+    assert len(client.documents) == 400
+    assert client.requests == Counter({"get_field_mapping": 1, "search": 3, "bulk": 3, "refresh": 1})
+
+
+def test_delete_from_es_text_only_field():
+    documents = make_documents(20)
+    client = LocalElasticsearch(documents, {UNIVERSAL_TRANSACTION_ID_NAME: "text"})
+
+    deleted = delete_from_es(client, transaction_id_list(documents[5:10]), None, config, INDEX_NAME)
+
+    assert deleted == 5
+    assert set(client.documents) == {str(i) for i in range(20) if not 5 <= i < 10}
+
+
+def test_get_deleted_award_ids_accumulates_across_slices():
+    documents = make_documents(3000)
+    client = LocalElasticsearch(documents, {UNIVERSAL_TRANSACTION_ID_NAME: "keyword"})
+
+    award_ids = get_deleted_award_ids(client, transaction_id_list(documents), config, INDEX_NAME)
+
+    assert client.requests["search"] == 3
+    assert award_ids == ["CONT_AWD_{}".format(i) for i in range(1000)]
+
+
+def test_delete_from_es_benchmark():
+    """Not a pass/fail check; logs delete throughput against the local stand-in"""
+    documents = make_documents(20000)
+    client = LocalElasticsearch(documents, {UNIVERSAL_TRANSACTION_ID_NAME: "keyword"})
+
+    start = perf_counter()
+    deleted = delete_from_es(client, transaction_id_list(documents), None, config, INDEX_NAME)
+    elapsed = perf_counter() - start
+
+    assert deleted == 20000
+    logger.info(
+        "Deleted {:,} documents in {:.3f}s ({:,.0f} ids/s) using {}".format(
+            deleted, elapsed, deleted / elapsed, dict(client.requests)
+        )
+    )
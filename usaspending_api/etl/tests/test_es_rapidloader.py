@@ -4,10 +4,22 @@ from collections import OrderedDict
 from datetime import datetime, timezone
 from model_mommy import mommy
 from pathlib import Path
+from queue import Queue
+from types import SimpleNamespace
+from unittest.mock import patch
 from usaspending_api.common.elasticsearch.client import instantiate_elasticsearch_client
 from usaspending_api.common.helpers.sql_helpers import execute_sql_to_ordered_dictionary
 from usaspending_api.common.helpers.text_helpers import generate_random_string
-from usaspending_api.etl.es_etl_helpers import configure_sql_strings, check_awards_for_deletes, get_deleted_award_ids
+from usaspending_api.etl.es_etl_helpers import (
+    check_awards_for_deletes,
+    configure_sql_strings,
+    configure_stream_sql,
+    convert_db_row_to_document,
+    DataJob,
+    download_db_records,
+    get_deleted_award_ids,
+    prepare_es_chunks,
+)
 from usaspending_api.etl.rapidloader import Rapidloader
 
 
@@ -85,21 +97,6 @@ def award_data_fixture(db):
     mommy.make("awards.FinancialAccountsByAwards", financial_accounts_by_awards_id=1, award_id=1, treasury_account_id=1)
 
 
-@pytest.fixture
-def baby_sleeps(monkeypatch):
-    """
-    If we don't do this, sleeps add about 2 minutes to the tests in this file.  Setting sleeps to
-    None or 0 was causing exceptions to be thrown, thus the 0.001 value.
-    """
-    from time import sleep
-
-    def _sleep(seconds):
-        sleep(0.001)
-
-    monkeypatch.setattr("usaspending_api.etl.es_etl_helpers.sleep", _sleep)
-    monkeypatch.setattr("usaspending_api.etl.rapidloader.sleep", _sleep)
-
-
 config = {
     "root_index": "award-query",
     "processing_start_datetime": datetime(2019, 12, 13, 16, 10, 33, 729108, tzinfo=timezone.utc),
@@ -120,7 +117,7 @@ config = {
 }
 
 
-def test_es_award_loader_class(award_data_fixture, elasticsearch_award_index, baby_sleeps):
+def test_es_award_loader_class(award_data_fixture, elasticsearch_award_index):
     elasticsearch_client = instantiate_elasticsearch_client()
     loader = Rapidloader(config, elasticsearch_client)
     assert loader.__class__.__name__ == "Rapidloader"
@@ -129,7 +126,7 @@ def test_es_award_loader_class(award_data_fixture, elasticsearch_award_index, ba
     elasticsearch_client.indices.delete(index=config["index_name"], ignore_unavailable=False)
 
 
-def test_es_transaction_loader_class(award_data_fixture, elasticsearch_transaction_index, baby_sleeps):
+def test_es_transaction_loader_class(award_data_fixture, elasticsearch_transaction_index):
     config["root_index"] = "transaction-query"
     config["load_type"] = "transactions"
     elasticsearch_client = instantiate_elasticsearch_client()
@@ -140,6 +137,53 @@ def test_es_transaction_loader_class(award_data_fixture, elasticsearch_transacti
     elasticsearch_client.indices.delete(index=config["index_name"], ignore_unavailable=False)
 
 
+def test_es_transaction_loader_class_streaming(award_data_fixture, elasticsearch_transaction_index):
+    streaming_config = {
+        **config,
+        "root_index": "transaction-query",
+        "load_type": "transactions",
+        "stream": True,
+        "index_threads": 2,
+    }
+    elasticsearch_client = instantiate_elasticsearch_client()
+    loader = Rapidloader(streaming_config, elasticsearch_client)
+    loader.run_load_steps()
+    assert elasticsearch_client.indices.exists(streaming_config["index_name"])
+    elasticsearch_client.indices.delete(index=streaming_config["index_name"], ignore_unavailable=False)
+
+
+def test_es_transaction_loader_class_multiple_workers(award_data_fixture, elasticsearch_transaction_index):
+    parallel_config = {
+        **config,
+        "root_index": "transaction-query",
+        "load_type": "transactions",
+        "download_workers": 3,
+        "ingest_workers": 2,
+    }
+    elasticsearch_client = instantiate_elasticsearch_client()
+    loader = Rapidloader(parallel_config, elasticsearch_client)
+    loader.run_load_steps()
+    assert elasticsearch_client.indices.exists(parallel_config["index_name"])
+    elasticsearch_client.indices.delete(index=parallel_config["index_name"], ignore_unavailable=False)
+
+
+def test_download_db_records_stops_at_null_job():
+    fetch_jobs, done_jobs = Queue(), Queue()
+    for job_number, fiscal_year in enumerate((2019, 2020), 1):
+        fetch_jobs.put(DataJob(job_number, "test-index", fiscal_year, "{}_transactions.csv".format(fiscal_year)))
+    fetch_jobs.put(DataJob(None, None, None, None))
+    fetch_jobs.put(DataJob(3, "test-index", 2021, "2021_transactions.csv"))
+
+    download_config = {**config, "load_type": "transactions"}
+    with patch("usaspending_api.etl.es_etl_helpers.download_csv", return_value=7) as download_csv:
+        download_db_records(fetch_jobs, done_jobs, download_config)
+
+    assert download_csv.call_count == 2
+    assert [(job.fy, job.count) for job in (done_jobs.get_nowait(), done_jobs.get_nowait())] == [(2019, 7), (2020, 7)]
+    assert done_jobs.empty()
+    assert fetch_jobs.get_nowait().fy == 2021
+
+
 def test_configure_sql_strings():
     config["fiscal_year"] = 2019
     config["root_index"] = "award-query"
@@ -184,3 +228,61 @@ def test_get_award_ids(award_data_fixture, elasticsearch_transaction_index):
     client = elasticsearch_transaction_index.client
     ids = get_deleted_award_ids(client, id_list, config, index=elasticsearch_transaction_index.index_name)
     assert ids == ["CONT_AWD_IND12PB00323"]
+
+
+def test_configure_stream_sql():
+    stream_config = {"starting_date": config["starting_date"], "fiscal_year": 2019, "load_type": "transactions"}
+    stream_sql = configure_stream_sql(stream_config, ["transaction_id", "tas_paths"])
+    assert (
+        stream_sql
+        == """
+SELECT "transaction_id"::TEXT AS "transaction_id", "tas_paths"::TEXT AS "tas_paths"
+FROM transaction_delta_view
+WHERE transaction_fiscal_year=2019 AND update_date >= '2007-10-01'
+"""
+    )
+
+
+def test_convert_db_row_to_document():
+    row = {
+        "transaction_id": "1",
+        "piid": "",
+        "fain": None,
+        "recipient_agg_key": "abc-123",
+        "business_categories": "{small_business,woman_owned_business}",
+        "tas_paths": "{}",
+        "tas_components": None,
+        "federal_accounts": '[{"id": 1, "account_title": null}]',
+    }
+    document = convert_db_row_to_document(row, "transactions")
+    assert document == {
+        "transaction_id": "1",
+        "piid": None,
+        "fain": None,
+        "recipient_agg_key": "abc-123",
+        "business_categories": ["small_business", "woman_owned_business"],
+        "tas_paths": None,
+        "tas_components": None,
+        "federal_accounts": ['{"account_title": "", "id": "1"}'],
+        "routing": "abc-123",
+    }
+
+    assert "routing" not in convert_db_row_to_document({"award_id": "1"}, "awards")
+
+
+def test_prepare_es_chunks_reads_one_chunk_at_a_time():
+    read = []
+
+    def chunk_generator():
+        for chunk in ([{"award_id": 1}], [], [{"award_id": 2}, {"award_id": 3}]):
+            read.append(len(chunk))
+            yield chunk
+
+    job = SimpleNamespace(name="job", index="index", count=3)
+    chunk_config = {"process_deletes": False, "load_type": "awards"}
+    chunks = prepare_es_chunks(None, job, chunk_config, chunk_generator(), 2)
+
+    assert next(chunks) == [{"award_id": 1}]
+    assert read == [1]
+    assert list(chunks) == [[{"award_id": 2}, {"award_id": 3}]]
+    assert read == [1, 0, 2]
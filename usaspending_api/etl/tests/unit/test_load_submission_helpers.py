@@ -0,0 +1,26 @@
+import logging
+
+from usaspending_api.etl.management.helpers.load_submission import get_object_class_key, LoadReport
+
+
+def test_get_object_class_key():
+    assert get_object_class_key("1111", None) == ("111", "D")
+    assert get_object_class_key("2111", "D") == ("111", "R")
+    assert get_object_class_key("111", "r") == ("111", "R")
+    assert get_object_class_key("111", "X") == ("111", None)
+    assert get_object_class_key(11, None) == ("011", None)
+    assert get_object_class_key("0000", "D") == ("000", "D")
+
+
+def test_load_report(caplog):
+    caplog.set_level(logging.INFO)
+    report = LoadReport("File A")
+    with report.phase("write"):
+        pass
+    with report.phase("write"):
+        pass
+    report.rows_written = 1234
+    report.log(logging.getLogger("test"))
+
+    assert list(report.phases) == ["write"]
+    assert "File A: wrote 1,234 rows, skipped 0 in" in caplog.text
@@ -1,12 +1,7 @@
-from datetime import datetime
-import os
-import re
-import boto3
-import csv
+from datetime import date, datetime
+import io
 import logging
 
-from django.conf import settings
-
 logger = logging.getLogger("console")
 
 
@@ -39,6 +34,47 @@ def format_value_for_sql(val, cur):
     return str(cur.mogrify("%s", (val,)), "utf-8")
 
 
+def format_array_for_copy(val):
+    """creates a postgres array literal for a list value (e.g. business_categories)"""
+    elements = []
+    for element in val:
+        if element is None:
+            elements.append("NULL")
+        else:
+            elements.append('"{}"'.format(str(element).replace("\\", "\\\\").replace('"', '\\"')))
+    return "{{{}}}".format(",".join(elements))
+
+
+def format_value_for_copy(val):
+    """creates text for a single field of a tab-delimited COPY ... FROM STDIN in postgres' default text format"""
+    if val is None:
+        return "\\N"
+    elif isinstance(val, bool):
+        val = "t" if val else "f"
+    elif isinstance(val, (list, tuple)):
+        val = format_array_for_copy(val)
+    elif isinstance(val, (datetime, date)):
+        val = val.isoformat()
+    else:
+        val = str(val)
+
+    return val.replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+
+
+def format_bulk_copy_buffer(load_objects, type, keys):
+    """
+    creates an in-memory buffer of load object values to stream into a temp table with COPY. Each row is prefixed
+    with the position of its load object so that set-based statements can preserve the order rows were extracted in
+    """
+    buffer = io.StringIO()
+    for load_index, load_object in enumerate(load_objects):
+        fields = [str(load_index)] + [format_value_for_copy(load_object[type][key]) for key in keys]
+        buffer.write("\t".join(fields))
+        buffer.write("\n")
+    buffer.seek(0)
+    return buffer
+
+
 def format_bulk_insert_list_column_sql(cursor, load_objects, type):
     """creates formatted sql text to put into a bulk insert statement"""
     keys = load_objects[0][type].keys()
@@ -69,59 +105,3 @@ def format_insert_or_update_column_sql(cursor, load_object, type):
     pairs_string = ",".join(update_pairs)
 
     return col_string, val_string, pairs_string
-
-
-def get_deleted_fpds_data_from_s3(date):
-    ids_to_delete = []
-    regex_str = ".*_delete_records_(IDV|award).*"
-
-    if not date:
-        return []
-
-    if settings.IS_LOCAL:
-        for file in os.listdir(settings.CSV_LOCAL_PATH):
-            if re.search(regex_str, file) and datetime.strptime(file[: file.find("_")], "%m-%d-%Y").date() >= date:
-                with open(settings.CSV_LOCAL_PATH + file, "r") as current_file:
-                    # open file, split string to array, skip the header
-                    reader = csv.reader(current_file.read().splitlines())
-                    next(reader)
-                    unique_key_list = [rows[0] for rows in reader]
-
-                    ids_to_delete += unique_key_list
-    else:
-        # Connect to AWS
-        aws_region = settings.USASPENDING_AWS_REGION
-        DELETED_TRANSACTION_JOURNAL_FILES = settings.DELETED_TRANSACTION_JOURNAL_FILES
-
-        if not (aws_region and DELETED_TRANSACTION_JOURNAL_FILES):
-            raise Exception(
-                "Missing required environment variables: USASPENDING_AWS_REGION, DELETED_TRANSACTION_JOURNAL_FILES"
-            )
-
-        s3client = boto3.client("s3", region_name=aws_region)
-        s3resource = boto3.resource("s3", region_name=aws_region)
-        s3_bucket = s3resource.Bucket(DELETED_TRANSACTION_JOURNAL_FILES)
-
-        # make an array of all the keys in the bucket
-        file_list = [item.key for item in s3_bucket.objects.all()]
-
-        # Only use files that match the date we're currently checking
-        for item in file_list:
-            # if the date on the file is the same day as we're checking
-            if (
-                re.search(regex_str, item)
-                and "/" not in item
-                and datetime.strptime(item[: item.find("_")], "%m-%d-%Y").date() >= date
-            ):
-                s3_item = s3client.get_object(Bucket=DELETED_TRANSACTION_JOURNAL_FILES, Key=item)
-                reader = csv.reader(s3_item["Body"].read().decode("utf-8").splitlines())
-
-                # skip the header, the reader doesn't ignore it for some reason
-                next(reader)
-                # make an array of all the detached_award_procurement_ids
-                unique_key_list = [rows[0] for rows in reader]
-
-                ids_to_delete += unique_key_list
-
-    logger.info("Number of records to delete: %s" % str(len(ids_to_delete)))
-    return ids_to_delete
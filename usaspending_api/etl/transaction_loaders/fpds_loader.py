@@ -1,7 +1,7 @@
 import logging
 from psycopg2.extras import DictCursor
 from psycopg2 import Error
-from django.db import connection
+from django.db import connection, transaction
 
 from usaspending_api.etl.transaction_loaders.field_mappings_fpds import (
     transaction_fpds_nonboolean_columns,
@@ -20,6 +20,11 @@ from usaspending_api.etl.transaction_loaders.generic_loaders import (
     insert_transaction_normalized,
     insert_transaction_fpds,
     insert_award,
+    copy_load_objects_to_temp_table,
+    bulk_insert_missing_awards,
+    bulk_match_awards_and_transactions,
+    bulk_upsert_transaction_normalized,
+    bulk_upsert_transaction_fpds,
 )
 from usaspending_api.common.helpers.timing_helpers import ConsoleTimer as Timer
 
@@ -28,6 +33,10 @@ logger = logging.getLogger("console")
 
 failed_ids = []
 
+TEMP_AWARD_TABLE = "temp_fpds_load_award"
+TEMP_TRANSACTION_NORMALIZED_TABLE = "temp_fpds_load_transaction_normalized"
+TEMP_TRANSACTION_FPDS_TABLE = "temp_fpds_load_transaction_fpds"
+
 
 def delete_stale_fpds(detached_award_procurement_ids):
     """
@@ -80,12 +89,13 @@ def delete_stale_fpds(detached_award_procurement_ids):
         return awards_touched
 
 
-def load_fpds_transactions(chunk):
+def load_fpds_transactions(chunk, bulk_upsert=False):
     """
     Run transaction load for the provided ids. This will create any new rows in other tables to support the transaction
     data, but does NOT update "secondary" award values like total obligations or C -> D linkages. If transactions are
     being reloaded, this will also leave behind rows in supporting tables that won't be removed unless destroy_orphans
     is called.
+    If bulk_upsert is True the chunk is loaded with set-based statements instead of row by row.
     returns ids for each award touched
     """
     with Timer() as timer:
@@ -95,7 +105,10 @@ def load_fpds_transactions(chunk):
             if broker_transactions:
                 load_objects = _transform_objects(broker_transactions)
 
-                retval = _load_transactions(load_objects)
+                if bulk_upsert:
+                    retval = _load_transactions_in_bulk(load_objects)
+                else:
+                    retval = _load_transactions(load_objects)
     logger.info("batch completed in {}".format(timer.as_string(timer.elapsed)))
     return retval
 
@@ -193,6 +206,58 @@ def _load_transactions(load_objects):
     return list(ids_of_awards_created_or_updated)
 
 
+def _load_transactions_in_bulk(load_objects):
+    """
+    Set-based equivalent of _load_transactions. The whole batch is COPYed into temp tables and awards and transactions
+    are resolved, inserted and updated with a handful of statements in a single database transaction. If any of them
+    fails, the batch is rolled back and reloaded row by row so the offending Broker ids end up in failed_ids.
+    returns ids for each award touched
+    """
+    connection.ensure_connection()
+    try:
+        with transaction.atomic():
+            with connection.connection.cursor() as cursor:
+                award_keys = copy_load_objects_to_temp_table(cursor, load_objects, "award", "awards", TEMP_AWARD_TABLE)
+                transaction_normalized_keys = copy_load_objects_to_temp_table(
+                    cursor,
+                    load_objects,
+                    "transaction_normalized",
+                    "transaction_normalized",
+                    TEMP_TRANSACTION_NORMALIZED_TABLE,
+                    extra_columns=("id", "award_id"),
+                )
+                transaction_fpds_keys = copy_load_objects_to_temp_table(
+                    cursor,
+                    load_objects,
+                    "transaction_fpds",
+                    "transaction_fpds",
+                    TEMP_TRANSACTION_FPDS_TABLE,
+                    extra_columns=("transaction_id",),
+                )
+
+                awards_created = bulk_insert_missing_awards(cursor, award_keys, TEMP_AWARD_TABLE)
+                bulk_match_awards_and_transactions(cursor, TEMP_TRANSACTION_NORMALIZED_TABLE)
+                updated, inserted = bulk_upsert_transaction_normalized(
+                    cursor, transaction_normalized_keys, TEMP_TRANSACTION_NORMALIZED_TABLE
+                )
+                bulk_upsert_transaction_fpds(
+                    cursor, transaction_fpds_keys, TEMP_TRANSACTION_FPDS_TABLE, TEMP_TRANSACTION_NORMALIZED_TABLE
+                )
+
+                cursor.execute(f"select distinct award_id from {TEMP_TRANSACTION_NORMALIZED_TABLE}")
+                ids_of_awards_created_or_updated = [row[0] for row in cursor.fetchall()]
+
+                for temp_table in (TEMP_AWARD_TABLE, TEMP_TRANSACTION_NORMALIZED_TABLE, TEMP_TRANSACTION_FPDS_TABLE):
+                    cursor.execute(f"drop table {temp_table}")
+
+    except Error as e:
+        logger.warning(f"Bulk load of {len(load_objects):,} transactions failed, retrying row by row.\nDetails: {e}")
+        return _load_transactions(load_objects)
+
+    logger.debug(f"{awards_created:,} awards created, {updated:,} transactions updated, {inserted:,} inserted")
+    return ids_of_awards_created_or_updated
+
+
 def _matching_award(cursor, load_object):
     """ Try to find an award for this transaction to belong to by unique_award_key"""
     find_matching_award_sql = "select id from awards where generated_unique_award_id = '{}'".format(
@@ -1,4 +1,7 @@
-from usaspending_api.etl.transaction_loaders.data_load_helpers import format_insert_or_update_column_sql
+from usaspending_api.etl.transaction_loaders.data_load_helpers import (
+    format_bulk_copy_buffer,
+    format_insert_or_update_column_sql,
+)
 
 
 def insert_award(cursor, load_object):
@@ -39,3 +42,127 @@ def insert_transaction_fpds(cursor, load_object):
     cursor.execute(transaction_fpds_sql)
     created_transaction_fpds = cursor.fetchall()
     return created_transaction_fpds
+
+
+def _column_list(columns, alias=None):
+    prefix = "{}.".format(alias) if alias else ""
+    return ",".join('{}"{}"'.format(prefix, column) for column in columns)
+
+
+def _update_pairs(columns, source_alias):
+    return ",".join(
+        '"{col}"={alias}."{col}"'.format(col=column, alias=source_alias)
+        for column in columns
+        if column not in ["create_date", "created_at"]
+    )
+
+
+def copy_load_objects_to_temp_table(cursor, load_objects, type, source_table, temp_table, extra_columns=()):
+    """
+    Stages one table's worth of load object values in a temp table shaped like source_table, using COPY. The temp
+    table also gets a load_index column holding each load object's position, plus any extra_columns from source_table
+    that will be populated by later statements. Returns the load object keys that were copied.
+    """
+    keys = list(load_objects[0][type].keys())
+    extras = [column for column in extra_columns if column not in keys]
+
+    cursor.execute("DROP TABLE IF EXISTS {}".format(temp_table))
+    cursor.execute(
+        "CREATE TEMPORARY TABLE {} AS SELECT 0 AS load_index, {} FROM {} WHERE false".format(
+            temp_table, _column_list(extras + keys), source_table
+        )
+    )
+    cursor.copy_expert(
+        "COPY {} (load_index, {}) FROM STDIN".format(temp_table, _column_list(keys)),
+        format_bulk_copy_buffer(load_objects, type, keys),
+    )
+    cursor.execute("ANALYZE {}".format(temp_table))
+    return keys
+
+
+def bulk_insert_missing_awards(cursor, award_keys, temp_award_table):
+    """
+    Creates one award per unique award key that does not already exist, using the values of the first transaction in
+    the batch for that key (the same award the row-by-row loader would have created). Returns the number created.
+    """
+    cursor.execute(
+        "INSERT INTO awards ({columns}) "
+        "SELECT DISTINCT ON (s.generated_unique_award_id) {source_columns} FROM {temp_table} s "
+        "WHERE NOT EXISTS (SELECT 1 FROM awards a WHERE a.generated_unique_award_id = s.generated_unique_award_id) "
+        "ORDER BY s.generated_unique_award_id, s.load_index".format(
+            columns=_column_list(award_keys), source_columns=_column_list(award_keys, "s"), temp_table=temp_award_table
+        )
+    )
+    return cursor.rowcount
+
+
+def bulk_match_awards_and_transactions(cursor, temp_transaction_normalized_table):
+    """Populates award_id and, for transactions that already exist, id in the staged transaction_normalized rows"""
+    cursor.execute(
+        "UPDATE {} s SET award_id = a.id FROM awards a "
+        "WHERE a.generated_unique_award_id = s.unique_award_key".format(temp_transaction_normalized_table)
+    )
+    cursor.execute(
+        "UPDATE {} s SET id = f.transaction_id FROM transaction_fpds f "
+        "WHERE f.detached_award_proc_unique = s.transaction_unique_id".format(temp_transaction_normalized_table)
+    )
+
+
+def bulk_upsert_transaction_normalized(cursor, transaction_normalized_keys, temp_transaction_normalized_table):
+    """
+    Updates staged transaction_normalized rows that matched an existing transaction, then inserts the rest and
+    records their new ids back into the temp table. Returns the number of rows (updated, inserted)
+    """
+    columns = transaction_normalized_keys + ["award_id"]
+
+    cursor.execute(
+        "UPDATE transaction_normalized t SET {pairs} FROM {temp_table} s WHERE t.id = s.id".format(
+            pairs=_update_pairs(columns, "s"), temp_table=temp_transaction_normalized_table
+        )
+    )
+    updated = cursor.rowcount
+
+    cursor.execute(
+        "WITH inserted AS ("
+        "    INSERT INTO transaction_normalized ({columns}) "
+        "    SELECT {source_columns} FROM {temp_table} s WHERE s.id IS NULL ORDER BY s.load_index "
+        "    RETURNING id, transaction_unique_id"
+        ") "
+        "UPDATE {temp_table} s SET id = inserted.id FROM inserted "
+        "WHERE s.id IS NULL AND s.transaction_unique_id = inserted.transaction_unique_id".format(
+            columns=_column_list(columns),
+            source_columns=_column_list(columns, "s"),
+            temp_table=temp_transaction_normalized_table,
+        )
+    )
+    inserted = cursor.rowcount
+
+    return updated, inserted
+
+
+def bulk_upsert_transaction_fpds(
+    cursor, transaction_fpds_keys, temp_transaction_fpds_table, temp_transaction_normalized_table
+):
+    """
+    Inserts or updates transaction_fpds for every staged row, keyed on detached_award_proc_unique, after linking each
+    row to its transaction_normalized id. Returns the number of rows written
+    """
+    columns = transaction_fpds_keys + ["transaction_id"]
+
+    cursor.execute(
+        "UPDATE {fpds_table} f SET transaction_id = s.id FROM {normalized_table} s "
+        "WHERE f.load_index = s.load_index".format(
+            fpds_table=temp_transaction_fpds_table, normalized_table=temp_transaction_normalized_table
+        )
+    )
+    cursor.execute(
+        "INSERT INTO transaction_fpds ({columns}) "
+        "SELECT {source_columns} FROM {temp_table} s ORDER BY s.load_index "
+        "ON CONFLICT (detached_award_proc_unique) DO UPDATE SET {pairs}".format(
+            columns=_column_list(columns),
+            source_columns=_column_list(columns, "s"),
+            temp_table=temp_transaction_fpds_table,
+            pairs=_update_pairs(columns, "EXCLUDED"),
+        )
+    )
+    return cursor.rowcount
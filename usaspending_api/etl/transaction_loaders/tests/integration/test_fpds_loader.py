@@ -5,7 +5,8 @@ import pytest
 from django.core.management import call_command
 from model_mommy import mommy
 
-from usaspending_api.awards.models import Award, TransactionFPDS
+from usaspending_api.awards.models import Award, TransactionFPDS, TransactionNormalized
+from usaspending_api.etl.transaction_loaders import fpds_loader
 from usaspending_api.etl.transaction_loaders.field_mappings_fpds import (
     transaction_fpds_nonboolean_columns,
     transaction_normalized_nonboolean_columns,
@@ -114,3 +115,70 @@ def test_load_source_procurement_by_ids():
     assert transactions_by_id[101].fiscal_year == 2010
     assert transactions_by_id[201].fiscal_year == 2010
     assert transactions_by_id[301].fiscal_year == 2011
+
+
+def _snapshot_loaded_transactions():
+    """Values of the loaded data that don't depend on generated ids or load times"""
+    return sorted(
+        (
+            t.detached_award_proc_unique,
+            t.transaction.transaction_unique_id,
+            t.transaction.fiscal_year,
+            t.transaction.federal_action_obligation,
+            t.transaction.award.generated_unique_award_id,
+            t.transaction.award.transaction_unique_id,
+        )
+        for t in TransactionFPDS.objects.select_related("transaction__award")
+    )
+
+
+def _load_and_snapshot(id_list, bulk_upsert):
+    """Loads id_list down one path, returning the awards it touched and the ids that failed to load"""
+    touched_award_ids = fpds_loader.load_fpds_transactions(id_list, bulk_upsert=bulk_upsert)
+    touched_awards = sorted(
+        Award.objects.filter(id__in=touched_award_ids).values_list("generated_unique_award_id", flat=True)
+    )
+    load_failed_ids = sorted(fpds_loader.failed_ids)
+    fpds_loader.failed_ids.clear()
+    return len(set(touched_award_ids)), touched_awards, load_failed_ids
+
+
+@pytest.mark.django_db
+def test_bulk_upsert_matches_row_by_row_load():
+    """The set-based loader should leave behind exactly what the row-by-row loader does, on insert and on reload"""
+    source_procurement_id_list = [101, 201, 301]
+    _assemble_source_procurement_records(source_procurement_id_list)
+
+    row_by_row_load = _load_and_snapshot(source_procurement_id_list, bulk_upsert=False)
+    row_by_row = _snapshot_loaded_transactions()
+    assert row_by_row_load == (1, [row_by_row[0][4]], [])
+
+    TransactionFPDS.objects.all().delete()
+    TransactionNormalized.objects.all().delete()
+    Award.objects.all().delete()
+
+    assert _load_and_snapshot(source_procurement_id_list, bulk_upsert=True) == row_by_row_load
+    assert _snapshot_loaded_transactions() == row_by_row
+    assert Award.objects.count() == 1
+
+    # Reloading updates in place rather than creating anything new
+    transaction_ids = set(TransactionNormalized.objects.values_list("id", flat=True))
+    award_ids = set(Award.objects.values_list("id", flat=True))
+    assert _load_and_snapshot(source_procurement_id_list, bulk_upsert=True) == row_by_row_load
+    assert _load_and_snapshot(source_procurement_id_list, bulk_upsert=False) == row_by_row_load
+    assert _snapshot_loaded_transactions() == row_by_row
+    assert set(TransactionNormalized.objects.values_list("id", flat=True)) == transaction_ids
+    assert set(Award.objects.values_list("id", flat=True)) == award_ids
+
+
+@pytest.mark.django_db(transaction=True)
+def test_load_source_procurement_in_parallel_partitions():
+    """Transactions for the same award must land in the same partition so only one award gets created"""
+    source_procurement_id_list = [101, 201, 301, 401]
+    _assemble_source_procurement_records(source_procurement_id_list)
+
+    call_command("load_fpds_transactions", "--reload-all", "--workers", 2)
+
+    assert TransactionFPDS.objects.count() == 4
+    assert Award.objects.count() == 1
+    assert set(TransactionNormalized.objects.values_list("award_id", flat=True)) == {Award.objects.get().id}
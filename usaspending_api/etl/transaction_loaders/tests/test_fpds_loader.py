@@ -5,6 +5,7 @@ from usaspending_api.etl.transaction_loaders.fpds_loader import (
     _create_load_object,
     _transform_objects,
     _load_transactions,
+    _load_transactions_in_bulk,
 )
 from usaspending_api.etl.transaction_loaders.field_mappings_fpds import (
     transaction_fpds_nonboolean_columns,
@@ -12,6 +13,7 @@ from usaspending_api.etl.transaction_loaders.field_mappings_fpds import (
     transaction_fpds_boolean_columns,
 )
 from usaspending_api.etl.transaction_loaders.data_load_helpers import format_insert_or_update_column_sql
+from psycopg2 import Error
 
 from unittest.mock import MagicMock, patch
 
@@ -250,3 +252,44 @@ def test_load_transactions(mock__fetch_subtier_agency_id, mock_connection):
 
     load_objects = _transform_objects([mega_key_list])
     _load_transactions(load_objects)
+
+
+@patch("usaspending_api.etl.transaction_loaders.fpds_loader.transaction")
+@patch("usaspending_api.etl.transaction_loaders.fpds_loader.connection")
+@patch("usaspending_api.etl.transaction_loaders.derived_field_functions_fpds._fetch_subtier_agency_id", return_value=1)
+@patch("usaspending_api.etl.transaction_loaders.fpds_loader._load_transactions")
+def test_load_transactions_in_bulk(mock__load_transactions, mock__fetch_subtier_agency_id, mock_connection, _):
+    """The whole batch is staged with one COPY per table and nothing is loaded row by row"""
+    mock_cursor = MagicMock()
+    mock_cursor.rowcount = 3
+    mock_cursor.fetchall.return_value = [[10], [11]]
+    mock_connection.connection.cursor().__enter__.return_value = mock_cursor
+
+    load_objects = _transform_objects(_stub___extract_broker_objects([101, 201, 301]))
+    award_ids = _load_transactions_in_bulk(load_objects)
+
+    assert award_ids == [10, 11]
+    assert mock_cursor.copy_expert.call_count == 3
+    mock__load_transactions.assert_not_called()
+
+    copied_rows = mock_cursor.copy_expert.call_args_list[0][0][1].read().splitlines()
+    assert [row.split("\t")[0] for row in copied_rows] == ["0", "1", "2"]
+
+
+@patch("usaspending_api.etl.transaction_loaders.fpds_loader.transaction")
+@patch("usaspending_api.etl.transaction_loaders.fpds_loader.connection")
+@patch("usaspending_api.etl.transaction_loaders.derived_field_functions_fpds._fetch_subtier_agency_id", return_value=1)
+@patch("usaspending_api.etl.transaction_loaders.fpds_loader._load_transactions", return_value=[10])
+def test_load_transactions_in_bulk_falls_back(
+    mock__load_transactions, mock__fetch_subtier_agency_id, mock_connection, _
+):
+    """A database error anywhere in the batch reloads it row by row so failed ids are recorded individually"""
+    mock_cursor = MagicMock()
+    mock_cursor.copy_expert.side_effect = Error("bad row")
+    mock_connection.connection.cursor().__enter__.return_value = mock_cursor
+
+    load_objects = _transform_objects(_stub___extract_broker_objects([101, 201, 301]))
+    award_ids = _load_transactions_in_bulk(load_objects)
+
+    assert award_ids == [10]
+    mock__load_transactions.assert_called_once_with(load_objects)
@@ -20,8 +20,8 @@ from usaspending_api.common.exceptions import InvalidParameterException
 from usaspending_api.recipient.models import RecipientProfile, RecipientLookup, DUNS
 from usaspending_api.recipient.v2.helpers import validate_year, reshape_filters, get_duns_business_types_mapping
 from usaspending_api.recipient.v2.lookups import RECIPIENT_LEVELS, SPECIAL_CASES
-from usaspending_api.references.models import RefCountryCode
-from usaspending_api.search.v2.elasticsearch_helper import get_scaled_sum_aggregations, get_number_of_unique_terms
+from usaspending_api.references.reference_data_cache import country_names
+from usaspending_api.search.v2.elasticsearch_helper import get_scaled_sum_aggregations
 
 logger = logging.getLogger(__name__)
 
@@ -117,8 +117,7 @@ def cleanup_location(location):
         location["country_code"] = "USA"
     # Country name generally isn't available with SAM data
     if location.get("country_code", None) and not location.get("country_name", None):
-        country_name = RefCountryCode.objects.filter(country_code=location["country_code"]).values("country_name")
-        location["country_name"] = country_name[0]["country_name"] if country_name else None
+        location["country_name"] = country_names().get(location["country_code"])
     # Older transactions have various formats for congressional code (13.0, 13, CA13)
     if location.get("congressional_code", None):
         congressional_code = location["congressional_code"]
@@ -254,14 +253,9 @@ def obtain_recipient_totals(recipient_id, children=False, year="latest"):
     else:
         group_by_field = "recipient_hash"
 
-    bucket_count = get_number_of_unique_terms(filter_query, f"{group_by_field}.hash")
-
-    if bucket_count == 0:
-        return []
-
-    # Not setting the shard_size since the number of child recipients under a
-    # parent recipient will not exceed 10k
-    group_by_recipient = A("terms", field=group_by_field, size=bucket_count)
+    # The number of child recipients under a parent recipient will not exceed 10k, so there is no need to count
+    # the buckets first; a terms aggregation only returns the buckets that exist
+    group_by_recipient = A("terms", field=group_by_field, size=10000)
 
     sum_obligation = get_scaled_sum_aggregations("generated_pragmatic_obligation")["sum_field"]
 
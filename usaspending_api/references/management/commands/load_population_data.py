@@ -5,6 +5,7 @@ from django.core.management.base import BaseCommand
 
 from django.db import connection
 
+from usaspending_api.common.cache import try_bump_reference_data_version
 from usaspending_api.references.models import PopCongressionalDistrict, PopCounty
 from usaspending_api.common.csv_helpers import read_csv_file_as_list_of_dictionaries
 
@@ -57,6 +58,7 @@ class Command(BaseCommand):
         self.create_table(columns=cols)
         self.load_data(csv_dict_list)
         self.drop_temp_table()
+        try_bump_reference_data_version()
 
     def drop_temp_table(self):
         logger.info(f"Dropping temp table {TEMP_TABLE_NAME}")
@@ -1,4 +1,5 @@
 from django.core.management.base import BaseCommand
+from usaspending_api.common.cache import try_bump_data_generation
 from usaspending_api.references.models import PSC
 import os
 import logging
@@ -21,6 +22,7 @@ class Command(BaseCommand):
     def handle(self, *args, **options):
 
         load_psc(fullpath=options["path"], update=options["update"])
+        try_bump_data_generation()
         self.logger.log(20, "Loaded PSC codes successfully.")
 
 
@@ -1,6 +1,7 @@
 import logging
 
 from django.core.management.base import BaseCommand
+from usaspending_api.common.cache import try_bump_reference_data_version
 from usaspending_api.common.threaded_data_loader import ThreadedDataLoader
 from usaspending_api.references.models import RefCountryCode, ObjectClass, RefProgramActivity
 
@@ -33,3 +34,4 @@ class Command(BaseCommand):
 
         loader = ThreadedDataLoader(model_class=possible_models[model], collision_behavior="update")
         loader.load_from_file(path, encoding)
+        try_bump_reference_data_version()
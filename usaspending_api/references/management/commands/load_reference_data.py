@@ -4,6 +4,8 @@ from django.conf import settings
 from django.core.management import call_command
 from django.core.management.base import BaseCommand
 
+from usaspending_api.common.cache import try_bump_reference_data_version
+
 
 class Command(BaseCommand):
     help = "Loads reference data into the database. This should be run after \
@@ -80,4 +82,5 @@ class Command(BaseCommand):
         self.logger.warning("GTAS Total Obligation loader requires access to a broker database with the relevant data")
         call_command("load_gtas")
 
+        try_bump_reference_data_version()
         self.logger.info("Reference data loaded.")
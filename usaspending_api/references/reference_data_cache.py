@@ -0,0 +1,49 @@
+"""
+Small, rarely changing reference tables held in memory by every worker process so that request handlers can look
+values up in a dict rather than querying the database on every request (or, worse, for every row).
+
+Each table is loaded the first time it is needed and kept until the reference data version (see common.cache) changes.
+Loaders that change these tables call bump_reference_data_version() once they finish.  Without a shared cache (the
+"disabled" cache environment) every check finds a new version, so tables are simply reloaded every
+GENERATION_CHECK_INTERVAL seconds.
+
+The returned dicts are shared by every caller in the process; treat them as read only.
+"""
+from typing import Callable, Dict
+
+from usaspending_api.common.cache import get_reference_data_version, memoize_per_generation
+from usaspending_api.references.models import PopCongressionalDistrict, PopCounty, RefCountryCode
+
+
+def reference_data(load: Callable[[], Dict]) -> Callable[[], Dict]:
+    """Memoizes the table returned by load until the reference data version changes"""
+    return memoize_per_generation(load, get_reference_data_version)
+
+
+@reference_data
+def state_populations() -> Dict[str, int]:
+    """Latest population keyed by lower case state name"""
+    rows = PopCounty.objects.filter(county_number="000").values_list("state_name", "latest_population")
+    return {state_name.lower(): population for state_name, population in rows}
+
+
+@reference_data
+def county_populations() -> Dict[str, int]:
+    """Latest population keyed by state FIPS code + county number"""
+    rows = PopCounty.objects.exclude(county_number="000").values_list(
+        "state_code", "county_number", "latest_population"
+    )
+    return {f"{state_code}{county_number}": population for state_code, county_number, population in rows}
+
+
+@reference_data
+def district_populations() -> Dict[str, int]:
+    """Latest population keyed by state FIPS code + congressional district"""
+    rows = PopCongressionalDistrict.objects.values_list("state_code", "congressional_district", "latest_population")
+    return {f"{state_code}{district}": population for state_code, district, population in rows}
+
+
+@reference_data
+def country_names() -> Dict[str, str]:
+    """Country name keyed by country code"""
+    return dict(RefCountryCode.objects.values_list("country_code", "country_name"))
@@ -0,0 +1,84 @@
+import pytest
+
+from usaspending_api.references.v2.views.filter_tree.filter_tree import FilterTree, UnlinkedNode
+
+
+class LocalFilterTree(FilterTree):
+    """Two agencies, each with accounts, one of which has sub-accounts; counts how often the tree is loaded"""
+
+    loads = 0
+
+    def tree_nodes(self):
+        type(self).loads += 1
+        yield UnlinkedNode(id="001", ancestors=[], description="Agency One")
+        yield UnlinkedNode(id="002", ancestors=[], description="Agency Two")
+        yield UnlinkedNode(id="0001", ancestors=["001"], description="Account A")
+        yield UnlinkedNode(id="0002", ancestors=["001"], description="Account B")
+        yield UnlinkedNode(id="0003", ancestors=["002"], description="Account C")
+        for tas in ("00011", "00012", "00013"):
+            yield UnlinkedNode(id=tas, ancestors=["001", "0001"], description=f"TAS {tas}")
+
+
+@pytest.fixture
+def tree(monkeypatch):
+    generation = {"token": "one"}
+    monkeypatch.setattr("usaspending_api.common.cache.get_data_generations", lambda: (generation["token"], None))
+    monkeypatch.setattr("usaspending_api.references.v2.views.filter_tree.filter_tree._built_trees", {})
+    LocalFilterTree.loads = 0
+    yield LocalFilterTree(), generation
+
+
+def test_counts_and_depth(tree):
+    filter_tree, _ = tree
+    results = [node.to_JSON() for node in filter_tree.search(None, None, None, 0, None)]
+    assert [(r["id"], r["count"], r["children"]) for r in results] == [("001", 4, None), ("002", 1, None)]
+
+    results = [node.to_JSON() for node in filter_tree.search("001", None, None, 1, None)]
+    assert [(r["id"], r["count"], len(r["children"])) for r in results] == [("0001", 3, 3), ("0002", 0, 0)]
+    assert results[0]["children"][0] == {
+        "id": "00011",
+        "ancestors": ["001", "0001"],
+        "description": "TAS 00011",
+        "count": 0,
+        "children": None,
+    }
+    assert filter_tree.search("003", None, None, 0, None) == []
+
+
+def test_filter_prunes_built_tree(tree):
+    filter_tree, _ = tree
+    results = [node.to_JSON() for node in filter_tree.search(None, None, None, 2, "00012")]
+    assert [r["id"] for r in results] == ["001"]
+    assert [c["id"] for c in results[0]["children"]] == ["0001"]
+    assert [c["id"] for c in results[0]["children"][0]["children"]] == ["00012"]
+
+    # pruning one search's nodes leaves the tree intact for the next
+    results = filter_tree.search(None, None, None, 2, None)
+    assert len(results[0].children[0].children) == 3
+
+
+def test_tree_is_loaded_once_per_generation(tree):
+    filter_tree, generation = tree
+    filter_tree.search(None, None, None, 0, None)
+    filter_tree.search("001", "0001", None, 0, "TAS")
+    LocalFilterTree().search("002", None, None, 1, None)
+    assert LocalFilterTree.loads == 1
+
+    generation["token"] = "two"
+    filter_tree.search(None, None, None, 0, None)
+    assert LocalFilterTree.loads == 2
+
+
+def test_generation_is_checked_once_per_interval(tree, settings):
+    filter_tree, generation = tree
+    settings.GENERATION_CHECK_INTERVAL = 60
+    filter_tree.search(None, None, None, 0, None)
+
+    # a disabled cache hands out a new generation on every check
+    generation["token"] = "two"
+    filter_tree.search(None, None, None, 0, None)
+    assert LocalFilterTree.loads == 1
+
+    settings.GENERATION_CHECK_INTERVAL = 0
+    filter_tree.search(None, None, None, 0, None)
+    assert LocalFilterTree.loads == 2
@@ -0,0 +1,65 @@
+import pytest
+
+from django.core.cache import caches
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from model_mommy import mommy
+
+from usaspending_api.common.cache import bump_reference_data_version
+from usaspending_api.references.reference_data_cache import (
+    country_names,
+    county_populations,
+    district_populations,
+    state_populations,
+)
+
+
+@pytest.fixture
+def reference_data_version(settings):
+    """Keeps the reference data version in a local memory cache, so it only changes when it is bumped"""
+    settings.REST_FRAMEWORK_EXTENSIONS = {**settings.REST_FRAMEWORK_EXTENSIONS, "DEFAULT_USE_CACHE": "default"}
+    caches["default"].clear()
+    for table in (state_populations, county_populations, district_populations, country_names):
+        table.cache_clear()
+    yield
+    caches["default"].clear()
+
+
+@pytest.fixture
+def reference_rows(db):
+    mommy.make("references.PopCounty", state_code="51", state_name="Virginia", county_number="000", latest_population=8)
+    mommy.make("references.PopCounty", state_code="51", state_name="Virginia", county_number="059", latest_population=1)
+    mommy.make("references.PopCongressionalDistrict", state_code="51", congressional_district="11", latest_population=7)
+    mommy.make("references.RefCountryCode", country_code="USA", country_name="UNITED STATES")
+
+
+def test_lookups(reference_data_version, reference_rows):
+    assert state_populations() == {"virginia": 8}
+    assert county_populations() == {"51059": 1}
+    assert district_populations() == {"5111": 7}
+    assert country_names() == {"USA": "UNITED STATES"}
+
+
+def test_tables_load_once_per_version(reference_data_version, reference_rows):
+    with CaptureQueriesContext(connection) as queries:
+        for _ in range(3):
+            assert country_names()["USA"] == "UNITED STATES"
+    assert len(queries) == 1
+
+    mommy.make("references.RefCountryCode", country_code="GBR", country_name="UNITED KINGDOM")
+    assert "GBR" not in country_names()
+
+    bump_reference_data_version()
+    with CaptureQueriesContext(connection) as queries:
+        assert country_names()["GBR"] == "UNITED KINGDOM"
+        assert country_names()["GBR"] == "UNITED KINGDOM"
+    assert len(queries) == 1
+
+
+def test_version_is_checked_on_an_interval(reference_data_version, reference_rows, settings):
+    settings.GENERATION_CHECK_INTERVAL = 3600
+    assert "GBR" not in country_names()
+
+    mommy.make("references.RefCountryCode", country_code="GBR", country_name="UNITED KINGDOM")
+    bump_reference_data_version()
+    assert "GBR" not in country_names()
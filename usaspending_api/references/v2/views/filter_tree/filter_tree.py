@@ -1,9 +1,13 @@
 from abc import ABCMeta, abstractmethod
+from collections import defaultdict
 from dataclasses import dataclass
-from typing import Any
+from typing import Dict, Iterable, List, Tuple
 
 DEFAULT_CHILDREN = 0
 
+# Memoized tree builders (see common.cache.memoize_per_generation) by FilterTree class name
+_built_trees = {}
+
 
 @dataclass
 class UnlinkedNode:
@@ -30,7 +34,20 @@ class Node:
         }
 
 
+@dataclass
+class TreeIndex:
+    children: Dict[Tuple[str, ...], List[UnlinkedNode]]  # by the path (ancestors + id) of their parent
+    counts: Dict[Tuple[str, ...], int]  # by node path
+
+
 class FilterTree(metaclass=ABCMeta):
+    """
+    The whole tree is loaded with one query per tier (see tree_nodes) and kept in memory until the next data
+    generation, so a search, at any depth and with or without a filter string, never goes back to the database.
+    Without a shared cache (the "disabled" cache environment) every check finds a new generation, so trees are simply
+    rebuilt every GENERATION_CHECK_INTERVAL seconds.
+    """
+
     def search(self, tier1, tier2, tier3, child_layers, filter_string) -> list:
         if tier3:
             ancestor_array = [tier1, tier2, tier3]
@@ -41,52 +58,59 @@ class FilterTree(metaclass=ABCMeta):
         else:
             ancestor_array = []
 
-        retval = [
-            self._linked_node_from_data(ancestor_array, elem, filter_string, child_layers)
-            for elem in self.raw_search(ancestor_array)
-        ]
+        tree = self._get_tree()
+        retval = [self._linked_node(tree, elem, child_layers) for elem in tree.children.get(tuple(ancestor_array), [])]
         if filter_string:
             retval = [elem for elem in retval if self.matches_filter(elem, filter_string)]
         return retval
 
-    def _linked_node_from_data(self, ancestor_array, data, filter_string, child_layers):
-        retval = self.unlinked_node_from_data(ancestor_array, data)
-        raw_children = self.raw_search(ancestor_array + [retval.id])
-        temp_children = [
-            self._linked_node_from_data(ancestor_array + [retval.id], elem, filter_string, child_layers - 1)
-            for elem in raw_children
-        ]
+    def _get_tree(self) -> TreeIndex:
+        name = type(self).__name__
+        if name not in _built_trees:
+            # imported here because common.cache indirectly imports the PSC filter tree
+            from usaspending_api.common.cache import memoize_per_generation
+
+            _built_trees[name] = memoize_per_generation(self._build_tree)
+        return _built_trees[name]()
+
+    def _build_tree(self) -> TreeIndex:
+        children = defaultdict(list)
+        for node in self.tree_nodes():
+            children[tuple(node.ancestors)].append(node)
+
+        counts = {}
+
+        def count(path):
+            # A node counts its leaf children as one each and every other child as that child's count
+            if path not in counts:
+                counts[path] = sum(count(path + (child.id,)) or 1 for child in children.get(path, []))
+            return counts[path]
+
+        for nodes in list(children.values()):
+            for node in nodes:
+                count(tuple(node.ancestors) + (node.id,))
+        return TreeIndex(children=dict(children), counts=counts)
+
+    def _linked_node(self, tree, node, child_layers):
+        path = tuple(node.ancestors) + (node.id,)
         if child_layers:
-            children = temp_children
+            children = [self._linked_node(tree, elem, child_layers - 1) for elem in tree.children.get(path, [])]
         else:
             children = None
 
         return Node(
-            id=retval.id,
-            ancestors=retval.ancestors,
-            description=retval.description,
-            count=sum([node.count if node.count else 1 for node in temp_children]),
+            id=node.id,
+            ancestors=node.ancestors,
+            description=node.description,
+            count=tree.counts[path],
             children=children,
         )
 
     @abstractmethod
-    def raw_search(self, tiered_keys: list, filter_string: str) -> list:
-        """
-        Basic unit of searching, given the path to the parent and the filter string. Output can be a list of any type, and is
-        only used by the unlinked_node_from_data abstract function.
-
-        :param: tiered_keys - list
-        :param: filter_string - string or null
-
-        """
-        pass
-
-    @abstractmethod
-    def unlinked_node_from_data(self, ancestors: list, data: Any) -> UnlinkedNode:
+    def tree_nodes(self) -> Iterable[UnlinkedNode]:
         """
-        :param ancestors: list
-        :param data: Single member of the list provided by raw_search
-        :return: Unlinked Node
+        Every node in the tree, each with its full list of ancestors, in display order within each parent.  Load
+        each tier with a single query rather than one query per parent.
         """
         pass
 
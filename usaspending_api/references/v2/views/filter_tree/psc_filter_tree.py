@@ -1,5 +1,6 @@
 import re
 
+from collections import defaultdict
 from string import ascii_uppercase, digits
 from usaspending_api.references.models import PSC
 from usaspending_api.references.v2.views.filter_tree.filter_tree import UnlinkedNode, FilterTree
@@ -16,48 +17,27 @@ PSC_GROUPS = {
 
 
 class PSCFilterTree(FilterTree):
-    def raw_search(self, tiered_keys):
-        if not self._path_is_valid(tiered_keys):
-            return []
-
-        if len(tiered_keys) == 0:
-            return self._toptier_search()
-        elif len(tiered_keys) == 1:
-            return self._psc_from_group(tiered_keys[0])
-        else:
-            return self._psc_from_parent(tiered_keys[-1])
-
-    def _path_is_valid(self, path: list) -> bool:
-        if len(path) > 1:
-            if PSC_GROUPS.get(path[0]) is None or not re.match(PSC_GROUPS[path[0]]["pattern"], path[1]):
-                return False
-            for x in range(1, len(path) - 1):
-                if not path[x + 1].startswith(path[x]):
-                    return False
-        return True
-
-    def _toptier_search(self):
-        return PSC_GROUPS.keys()
-
-    def _psc_from_group(self, group):
-        # The default regex value will match nothing
-        return self._psc_from_regex(PSC_GROUPS.get(group, {}).get("pattern") or "(?!)")
-
-    def _psc_from_regex(self, regex):
-        return [
-            {"id": object.code, "description": object.description} for object in PSC.objects.filter(code__iregex=regex)
-        ]  # normally very unsafe, but regexes are not being supplied by the user
-
-    def _psc_from_parent(self, parent):
+    def tree_nodes(self):
+        pscs = list(PSC.objects.values("code", "description", "length"))
+        by_length_and_prefix = defaultdict(list)
+        for psc in pscs:
+            for prefix_length in range(1, len(psc["code"])):
+                by_length_and_prefix[(psc["length"], psc["code"][:prefix_length])].append(psc)
+
+        for group, group_definition in PSC_GROUPS.items():
+            yield UnlinkedNode(id=group, ancestors=[], description="")
+            # normally very unsafe, but regexes are not being supplied by the user
+            pattern = re.compile(group_definition["pattern"], re.IGNORECASE)
+            for psc in pscs:
+                if pattern.match(psc["code"]):
+                    yield from self._psc_and_descendants([group], psc, by_length_and_prefix)
+
+    def _psc_and_descendants(self, ancestors, psc, by_length_and_prefix):
+        yield UnlinkedNode(id=psc["code"], ancestors=ancestors, description=psc["description"])
+        for child in self._psc_from_parent(psc["code"], by_length_and_prefix):
+            yield from self._psc_and_descendants(ancestors + [psc["code"]], child, by_length_and_prefix)
+
+    def _psc_from_parent(self, parent, by_length_and_prefix):
         # two out of three branches of the PSC tree "jump" over 3 character codes
         desired_len = len(parent) + 2 if len(parent) == 2 and parent[0] != "A" else len(parent) + 1
-        return [
-            {"id": object.code, "description": object.description}
-            for object in PSC.objects.filter(length=desired_len, code__startswith=parent)
-        ]
-
-    def unlinked_node_from_data(self, ancestors: list, data) -> UnlinkedNode:
-        if len(ancestors) == 0:  # A tier zero search is returning an agency dictionary
-            return UnlinkedNode(id=data, ancestors=ancestors, description="")
-        else:
-            return UnlinkedNode(id=data["id"], ancestors=ancestors, description=data["description"])
+        return by_length_and_prefix.get((desired_len, parent), [])
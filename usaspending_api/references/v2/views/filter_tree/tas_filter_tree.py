@@ -6,14 +6,17 @@ from django.db.models import Exists, OuterRef
 
 
 class TASFilterTree(FilterTree):
-    def raw_search(self, tiered_keys):
-        if len(tiered_keys) == 0:
-            return self._toptier_search()
-        if len(tiered_keys) == 1:
-            return self._fa_given_agency(tiered_keys[0])
-        if len(tiered_keys) == 2:
-            return self._tas_given_fa(tiered_keys[0], tiered_keys[1])
-        return []
+    def tree_nodes(self):
+        for agency in self._toptier_search():
+            yield self._generate_agency_node([], agency)
+        for fa in self._fa_search():
+            yield self._generate_federal_account_node([fa["parent_toptier_agency__toptier_code"]], fa)
+        for tas in self._tas_search():
+            ancestors = [
+                tas["federal_account__parent_toptier_agency__toptier_code"],
+                tas["federal_account__federal_account_code"],
+            ]
+            yield UnlinkedNode(id=tas["tas_rendering_label"], ancestors=ancestors, description=tas["account_title"])
 
     def _toptier_search(self):
         agency_set = (
@@ -35,27 +38,28 @@ class TASFilterTree(FilterTree):
     def _dictionary_from_agency(self, agency):
         return {"toptier_code": agency["toptier_code"], "name": agency["name"], "abbreviation": agency["abbreviation"]}
 
-    def _fa_given_agency(self, agency):
-        return FederalAccount.objects.annotate(
-            has_faba=Exists(faba_with_file_D_data().filter(treasury_account__federal_account=OuterRef("pk")))
-        ).filter(has_faba=True, parent_toptier_agency__toptier_code=agency)
-
-    def _tas_given_fa(self, agency, fed_account):
-        return TreasuryAppropriationAccount.objects.annotate(
-            has_faba=Exists(faba_with_file_D_data().filter(treasury_account=OuterRef("pk")))
-        ).filter(
-            has_faba=True,
-            federal_account__federal_account_code=fed_account,
-            federal_account__parent_toptier_agency__toptier_code=agency,
+    def _fa_search(self):
+        return (
+            FederalAccount.objects.annotate(
+                has_faba=Exists(faba_with_file_D_data().filter(treasury_account__federal_account=OuterRef("pk")))
+            )
+            .filter(has_faba=True, parent_toptier_agency__isnull=False)
+            .values("federal_account_code", "account_title", "parent_toptier_agency__toptier_code")
         )
 
-    def unlinked_node_from_data(self, ancestors: list, data) -> UnlinkedNode:
-        if len(ancestors) == 0:  # A tier zero search is returning an agency dictionary
-            return self._generate_agency_node(ancestors, data)
-        if len(ancestors) == 1:  # A tier one search is returning a FederalAccount object
-            return self._generate_federal_account_node(ancestors, data)
-        if len(ancestors) == 2:  # A tier two search will be returning a TreasuryAppropriationAccount object
-            return UnlinkedNode(id=data.tas_rendering_label, ancestors=ancestors, description=data.account_title)
+    def _tas_search(self):
+        return (
+            TreasuryAppropriationAccount.objects.annotate(
+                has_faba=Exists(faba_with_file_D_data().filter(treasury_account=OuterRef("pk")))
+            )
+            .filter(has_faba=True, federal_account__parent_toptier_agency__isnull=False)
+            .values(
+                "tas_rendering_label",
+                "account_title",
+                "federal_account__federal_account_code",
+                "federal_account__parent_toptier_agency__toptier_code",
+            )
+        )
 
     def _generate_agency_node(self, ancestors, data):
         return UnlinkedNode(
@@ -63,4 +67,4 @@ class TASFilterTree(FilterTree):
         )
 
     def _generate_federal_account_node(self, ancestors, data):
-        return UnlinkedNode(id=data.federal_account_code, ancestors=ancestors, description=data.account_title)
+        return UnlinkedNode(id=data["federal_account_code"], ancestors=ancestors, description=data["account_title"])
@@ -2,7 +2,8 @@ import logging
 from typing import Tuple, Optional
 
 from usaspending_api.recipient.models import StateData
-from usaspending_api.references.models import Agency, Cfda, PSC, RefCountryCode, NAICS
+from usaspending_api.references.models import Agency, Cfda, PSC, NAICS
+from usaspending_api.references.reference_data_cache import country_names
 
 logger = logging.getLogger(__name__)
 
@@ -40,12 +41,10 @@ def fetch_psc_description_by_code(psc_code: str) -> Optional[str]:
 
 
 def fetch_country_name_from_code(country_code: str) -> Optional[str]:
-    columns = ["country_name"]
-    result = RefCountryCode.objects.filter(country_code=country_code).values(*columns).first()
-    if not result:
-        logger.warning("{} not found for country_code: {}".format(",".join(columns), country_code))
-        return None
-    return result[columns[0]]
+    country_name = country_names().get(country_code)
+    if country_name is None:
+        logger.warning("country_name not found for country_code: {}".format(country_code))
+    return country_name
 
 
 def fetch_state_name_from_code(state_code: str) -> Optional[str]:
@@ -0,0 +1,87 @@
+import logging
+
+from datetime import date
+from django.conf import settings
+from django.db.models import Sum
+from typing import List, Optional
+
+from usaspending_api.search.models import SpendingByCategoryRollup
+
+
+logger = logging.getLogger("console")
+
+# Aggregation keys (transaction_delta_view columns and transaction index fields) summarized in the rollup table
+ROLLUP_AGG_KEYS = (
+    "awarding_toptier_agency_agg_key",
+    "awarding_subtier_agency_agg_key",
+    "funding_toptier_agency_agg_key",
+    "funding_subtier_agency_agg_key",
+    "cfda_agg_key",
+    "psc_agg_key",
+    "naics_agg_key",
+    "pop_country_agg_key",
+    "pop_state_agg_key",
+    "pop_county_agg_key",
+    "pop_congressional_agg_key",
+)
+
+ROLLUP_FILTERS = {"time_period", "award_type_codes", "agencies"}
+
+
+def _fiscal_years(time_periods: List[dict]) -> Optional[List[int]]:
+    """Fiscal years covered by time_periods if every period starts and ends on a fiscal year boundary"""
+    fiscal_years = set()
+    for time_period in time_periods:
+        start_date = date.fromisoformat(time_period.get("start_date") or settings.API_SEARCH_MIN_DATE)
+        end_date = date.fromisoformat(time_period.get("end_date") or settings.API_MAX_DATE)
+        if (start_date.month, start_date.day) != (10, 1) or (end_date.month, end_date.day) != (9, 30):
+            return None
+        fiscal_years.update(range(start_date.year + 1, end_date.year + 1))
+    return sorted(fiscal_years)
+
+
+def get_rollup_filters(filters: dict) -> Optional[dict]:
+    """
+    Translates award search filters into SpendingByCategoryRollup filters.  Returns None when the filters ask for
+    anything the rollups do not record: a filter other than fiscal year aligned time periods, award types and
+    awarding toptier agencies.
+    """
+    if not settings.ENABLE_SPENDING_BY_CATEGORY_ROLLUPS or not set(filters).issubset(ROLLUP_FILTERS):
+        return None
+
+    rollup_filters = {}
+    if "time_period" in filters:
+        fiscal_years = _fiscal_years(filters["time_period"])
+        if not fiscal_years:
+            return None
+        rollup_filters["fiscal_year__in"] = fiscal_years
+
+    if "award_type_codes" in filters:
+        if not filters["award_type_codes"]:
+            return None
+        rollup_filters["type__in"] = filters["award_type_codes"]
+
+    if "agencies" in filters:
+        agencies = filters["agencies"]
+        if not agencies or any(a["type"] != "awarding" or a["tier"] != "toptier" for a in agencies):
+            return None
+        rollup_filters["awarding_toptier_agency_name__in"] = [a["name"] for a in agencies]
+
+    return rollup_filters
+
+
+def get_rollup_buckets(agg_key_name: str, rollup_filters: dict, lower_limit: int, upper_limit: int) -> List[dict]:
+    """
+    Returns the lower_limit:upper_limit slice of agg_key_name values ordered by obligation, formatted like the terms
+    aggregation buckets returned by Elasticsearch so that the same code can build the response from either
+    """
+    queryset = (
+        SpendingByCategoryRollup.objects.filter(agg_key_name=agg_key_name, **rollup_filters)
+        .values("agg_key")
+        .annotate(amount=Sum("generated_pragmatic_obligation"))
+        .order_by("-amount", "agg_key")
+    )
+    return [
+        {"key": row["agg_key"], "sum_field": {"value": row["amount"] * 100}}
+        for row in queryset[lower_limit:upper_limit]
+    ]
@@ -0,0 +1,184 @@
+"""
+The spending_over_time rollups held in the memory of every worker process as NumPy columns, so that the most common
+spending_over_time requests are summed in-process instead of by an Elasticsearch date_histogram.
+
+The cube is loaded the first time it is needed and kept until load_spending_over_time_rollups next rewrites the rollups
+(see common.cache.memoize_per_generation).  The time of that rewrite is kept in Postgres alongside the rollups rather
+than in the shared cache, so workers without a shared cache (the "disabled" cache environment) do not reload the whole
+cube on every check.
+"""
+import logging
+
+import numpy as np
+
+from calendar import monthrange
+from datetime import date
+from django.conf import settings
+from typing import Dict, List, Optional, Tuple
+
+from usaspending_api.broker.helpers.last_load_date import get_last_load_date
+from usaspending_api.common.cache import memoize_per_generation
+from usaspending_api.common.helpers.fiscal_year_helpers import generate_fiscal_month, generate_fiscal_year
+from usaspending_api.search.models import SpendingOverTimeRollup
+
+
+logger = logging.getLogger("console")
+
+# external_data_load_date key of the last time load_spending_over_time_rollups rewrote the rollups
+CUBE_LOAD_KEY = "spending_over_time_cube"
+
+CUBE_FILTERS = {"time_period", "award_type_codes", "agencies", "recipient_locations"}
+
+
+class SpendingOverTimeCube:
+    """
+    One entry per rollup row, sorted by fiscal month.  Text dimensions are stored as codes into the list of their
+    values, and obligations as integer cents so that sums are exact.
+    """
+
+    dimensions = (
+        "awarding_toptier_agency_name",
+        "type",
+        "recipient_location_country_code",
+        "recipient_location_state_code",
+    )
+
+    def __init__(self, rows: List[tuple]):
+        """rows are (fiscal_year, fiscal_month, *dimensions, generated_pragmatic_obligation) ordered by fiscal month"""
+        self.first_fiscal_year = rows[0][0]
+        self.months = np.fromiter(((row[0] - self.first_fiscal_year) * 12 + row[1] - 1 for row in rows), np.int32)
+        self.cents = np.fromiter((int(row[-1] * 100) for row in rows), np.int64, len(rows))
+
+        self.codes = {}
+        self.values = {}
+        for position, dimension in enumerate(self.dimensions, start=2):
+            values = {}
+            self.codes[dimension] = np.fromiter(
+                (values.setdefault(row[position], len(values)) for row in rows), np.int32, len(rows)
+            )
+            self.values[dimension] = values
+
+        # Entries of month m are months[month_ends[m - 1]:month_ends[m]]
+        self.month_ends = np.searchsorted(self.months, np.arange(self.months[-1] + 1), side="right")
+
+    def _codes_in(self, dimension: str, values: List[Optional[str]]) -> np.ndarray:
+        codes = [self.values[dimension][value] for value in values if value in self.values[dimension]]
+        return np.isin(self.codes[dimension], codes)
+
+    def _month_index(self, fiscal_year: int, fiscal_month: int) -> int:
+        return (fiscal_year - self.first_fiscal_year) * 12 + fiscal_month - 1
+
+    def monthly_cents(self, cube_filters: dict) -> Dict[Tuple[int, int], int]:
+        """Obligations in cents of the transactions matching cube_filters (see get_cube_filters) by fiscal month"""
+        mask = np.ones(len(self.cents), dtype=bool)
+
+        if "months" in cube_filters:
+            in_months = np.zeros(len(self.cents), dtype=bool)
+            for first, last in cube_filters["months"]:
+                in_months |= (self.months >= self._month_index(*first)) & (self.months <= self._month_index(*last))
+            mask &= in_months
+
+        if "types" in cube_filters:
+            mask &= self._codes_in("type", cube_filters["types"])
+
+        if "awarding_toptier_agency_names" in cube_filters:
+            mask &= self._codes_in("awarding_toptier_agency_name", cube_filters["awarding_toptier_agency_names"])
+
+        if "recipient_locations" in cube_filters:
+            in_locations = np.zeros(len(self.cents), dtype=bool)
+            for country, state in cube_filters["recipient_locations"]:
+                in_location = self._codes_in("recipient_location_country_code", [country])
+                if state is not None:
+                    in_location &= self._codes_in("recipient_location_state_code", [state])
+                in_locations |= in_location
+            mask &= in_locations
+
+        # Differences of the running total at month boundaries are the monthly sums, with no float rounding
+        running_total = np.concatenate(([0], np.cumsum(np.where(mask, self.cents, 0))))
+        totals = np.diff(running_total[np.concatenate(([0], self.month_ends))])
+        return {
+            (self.first_fiscal_year + int(month) // 12, int(month) % 12 + 1): int(totals[month])
+            for month in np.flatnonzero(totals)
+        }
+
+
+def _load_cube() -> Optional[SpendingOverTimeCube]:
+    rows = list(
+        SpendingOverTimeRollup.objects.order_by("fiscal_year", "fiscal_month").values_list(
+            "fiscal_year", "fiscal_month", *SpendingOverTimeCube.dimensions, "generated_pragmatic_obligation"
+        )
+    )
+    if not rows:
+        return None
+    logger.info(f"Loading {len(rows):,} spending_over_time rollups")
+    return SpendingOverTimeCube(rows)
+
+
+def _rollups_rewritten_at() -> str:
+    return str(get_last_load_date(CUBE_LOAD_KEY))
+
+
+_memoized_cube = memoize_per_generation(_load_cube, _rollups_rewritten_at)
+
+
+def get_spending_over_time_cube() -> Optional[SpendingOverTimeCube]:
+    """Returns this worker's cube, reloading it once the rollups are rewritten; None while the rollups are empty"""
+    return _memoized_cube()
+
+
+def _months(time_periods: List[dict]) -> Optional[List[Tuple[Tuple[int, int], Tuple[int, int]]]]:
+    """(first, last) fiscal (year, month) of each time period if every period starts and ends on a month boundary"""
+    months = []
+    for time_period in time_periods:
+        if time_period.get("date_type", "action_date") != "action_date":
+            return None
+        start_date = date.fromisoformat(time_period.get("start_date") or settings.API_SEARCH_MIN_DATE)
+        end_date = date.fromisoformat(time_period.get("end_date") or settings.API_MAX_DATE)
+        if start_date.day != 1 or end_date.day != monthrange(end_date.year, end_date.month)[1]:
+            return None
+        months.append(
+            (
+                (generate_fiscal_year(start_date), generate_fiscal_month(start_date)),
+                (generate_fiscal_year(end_date), generate_fiscal_month(end_date)),
+            )
+        )
+    return months
+
+
+def get_cube_filters(filters: dict) -> Optional[dict]:
+    """
+    Translates award search filters into SpendingOverTimeCube.monthly_cents filters.  Returns None when the filters
+    ask for anything the cube does not record: a filter other than month aligned time periods, award types,
+    awarding toptier agencies and recipient countries and states.
+    """
+    if not settings.ENABLE_SPENDING_OVER_TIME_CUBE or not set(filters).issubset(CUBE_FILTERS):
+        return None
+
+    cube_filters = {}
+    if "time_period" in filters:
+        months = _months(filters["time_period"])
+        if not months:
+            return None
+        cube_filters["months"] = months
+
+    if "award_type_codes" in filters:
+        if not filters["award_type_codes"]:
+            return None
+        cube_filters["types"] = filters["award_type_codes"]
+
+    if "agencies" in filters:
+        agencies = filters["agencies"]
+        if not agencies or any(a["type"] != "awarding" or a["tier"] != "toptier" for a in agencies):
+            return None
+        cube_filters["awarding_toptier_agency_names"] = [a["name"] for a in agencies]
+
+    if "recipient_locations" in filters:
+        locations = filters["recipient_locations"]
+        if not locations or any(set(location) - {"country", "state"} for location in locations):
+            return None
+        cube_filters["recipient_locations"] = [
+            (location["country"].upper(), location["state"].upper() if location.get("state") else None)
+            for location in locations
+        ]
+
+    return cube_filters
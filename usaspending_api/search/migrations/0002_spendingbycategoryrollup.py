@@ -0,0 +1,30 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('search', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SpendingByCategoryRollup',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('agg_key_name', models.TextField()),
+                ('fiscal_year', models.IntegerField(null=True)),
+                ('awarding_toptier_agency_name', models.TextField(null=True)),
+                ('type', models.TextField(null=True)),
+                ('agg_key', models.TextField()),
+                ('generated_pragmatic_obligation', models.DecimalField(decimal_places=2, max_digits=23)),
+            ],
+            options={
+                'db_table': 'spending_by_category_rollup',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='spendingbycategoryrollup',
+            index=models.Index(fields=['agg_key_name', 'fiscal_year'], name='sbc_rollup_key_name_fy_idx'),
+        ),
+    ]
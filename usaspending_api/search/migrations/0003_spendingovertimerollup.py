@@ -0,0 +1,32 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('search', '0002_spendingbycategoryrollup'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SpendingOverTimeRollup',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('fiscal_year', models.IntegerField()),
+                ('fiscal_month', models.IntegerField()),
+                ('awarding_toptier_agency_name', models.TextField(null=True)),
+                ('type', models.TextField(null=True)),
+                ('recipient_location_country_code', models.TextField(null=True)),
+                ('recipient_location_state_code', models.TextField(null=True)),
+                ('transaction_count', models.IntegerField()),
+                ('generated_pragmatic_obligation', models.DecimalField(decimal_places=2, max_digits=23)),
+            ],
+            options={
+                'db_table': 'spending_over_time_rollup',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='spendingovertimerollup',
+            index=models.Index(fields=['fiscal_year'], name='sot_rollup_fiscal_year_idx'),
+        ),
+    ]
@@ -6,6 +6,8 @@ from usaspending_api.search.models.mv_idv_award_search import IDVAwardSearchMatv
 from usaspending_api.search.models.mv_loan_award_search import LoanAwardSearchMatview
 from usaspending_api.search.models.mv_other_award_search import OtherAwardSearchMatview
 from usaspending_api.search.models.mv_pre2008_award_search import Pre2008AwardSearchMatview
+from usaspending_api.search.models.spending_by_category_rollup import SpendingByCategoryRollup
+from usaspending_api.search.models.spending_over_time_rollup import SpendingOverTimeRollup
 from usaspending_api.search.models.subaward_view import SubawardView
 from usaspending_api.search.models.summary_state_view import SummaryStateView
 from usaspending_api.search.models.summary_transaction_month_view import SummaryTransactionMonthView
@@ -25,6 +27,8 @@ __all__ = [
     "LoanAwardSearchMatview",
     "OtherAwardSearchMatview",
     "Pre2008AwardSearchMatview",
+    "SpendingByCategoryRollup",
+    "SpendingOverTimeRollup",
     "SubawardView",
     "SummaryStateView",
     "SummaryTransactionMonthView",
@@ -0,0 +1,21 @@
+from django.db import models
+
+
+class SpendingByCategoryRollup(models.Model):
+    """
+    Obligations summed by fiscal year, awarding toptier agency and award type for each value of the spending by
+    category aggregation keys.  Rebuilt from transaction_delta_view, the source of the transaction index, by the
+    load_spending_by_category_rollups command once the index has been loaded.
+    """
+
+    id = models.BigAutoField(primary_key=True)
+    agg_key_name = models.TextField()
+    fiscal_year = models.IntegerField(null=True)
+    awarding_toptier_agency_name = models.TextField(null=True)
+    type = models.TextField(null=True)
+    agg_key = models.TextField()
+    generated_pragmatic_obligation = models.DecimalField(max_digits=23, decimal_places=2)
+
+    class Meta:
+        db_table = "spending_by_category_rollup"
+        indexes = [models.Index(fields=["agg_key_name", "fiscal_year"], name="sbc_rollup_key_name_fy_idx")]
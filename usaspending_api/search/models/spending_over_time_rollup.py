@@ -0,0 +1,24 @@
+from django.db import models
+
+
+class SpendingOverTimeRollup(models.Model):
+    """
+    Transactions counted and obligations summed by fiscal month, awarding toptier agency, award type and recipient
+    location state.  Rebuilt from transaction_delta_view, the source of the transaction index, by the
+    load_spending_over_time_rollups command once the index has been loaded, and held in memory by each API worker as
+    the spending_over_time cube (see search.helpers.spending_over_time_cube).
+    """
+
+    id = models.BigAutoField(primary_key=True)
+    fiscal_year = models.IntegerField()
+    fiscal_month = models.IntegerField()
+    awarding_toptier_agency_name = models.TextField(null=True)
+    type = models.TextField(null=True)
+    recipient_location_country_code = models.TextField(null=True)
+    recipient_location_state_code = models.TextField(null=True)
+    transaction_count = models.IntegerField()
+    generated_pragmatic_obligation = models.DecimalField(max_digits=23, decimal_places=2)
+
+    class Meta:
+        db_table = "spending_over_time_rollup"
+        indexes = [models.Index(fields=["fiscal_year"], name="sot_rollup_fiscal_year_idx")]
@@ -0,0 +1,74 @@
+import json
+
+from decimal import Decimal
+from model_mommy import mommy
+
+from usaspending_api.search.tests.data.utilities import setup_elasticsearch_test
+
+
+def _post(client, category, filters, page=1, limit=10):
+    response = client.post(
+        f"/api/v2/search/spending_by_category/{category}",
+        content_type="application/json",
+        data=json.dumps({"filters": filters, "page": page, "limit": limit}),
+    )
+    assert response.status_code == 200
+    return response.json()
+
+
+def _cfda_rollup(fiscal_year, award_type, agency_name, cfda, amount):
+    mommy.make(
+        "search.SpendingByCategoryRollup",
+        agg_key_name="cfda_agg_key",
+        fiscal_year=fiscal_year,
+        awarding_toptier_agency_name=agency_name,
+        type=award_type,
+        agg_key=json.dumps({"code": cfda, "description": f"CFDA {cfda}", "id": cfda.replace(".", "")}),
+        generated_pragmatic_obligation=Decimal(amount),
+    )
+
+
+def _fail_elasticsearch_query(*args, **kwargs):
+    raise AssertionError("Elasticsearch should not be queried")
+
+
+def test_rollups_answer_common_filters(client, db, settings, monkeypatch):
+    settings.ENABLE_SPENDING_BY_CATEGORY_ROLLUPS = True
+    monkeypatch.setattr(
+        "usaspending_api.search.v2.views.spending_by_category_views.spending_by_category.AbstractSpendingByCategoryViewSet"
+        ".query_elasticsearch_for_prime_awards",
+        _fail_elasticsearch_query,
+    )
+
+    _cfda_rollup(2019, "02", "Department of Sandwiches", "10.100", "5.50")
+    _cfda_rollup(2020, "02", "Department of Sandwiches", "10.100", "1.25")
+    _cfda_rollup(2020, "03", "Department of Sandwiches", "20.200", "3.00")
+    _cfda_rollup(2020, "02", "Department of Pickles", "30.300", "100.00")
+    _cfda_rollup(2021, "02", "Department of Sandwiches", "30.300", "100.00")
+
+    filters = {
+        "time_period": [{"start_date": "2018-10-01", "end_date": "2020-09-30"}],
+        "agencies": [{"type": "awarding", "tier": "toptier", "name": "Department of Sandwiches"}],
+    }
+    response = _post(client, "cfda", filters)
+    assert response["results"] == [
+        {"amount": 6.75, "code": "10.100", "id": 10100, "name": "CFDA 10.100"},
+        {"amount": 3.0, "code": "20.200", "id": 20200, "name": "CFDA 20.200"},
+    ]
+
+    response = _post(client, "cfda", dict(filters, award_type_codes=["03"]))
+    assert [r["code"] for r in response["results"]] == ["20.200"]
+
+    response = _post(client, "cfda", {}, page=2, limit=1)
+    assert [r["code"] for r in response["results"]] == ["10.100"]
+    assert response["page_metadata"]["hasNext"] is True
+
+
+def test_composite_paging(client, monkeypatch, elasticsearch_transaction_index, awards_and_transactions, settings):
+    setup_elasticsearch_test(monkeypatch, elasticsearch_transaction_index)
+    filters = {"time_period": [{"start_date": "2018-10-01", "end_date": "2020-09-30"}]}
+
+    expected = _post(client, "cfda", filters)["results"]
+    settings.ES_COMPOSITE_PAGE_SIZE = 1
+    assert _post(client, "cfda", filters)["results"] == expected
+    assert [r["code"] for r in expected] == ["20.200", "10.100"]
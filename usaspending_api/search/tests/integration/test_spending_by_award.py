@@ -5,6 +5,7 @@ from datetime import datetime
 from model_mommy import mommy
 from rest_framework import status
 from usaspending_api.awards.v2.lookups.lookups import all_award_types_mappings
+from usaspending_api.common.helpers.pagination_helpers import encode_cursor
 from usaspending_api.search.tests.data.search_filters_test_data import non_legacy_filters, legacy_filters
 from usaspending_api.search.tests.data.utilities import setup_elasticsearch_test
 
@@ -85,6 +86,42 @@ def test_spending_by_award_subaward_success(client, spending_by_award_test_data)
     }
 
 
+@pytest.mark.django_db
+def test_spending_by_award_subaward_cursor(client, spending_by_award_test_data):
+    request = {
+        "subawards": True,
+        "fields": ["Sub-Award ID", "Sub-Award Amount"],
+        "sort": "Sub-Award Amount",
+        "filters": {"award_type_codes": ["A"]},
+        "limit": 1,
+        "page": 1,
+    }
+
+    first_page = client.post(
+        "/api/v2/search/spending_by_award", content_type="application/json", data=json.dumps(request)
+    )
+    assert first_page.status_code == status.HTTP_200_OK
+    assert first_page.json()["page_metadata"]["hasNext"]
+
+    request["page"] = 2
+    second_page = client.post(
+        "/api/v2/search/spending_by_award", content_type="application/json", data=json.dumps(request)
+    )
+
+    request["page"] = 1
+    request["cursor"] = first_page.json()["page_metadata"]["next_cursor"]
+    after_cursor = client.post(
+        "/api/v2/search/spending_by_award", content_type="application/json", data=json.dumps(request)
+    )
+    assert after_cursor.status_code == status.HTTP_200_OK
+    assert after_cursor.json()["results"] == second_page.json()["results"]
+    assert after_cursor.json()["page_metadata"]["next_cursor"] == second_page.json()["page_metadata"]["next_cursor"]
+
+    request["cursor"] = "not a cursor"
+    resp = client.post("/api/v2/search/spending_by_award", content_type="application/json", data=json.dumps(request))
+    assert resp.status_code == status.HTTP_400_BAD_REQUEST
+
+
 @pytest.mark.django_db
 def test_spending_by_award_legacy_filters(client, monkeypatch, elasticsearch_award_index):
     setup_elasticsearch_test(monkeypatch, elasticsearch_award_index)
@@ -1215,3 +1252,29 @@ def test_search_after(client, monkeypatch, spending_by_award_test_data, elastics
     assert resp.status_code == status.HTTP_200_OK
     assert len(resp.json().get("results")) == 2
     assert resp.json().get("results") == expected_result, "Award Type Code filter does not match expected result"
+
+
+@pytest.mark.django_db
+def test_search_after_cursor(client, monkeypatch, spending_by_award_test_data, elasticsearch_award_index):
+    setup_elasticsearch_test(monkeypatch, elasticsearch_award_index)
+
+    resp = client.post(
+        "/api/v2/search/spending_by_award",
+        content_type="application/json",
+        data=json.dumps(
+            {
+                "filters": {"award_type_codes": ["A", "B", "C", "D"]},
+                "fields": ["Award ID"],
+                "limit": 1,
+                "sort": "Award ID",
+                "order": "asc",
+                "subawards": False,
+                "cursor": encode_cursor(["abc111", 1]),
+            }
+        ),
+    )
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp.json()["results"] == [
+        {"internal_id": 2, "Award ID": "abc222", "generated_internal_id": "CONT_AWD_TESTING_2"}
+    ]
+    assert resp.json()["page_metadata"]["next_cursor"] == encode_cursor(["abc222", 2])
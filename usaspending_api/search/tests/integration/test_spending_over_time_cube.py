@@ -0,0 +1,105 @@
+import json
+import pytest
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from model_mommy import mommy
+
+from usaspending_api.broker.helpers.last_load_date import update_last_load_date
+from usaspending_api.search.helpers import spending_over_time_cube
+from usaspending_api.search.helpers.spending_over_time_cube import CUBE_LOAD_KEY
+
+
+@pytest.fixture
+def cube(db, settings, monkeypatch):
+    """Enables the cube and starts from rollups that have never been rewritten, so this test's rollups are loaded"""
+    settings.ENABLE_SPENDING_OVER_TIME_CUBE = True
+    monkeypatch.setattr(
+        "usaspending_api.search.v2.views.spending_over_time.SpendingOverTimeVisualizationViewSet"
+        ".query_elasticsearch_for_prime_awards",
+        _fail_elasticsearch_query,
+    )
+    mommy.make("broker.ExternalDataType", external_data_type_id=103, name=CUBE_LOAD_KEY)
+    spending_over_time_cube._memoized_cube.cache_clear()
+    yield
+    spending_over_time_cube._memoized_cube.cache_clear()
+
+
+def _post(client, group, filters):
+    response = client.post(
+        "/api/v2/search/spending_over_time",
+        content_type="application/json",
+        data=json.dumps({"group": group, "filters": filters}),
+    )
+    assert response.status_code == 200
+    return response.json()
+
+
+def _rollup(fiscal_year, fiscal_month, award_type, state, amount):
+    mommy.make(
+        "search.SpendingOverTimeRollup",
+        fiscal_year=fiscal_year,
+        fiscal_month=fiscal_month,
+        awarding_toptier_agency_name="Department of Sandwiches",
+        type=award_type,
+        recipient_location_country_code="USA",
+        recipient_location_state_code=state,
+        transaction_count=1,
+        generated_pragmatic_obligation=Decimal(amount),
+    )
+
+
+def _fail_elasticsearch_query(*args, **kwargs):
+    raise AssertionError("Elasticsearch should not be queried")
+
+
+def test_cube_answers_common_filters(client, cube):
+    _rollup(2020, 1, "A", "VA", "1.10")
+    _rollup(2020, 2, "A", "MD", "2.20")
+    _rollup(2020, 5, "B", "VA", "3.30")
+    _rollup(2021, 1, "A", "VA", "4.40")
+
+    filters = {"time_period": [{"start_date": "2019-10-01", "end_date": "2020-09-30"}], "award_type_codes": ["A", "B"]}
+    response = _post(client, "fiscal_year", filters)
+    assert response["results"] == [{"aggregated_amount": 6.6, "time_period": {"fiscal_year": "2020"}}]
+
+    response = _post(client, "quarter", dict(filters, recipient_locations=[{"country": "USA", "state": "VA"}]))
+    assert response["results"] == [
+        {"aggregated_amount": 1.1, "time_period": {"fiscal_year": "2020", "quarter": "1"}},
+        {"aggregated_amount": 3.3, "time_period": {"fiscal_year": "2020", "quarter": "2"}},
+        {"aggregated_amount": 0.0, "time_period": {"fiscal_year": "2020", "quarter": "3"}},
+        {"aggregated_amount": 0.0, "time_period": {"fiscal_year": "2020", "quarter": "4"}},
+    ]
+
+    response = _post(client, "month", {"time_period": [{"start_date": "2020-10-01", "end_date": "2020-11-30"}]})
+    assert response["results"] == [
+        {"aggregated_amount": 4.4, "time_period": {"fiscal_year": "2021", "month": "1"}},
+        {"aggregated_amount": 0.0, "time_period": {"fiscal_year": "2021", "month": "2"}},
+    ]
+
+
+def test_cube_falls_back_to_elasticsearch(client, cube, monkeypatch):
+    monkeypatch.setattr(
+        "usaspending_api.search.v2.views.spending_over_time.SpendingOverTimeVisualizationViewSet"
+        ".query_elasticsearch_for_prime_awards",
+        lambda self, time_periods: [{"aggregated_amount": 1, "time_period": {"fiscal_year": "2020"}}],
+    )
+    _rollup(2020, 1, "A", "VA", "1.10")
+
+    filters = {"time_period": [{"start_date": "2019-10-15", "end_date": "2020-09-30"}]}
+    assert _post(client, "fiscal_year", filters)["results"][0]["aggregated_amount"] == 1
+    filters = {"time_period": [{"start_date": "2019-10-01", "end_date": "2020-09-30"}], "keywords": ["sandwich"]}
+    assert _post(client, "fiscal_year", filters)["results"][0]["aggregated_amount"] == 1
+
+
+def test_cube_reloaded_once_rollups_are_rewritten(client, cube):
+    filters = {"time_period": [{"start_date": "2019-10-01", "end_date": "2020-09-30"}]}
+    _rollup(2020, 1, "A", "VA", "1.10")
+    assert _post(client, "fiscal_year", filters)["results"][0]["aggregated_amount"] == 1.1
+
+    # without a shared cache every data generation check finds a new generation; the cube must not reload on that
+    _rollup(2020, 2, "A", "VA", "2.20")
+    assert _post(client, "fiscal_year", filters)["results"][0]["aggregated_amount"] == 1.1
+
+    update_last_load_date(CUBE_LOAD_KEY, datetime.now(timezone.utc) + timedelta(seconds=1))
+    assert _post(client, "fiscal_year", filters)["results"][0]["aggregated_amount"] == 3.3
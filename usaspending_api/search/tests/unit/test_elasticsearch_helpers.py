@@ -6,6 +6,8 @@ from model_mommy import mommy
 
 from usaspending_api.search.tests.data.utilities import setup_elasticsearch_test
 from usaspending_api.search.v2.elasticsearch_helper import (
+    get_cents_sum_aggregation,
+    get_scaled_sum_aggregations,
     spending_by_transaction_count,
     get_download_ids,
     es_minimal_sanitize,
@@ -134,3 +136,26 @@ def test_swap_keys():
         "action_date": "action_date",
         "transaction_amount": "transaction_amount",
     }
+
+
+def test_get_cents_sum_aggregation(settings):
+    settings.ES_SUM_CENTS_FIELDS = True
+    assert get_cents_sum_aggregation("generated_pragmatic_obligation").to_dict() == {
+        "sum": {"field": "generated_pragmatic_obligation_cents"}
+    }
+
+    # Fields without a cents companion are still scaled by a script
+    assert get_cents_sum_aggregation("total_obligation").to_dict() == {
+        "sum": {"field": "total_obligation", "script": {"source": "_value * 100"}}
+    }
+
+    settings.ES_SUM_CENTS_FIELDS = False
+    assert get_cents_sum_aggregation("generated_pragmatic_obligation").to_dict() == {
+        "sum": {"field": "generated_pragmatic_obligation", "script": {"source": "_value * 100"}}
+    }
+
+
+def test_get_scaled_sum_aggregations_uses_cents_field(settings):
+    settings.ES_SUM_CENTS_FIELDS = True
+    aggs = get_scaled_sum_aggregations("generated_pragmatic_obligation")
+    assert aggs["sum_field"].to_dict() == {"sum": {"field": "generated_pragmatic_obligation_cents"}}
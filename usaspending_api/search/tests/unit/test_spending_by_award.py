@@ -3,6 +3,7 @@ import pytest
 from usaspending_api.awards.v2.lookups.lookups import contract_subaward_mapping
 from usaspending_api.common.helpers.api_helper import raise_if_award_types_not_valid_subset, raise_if_sort_key_not_valid
 from usaspending_api.common.helpers.generic_helper import get_time_period_message
+from usaspending_api.common.helpers.pagination_helpers import encode_cursor
 from usaspending_api.search.v2.views.spending_by_award import SpendingByAwardVisualizationViewSet, GLOBAL_MAP
 from usaspending_api.common.exceptions import UnprocessableEntityException, InvalidParameterException
 
@@ -22,6 +23,7 @@ def instantiate_view_for_tests():
         "sort_order": "desc",
         "upper_bound": 6,
     }
+    view.cursor = None
     return view
 
 
@@ -133,10 +135,25 @@ def test_populate_response():
     expected_dictionary = {
         "limit": 5,
         "results": ["item 1", "item 2"],
-        "page_metadata": {"page": 1, "hasNext": True},
+        "page_metadata": {"page": 1, "hasNext": True, "next_cursor": None},
         "messages": [get_time_period_message()],
     }
     assert view.populate_response(results=["item 1", "item 2"], has_next=True) == expected_dictionary
 
     expected_dictionary["results"] = []
     assert view.populate_response(results=[], has_next=True) == expected_dictionary
+
+
+def test_get_queryset_after_cursor():
+    view = instantiate_view_for_tests()
+    view.cursor = encode_cursor(["ABC", 10])
+
+    sql = str(view.construct_queryset().query)
+
+    assert view.sort_by_fields == ["piid", "subaward_id"]
+    assert '"subaward_view"."subaward_id" < 10' in sql
+    assert "OFFSET" not in sql
+
+    view.cursor = encode_cursor(["ABC"])
+    with pytest.raises(InvalidParameterException):
+        view.construct_queryset()
@@ -0,0 +1,53 @@
+import pytest
+
+from usaspending_api.search.helpers.spending_by_category_rollups import get_rollup_filters
+
+
+@pytest.fixture
+def rollups_enabled(settings):
+    settings.ENABLE_SPENDING_BY_CATEGORY_ROLLUPS = True
+
+
+def test_rollups_disabled(settings):
+    settings.ENABLE_SPENDING_BY_CATEGORY_ROLLUPS = False
+    assert get_rollup_filters({}) is None
+
+
+def test_common_filters(rollups_enabled):
+    assert get_rollup_filters({}) == {}
+
+    filters = {
+        "time_period": [
+            {"start_date": "2017-10-01", "end_date": "2019-09-30"},
+            {"start_date": "2018-10-01", "end_date": "2020-09-30"},
+        ],
+        "award_type_codes": ["A", "B"],
+        "agencies": [{"type": "awarding", "tier": "toptier", "name": "Department of Sandwiches"}],
+    }
+    assert get_rollup_filters(filters) == {
+        "fiscal_year__in": [2018, 2019, 2020],
+        "type__in": ["A", "B"],
+        "awarding_toptier_agency_name__in": ["Department of Sandwiches"],
+    }
+
+
+def test_time_period_defaults(rollups_enabled, settings):
+    settings.API_SEARCH_MIN_DATE = "2007-10-01"
+    settings.API_MAX_DATE = "2010-09-30"
+    assert get_rollup_filters({"time_period": [{}]}) == {"fiscal_year__in": [2008, 2009, 2010]}
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        {"time_period": [{"start_date": "2018-10-02", "end_date": "2019-09-30"}]},
+        {"time_period": [{"start_date": "2018-10-01", "end_date": "2019-06-30"}]},
+        {"award_type_codes": []},
+        {"agencies": [{"type": "funding", "tier": "toptier", "name": "Department of Sandwiches"}]},
+        {"agencies": [{"type": "awarding", "tier": "subtier", "name": "Bureau of Bread"}]},
+        {"recipient_search_text": ["Acme"]},
+        {"keywords": ["pickles"], "award_type_codes": ["A"]},
+    ],
+)
+def test_filters_the_rollups_cannot_answer(rollups_enabled, filters):
+    assert get_rollup_filters(filters) is None
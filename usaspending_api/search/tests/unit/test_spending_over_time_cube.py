@@ -0,0 +1,85 @@
+import pytest
+
+from decimal import Decimal
+
+from usaspending_api.search.helpers.spending_over_time_cube import get_cube_filters, SpendingOverTimeCube
+
+
+@pytest.fixture
+def cube_enabled(settings):
+    settings.ENABLE_SPENDING_OVER_TIME_CUBE = True
+
+
+@pytest.fixture
+def cube():
+    return SpendingOverTimeCube(
+        [
+            (2019, 12, "Department of Sandwiches", "A", "USA", "VA", Decimal("1.10")),
+            (2020, 1, "Department of Sandwiches", "A", "USA", "VA", Decimal("2.20")),
+            (2020, 1, "Department of Pickles", "02", "USA", "MD", Decimal("0.01")),
+            (2020, 1, "Department of Pickles", "02", "CAN", None, Decimal("100.00")),
+            (2020, 4, "Department of Sandwiches", "B", None, None, Decimal("-0.30")),
+            (2021, 2, "Department of Sandwiches", "A", "USA", "VA", Decimal("4.00")),
+        ]
+    )
+
+
+def test_cube_disabled(settings):
+    settings.ENABLE_SPENDING_OVER_TIME_CUBE = False
+    assert get_cube_filters({}) is None
+
+
+def test_common_filters(cube_enabled):
+    assert get_cube_filters({}) == {}
+
+    filters = {
+        "time_period": [
+            {"start_date": "2019-10-01", "end_date": "2019-12-31"},
+            {"start_date": "2020-02-01", "end_date": "2020-02-29", "date_type": "action_date"},
+        ],
+        "award_type_codes": ["A", "B"],
+        "agencies": [{"type": "awarding", "tier": "toptier", "name": "Department of Sandwiches"}],
+        "recipient_locations": [{"country": "usa", "state": "va"}, {"country": "CAN"}],
+    }
+    assert get_cube_filters(filters) == {
+        "months": [((2020, 1), (2020, 3)), ((2020, 5), (2020, 5))],
+        "types": ["A", "B"],
+        "awarding_toptier_agency_names": ["Department of Sandwiches"],
+        "recipient_locations": [("USA", "VA"), ("CAN", None)],
+    }
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        {"keywords": ["sandwich"]},
+        {"time_period": [{"start_date": "2019-10-02", "end_date": "2019-12-31"}]},
+        {"time_period": [{"start_date": "2019-10-01", "end_date": "2019-12-30"}]},
+        {"time_period": [{"start_date": "2019-10-01", "end_date": "2019-12-31", "date_type": "last_modified_date"}]},
+        {"award_type_codes": []},
+        {"agencies": [{"type": "funding", "tier": "toptier", "name": "Department of Sandwiches"}]},
+        {"recipient_locations": [{"country": "USA", "state": "VA", "county": "059"}]},
+    ],
+)
+def test_filters_the_cube_does_not_cover(cube_enabled, filters):
+    assert get_cube_filters(filters) is None
+
+
+def test_monthly_cents(cube):
+    assert cube.monthly_cents({}) == {(2019, 12): 110, (2020, 1): 10221, (2020, 4): -30, (2021, 2): 400}
+    assert cube.monthly_cents({"months": [((2020, 1), (2020, 12))]}) == {(2020, 1): 10221, (2020, 4): -30}
+    assert cube.monthly_cents({"months": [((2019, 1), (2019, 12)), ((2021, 2), (2021, 2))]}) == {
+        (2019, 12): 110,
+        (2021, 2): 400,
+    }
+    assert cube.monthly_cents({"types": ["A", "Z"]}) == {(2019, 12): 110, (2020, 1): 220, (2021, 2): 400}
+    assert cube.monthly_cents({"awarding_toptier_agency_names": ["Department of Pickles"]}) == {(2020, 1): 10001}
+    assert cube.monthly_cents({"recipient_locations": [("USA", None)]}) == {
+        (2019, 12): 110,
+        (2020, 1): 221,
+        (2021, 2): 400,
+    }
+    assert cube.monthly_cents({"recipient_locations": [("USA", "MD"), ("CAN", None)], "types": ["02"]}) == {
+        (2020, 1): 10001
+    }
+    assert cube.monthly_cents({"types": ["Z"]}) == {}
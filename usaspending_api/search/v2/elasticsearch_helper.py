@@ -1,5 +1,5 @@
 import logging
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 from django.conf import settings
 from elasticsearch_dsl import A, Q as ES_Q
@@ -9,7 +9,7 @@ from usaspending_api.awards.v2.lookups.elasticsearch_lookups import (
     INDEX_ALIASES_TO_AWARD_TYPES,
 )
 from usaspending_api.common.data_classes import Pagination
-from usaspending_api.common.elasticsearch.search_wrappers import TransactionSearch
+from usaspending_api.common.elasticsearch.search_wrappers import TransactionMultiSearch, TransactionSearch
 from usaspending_api.common.query_with_filters import QueryWithFilters
 from usaspending_api.search.v2.es_sanitization import es_minimal_sanitize
 
@@ -105,10 +105,13 @@ def get_download_ids(keyword, field, size=10000):
     total = sum(results[category]["doc_count"] for category in INDEX_ALIASES_TO_AWARD_TYPES.keys())
     required_iter = (total // size) + 1
     n_iter = min(max(1, required_iter), n_iter)
+
+    # The partitions are independent, so they are all requested in a single round trip
+    filter_query = QueryWithFilters.generate_transactions_elasticsearch_query(
+        {"keyword_search": [es_minimal_sanitize(keyword)]}
+    )
+    multi_search = TransactionMultiSearch()
     for i in range(n_iter):
-        filter_query = QueryWithFilters.generate_transactions_elasticsearch_query(
-            {"keyword_search": [es_minimal_sanitize(keyword)]}
-        )
         search = TransactionSearch().filter(filter_query)
         group_by_agg_key_values = {
             "field": field,
@@ -118,13 +121,14 @@ def get_download_ids(keyword, field, size=10000):
         }
         aggs = A("terms", **group_by_agg_key_values)
         search.aggs.bucket("results", aggs)
-        response = search.handle_execute()
-        if response is None:
-            raise Exception("Breaking generator, unable to reach cluster")
-        results = []
-        for result in response["aggregations"]["results"]["buckets"]:
-            results.append(result["key"])
-        yield results
+        search.update_from_dict({"size": 0})
+        multi_search = multi_search.add(search)
+
+    responses = multi_search.handle_execute()
+    if responses is None:
+        raise Exception("Breaking generator, unable to reach cluster")
+    for response in responses:
+        yield [result["key"] for result in response["aggregations"]["results"]["buckets"]]
 
 
 def get_sum_and_count_aggregation_results(keyword):
@@ -154,34 +158,35 @@ def spending_by_transaction_sum_and_count(request_data):
     return get_sum_and_count_aggregation_results(request_data["filters"]["keywords"])
 
 
-def get_number_of_unique_terms(filter_query: ES_Q, field: str) -> int:
+# Integer cents companions of the amounts that aggregations sum; see transaction_delta_view
+CENTS_FIELDS = {
+    "face_value_loan_guarantee": "face_value_loan_guarantee_cents",
+    "generated_pragmatic_obligation": "generated_pragmatic_obligation_cents",
+}
+
+
+def get_cents_sum_aggregation(field_to_sum: str) -> A:
     """
-    Returns the count for a specific filter_query.
-    NOTE: This will only work when the number of unique values is 40k or less. This is captured in the Elasticsearch
-    documentation for the cardinality aggregation:
-        "The maximum supported value is 40000, thresholds above this number will
-        have the same effect as a threshold of 40000"
+    Sum of field_to_sum in cents.  Sums its integer cents companion natively where the index has one, otherwise
+    scales every value with a script, which is much slower since the script runs for every matching document.
     """
-    search = TransactionSearch().filter(filter_query)
-    cardinality_aggregation = A("cardinality", field=field)
-    search.aggs.metric("field_count", cardinality_aggregation)
-    response = search.handle_execute()
-    response_dict = response.aggs.to_dict()
-    return response_dict.get("field_count", {"value": 0})["value"]
+    if settings.ES_SUM_CENTS_FIELDS and field_to_sum in CENTS_FIELDS:
+        return A("sum", field=CENTS_FIELDS[field_to_sum])
+    return A("sum", field=field_to_sum, script={"source": "_value * 100"})
 
 
 def get_scaled_sum_aggregations(field_to_sum: str, pagination: Optional[Pagination] = None) -> Dict[str, A]:
     """
     Creates a sum and bucket_sort aggregation that can be used for many different aggregations.
-    The sum aggregation scaled the values by 100 so that the scaled_floats are handled as integers to avoid
-    issues surrounding floats. This does mean that after retrieving results from Elasticsearch something
+    The sum aggregation is in cents (see get_cents_sum_aggregation) so that the scaled_floats are handled as integers
+    to avoid issues surrounding floats. This does mean that after retrieving results from Elasticsearch something
     similar to the code below is needed to convert to two decimal places.
 
         Example:
         Decimal(bucket.get("sum_field", {"value": 0})["value"]) / Decimal("100")
 
     """
-    sum_field = A("sum", field=field_to_sum, script={"source": "_value * 100"})
+    sum_field = get_cents_sum_aggregation(field_to_sum)
 
     if pagination:
         # Have to create a separate dictionary for the bucket_sort values since "from" is a reserved word
@@ -198,3 +203,36 @@ def get_scaled_sum_aggregations(field_to_sum: str, pagination: Optional[Paginati
         return {"sum_field": sum_field, "sum_bucket_sort": sum_bucket_sort, "sum_bucket_truncate": sum_bucket_truncate}
     else:
         return {"sum_field": sum_field}
+
+
+def get_summed_buckets(filter_query: ES_Q, field: str, field_to_sum: str) -> List[dict]:
+    """
+    Returns a terms aggregation style bucket ({"key", "doc_count", "sum_field"}) for every value of field among the
+    transactions matching filter_query, with sum_field scaled as in get_scaled_sum_aggregations.  The buckets are
+    collected by paging through a composite aggregation, so unlike a terms aggregation the sums are exact and there
+    is no limit on the number of buckets; they are returned in no particular order.
+    """
+    sum_field = get_scaled_sum_aggregations(field_to_sum)["sum_field"]
+    buckets = []
+    after_key = None
+    while True:
+        composite_values = {
+            "size": settings.ES_COMPOSITE_PAGE_SIZE,
+            "sources": [{"agg_key": {"terms": {"field": field}}}],
+        }
+        if after_key is not None:
+            composite_values["after"] = after_key
+
+        search = TransactionSearch().filter(filter_query)
+        search.aggs.bucket("group_by_agg_key", A("composite", **composite_values)).metric("sum_field", sum_field)
+        search.update_from_dict({"size": 0})
+        response = search.handle_execute().aggs.to_dict()["group_by_agg_key"]
+
+        for bucket in response["buckets"]:
+            buckets.append(
+                {"key": bucket["key"]["agg_key"], "doc_count": bucket["doc_count"], "sum_field": bucket["sum_field"]}
+            )
+
+        after_key = response.get("after_key")
+        if after_key is None or len(response["buckets"]) < settings.ES_COMPOSITE_PAGE_SIZE:
+            return buckets
@@ -1,6 +1,7 @@
 import copy
 
 from sys import maxsize
+from typing import Optional
 from django.conf import settings
 from django.db.models import F
 from rest_framework.response import Response
@@ -41,6 +42,7 @@ from usaspending_api.common.helpers.api_helper import raise_if_award_types_not_v
 from usaspending_api.common.helpers.sql_helpers import execute_sql_to_ordered_dictionary
 from usaspending_api.common.query_with_filters import QueryWithFilters
 from usaspending_api.common.helpers.generic_helper import get_generic_filters_message
+from usaspending_api.common.helpers.pagination_helpers import decode_cursor, encode_cursor, keyset_filter
 from usaspending_api.common.validator.award_filter import AWARD_FILTER_NO_RECIPIENT_ID
 from usaspending_api.common.validator.pagination import PAGINATION
 from usaspending_api.common.validator.tinyshield import TinyShield
@@ -62,11 +64,12 @@ GLOBAL_MAP = {
         },
     },
     "subaward": {
-        "minimum_db_fields": {"subaward_number", "piid", "fain", "award_type", "award_id"},
+        "minimum_db_fields": {"subaward_number", "piid", "fain", "award_type", "award_id", "subaward_id"},
         "api_to_db_mapping_list": [contract_subaward_mapping, grant_subaward_mapping],
         "award_semaphore": "award_type",
         "award_id_fields": ["award__piid", "award__fain"],
         "internal_id_fields": {"internal_id": "subaward_number", "prime_award_internal_id": "award_id"},
+        "unique_sort_field": "subaward_id",
         "generated_award_field": ("prime_award_generated_internal_id", "prime_award_internal_id"),
         "type_code_to_field_map": {"procurement": contract_subaward_mapping, "grant": grant_subaward_mapping},
         "annotations": {"_prime_award_recipient_id": annotate_prime_award_recipient_id},
@@ -109,11 +112,14 @@ class SpendingByAwardVisualizationViewSet(APIView):
         raise_if_award_types_not_valid_subset(self.filters["award_type_codes"], self.is_subaward)
         raise_if_sort_key_not_valid(self.pagination["sort_key"], self.fields, self.is_subaward)
 
+        self.cursor = json_request.get("cursor")
         if self.is_subaward:
             response = Response(self.create_response_for_subawards(self.construct_queryset()))
         else:
             self.last_record_unique_id = json_request.get("last_record_unique_id")
             self.last_record_sort_value = json_request.get("last_record_sort_value")
+            if self.cursor is not None:
+                self.last_record_sort_value, self.last_record_unique_id = decode_cursor(self.cursor, 2)
             response = Response(self.construct_es_response_for_prime_awards(self.query_elasticsearch()))
         return response
 
@@ -151,6 +157,7 @@ class SpendingByAwardVisualizationViewSet(APIView):
                 "required": False,
                 "allow_nulls": True,
             },
+            {"name": "cursor", "key": "cursor", "type": "text", "text_type": "raw", "allow_nulls": True},
         ]
         models.extend(copy.deepcopy(AWARD_FILTER_NO_RECIPIENT_ID))
         models.extend(copy.deepcopy(PAGINATION))
@@ -165,11 +172,16 @@ class SpendingByAwardVisualizationViewSet(APIView):
         return "no intersection" in self.filters["award_type_codes"]
 
     def construct_queryset(self):
-        sort_by_fields = self.get_sort_by_fields()
-        database_fields = self.get_database_fields()
+        # Ending with a unique field gives every record a distinct position for the cursor of its page to point at
+        self.sort_by_fields = self.get_sort_by_fields() + [self.constants["unique_sort_field"]]
+        database_fields = self.get_database_fields() | set(self.sort_by_fields)
         base_queryset = self.constants["filter_queryset_func"](self.filters)
         queryset = self.annotate_queryset(base_queryset)
-        queryset = self.custom_queryset_order_by(queryset, sort_by_fields, self.pagination["sort_order"])
+        queryset = self.custom_queryset_order_by(queryset, self.sort_by_fields, self.pagination["sort_order"])
+        if self.cursor is not None:
+            last_record = decode_cursor(self.cursor, len(self.sort_by_fields))
+            queryset = queryset.filter(keyset_filter(self.sort_by_fields, last_record, self.pagination["sort_order"]))
+            return queryset.values(*list(database_fields))[: self.pagination["limit"] + 1]
         return queryset.values(*list(database_fields))[self.pagination["lower_bound"] : self.pagination["upper_bound"]]
 
     def create_response_for_subawards(self, queryset):
@@ -192,7 +204,13 @@ class SpendingByAwardVisualizationViewSet(APIView):
 
         results = self.add_award_generated_id_field(results)
 
-        return self.populate_response(results=results, has_next=len(rows) > self.pagination["limit"])
+        has_next = len(rows) > self.pagination["limit"]
+        next_cursor = None
+        if has_next:
+            last_record = rows[self.pagination["limit"] - 1]
+            next_cursor = encode_cursor([last_record[field] for field in self.sort_by_fields])
+
+        return self.populate_response(results=results, has_next=has_next, next_cursor=next_cursor)
 
     def add_award_generated_id_field(self, records):
         """Obtain the generated_unique_award_id and add to response"""
@@ -254,11 +272,11 @@ class SpendingByAwardVisualizationViewSet(APIView):
 
         return queryset.order_by(*order_by_list)
 
-    def populate_response(self, results: list, has_next: bool) -> dict:
+    def populate_response(self, results: list, has_next: bool, next_cursor: Optional[str] = None) -> dict:
         return {
             "limit": self.pagination["limit"],
             "results": results,
-            "page_metadata": {"page": self.pagination["page"], "hasNext": has_next},
+            "page_metadata": {"page": self.pagination["page"], "hasNext": has_next, "next_cursor": next_cursor},
             "messages": get_generic_filters_message(
                 self.original_filters.keys(), [elem["name"] for elem in AWARD_FILTER_NO_RECIPIENT_ID]
             ),
@@ -283,8 +301,8 @@ class SpendingByAwardVisualizationViewSet(APIView):
         ):
             raise UnprocessableEntityException(
                 f"Page #{self.pagination['page']} with limit {self.pagination['limit']} is over the maximum result"
-                f" limit {settings.ES_AWARDS_MAX_RESULT_WINDOW}. Please provide the 'last_record_sort_value' and"
-                " 'last_record_unique_id' to paginate sequentially."
+                f" limit {settings.ES_AWARDS_MAX_RESULT_WINDOW}. Please provide the 'cursor' of the previous page to"
+                " paginate sequentially."
             )
         # Search_after values are provided in the API request - use search after
         if self.last_record_sort_value is not None and self.last_record_unique_id is not None:
@@ -300,20 +318,38 @@ class SpendingByAwardVisualizationViewSet(APIView):
         else:
             search = AwardSearch().filter(filter_query).sort(*sorts)[record_num : record_num + self.pagination["limit"]]
 
-        response = search.handle_execute()
+        if "Awarding Agency" in self.fields:
+            # The agency ids do not depend on the search, so look them up on this thread, with its database connection,
+            # while Elasticsearch runs it
+            background_search = search.handle_execute_in_background()
+            self.agency_ids = self.get_agency_database_ids()
+            response = background_search.result()
+        else:
+            response = search.handle_execute()
 
         return response
 
+    @staticmethod
+    def get_agency_database_ids() -> dict:
+        """Toptier agency ids by toptier code, for the agencies that have made submissions"""
+        agency_ids = {}
+        for toptier_code, agency_id in (
+            Agency.objects.filter(toptier_flag=True).order_by("-id").values_list("toptier_agency__toptier_code", "id")
+        ):
+            agency_ids[toptier_code] = agency_id  # Ordered so that the lowest id is kept, as first() would
+        submitted = set(
+            SubmissionAttributes.objects.filter(toptier_code__in=agency_ids)
+            .values_list("toptier_code", flat=True)
+            .distinct()
+        )
+        return {code: agency_id for code, agency_id in agency_ids.items() if code in submitted}
+
     # For an unknown reason, ES tends to return the awarding agency toptier codes as integers or floats, instead of as
     # text. This function casts the code back to a string and appends any leading zeroes that were lost.
     def get_agency_database_id(self, code):
         if len(str(int(code))) < 3:
             code = "{zeroes}{code}".format(zeroes=("0" * (3 - len(str(int(code))))), code=int(code))
-        agency_id = Agency.objects.filter(toptier_agency__toptier_code=code, toptier_flag=True).first()
-        submission = SubmissionAttributes.objects.filter(toptier_code=code).first()
-        if submission is None or agency_id is None:
-            return None
-        return agency_id.id
+        return self.agency_ids.get(code)
 
     def construct_es_response_for_prime_awards(self, response) -> dict:
         results = []
@@ -355,6 +391,7 @@ class SpendingByAwardVisualizationViewSet(APIView):
 
         last_record_unique_id = None
         last_record_sort_value = None
+        next_cursor = None
         offset = 1
         if self.last_record_unique_id is not None:
             has_next = len(results) > self.pagination["limit"]
@@ -368,6 +405,7 @@ class SpendingByAwardVisualizationViewSet(APIView):
         if len(response) > 0 and has_next:
             last_record_unique_id = response[len(response) - offset].meta.sort[1]
             last_record_sort_value = response[len(response) - offset].meta.sort[0]
+            next_cursor = encode_cursor([last_record_sort_value, last_record_unique_id])
 
         return {
             "limit": self.pagination["limit"],
@@ -377,6 +415,7 @@ class SpendingByAwardVisualizationViewSet(APIView):
                 "hasNext": has_next,
                 "last_record_unique_id": last_record_unique_id,
                 "last_record_sort_value": str(last_record_sort_value),
+                "next_cursor": next_cursor,
             },
             "messages": [
                 get_generic_filters_message(
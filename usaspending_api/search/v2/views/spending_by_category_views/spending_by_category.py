@@ -2,7 +2,7 @@ import copy
 import logging
 from abc import ABCMeta, abstractmethod
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import List
 
 from django.conf import settings
 from django.db.models import QuerySet, Sum
@@ -22,7 +22,12 @@ from usaspending_api.common.query_with_filters import QueryWithFilters
 from usaspending_api.common.validator.award_filter import AWARD_FILTER
 from usaspending_api.common.validator.pagination import PAGINATION
 from usaspending_api.common.validator.tinyshield import TinyShield
-from usaspending_api.search.v2.elasticsearch_helper import get_number_of_unique_terms, get_scaled_sum_aggregations
+from usaspending_api.search.helpers.spending_by_category_rollups import (
+    get_rollup_buckets,
+    get_rollup_filters,
+    ROLLUP_AGG_KEYS,
+)
+from usaspending_api.search.v2.elasticsearch_helper import get_scaled_sum_aggregations, get_summed_buckets
 
 logger = logging.getLogger(__name__)
 
@@ -70,8 +75,14 @@ class AbstractSpendingByCategoryViewSet(APIView, metaclass=ABCMeta):
             self.obligation_column = "amount"
             results = self.query_django_for_subawards(base_queryset)
         else:
-            filter_query = QueryWithFilters.generate_transactions_elasticsearch_query(self.filters)
-            results = self.query_elasticsearch_for_prime_awards(filter_query)
+            rollup_filters = None
+            if self.category.agg_key in ROLLUP_AGG_KEYS:
+                rollup_filters = get_rollup_filters(self.filters)
+            if rollup_filters is not None:
+                results = self.query_rollups_for_prime_awards(rollup_filters)
+            else:
+                filter_query = QueryWithFilters.generate_transactions_elasticsearch_query(self.filters)
+                results = self.query_elasticsearch_for_prime_awards(filter_query)
 
         page_metadata = get_simple_pagination_metadata(len(results), self.pagination.limit, self.pagination.page)
 
@@ -115,52 +126,34 @@ class AbstractSpendingByCategoryViewSet(APIView, metaclass=ABCMeta):
             .order_by("-amount")
         )
 
-    def build_elasticsearch_search_with_aggregations(self, filter_query: ES_Q) -> Optional[TransactionSearch]:
+    def build_elasticsearch_search_with_aggregations(self, filter_query: ES_Q) -> TransactionSearch:
         """
         Using the provided ES_Q object creates a TransactionSearch object with the necessary applied aggregations.
+        Only used for high cardinality categories; this assumes that the Search object references an Elasticsearch
+        cluster that has a "routing" equal to "self.category.agg_key" so each shard can return its own top buckets.
         """
         # Create the filtered Search Object
         search = TransactionSearch().filter(filter_query)
 
         sum_aggregations = get_scaled_sum_aggregations("generated_pragmatic_obligation", self.pagination)
 
-        # Need to handle high cardinality categories differently; this assumes that the Search object references
-        # an Elasticsearch cluster that has a "routing" equal to "self.category.agg_key"
-        if self.category.name in self.high_cardinality_categories:
-            # 10k is the maximum number of allowed buckets
-            size = self.pagination.upper_limit
-            shard_size = size
-            sum_bucket_sort = sum_aggregations["sum_bucket_truncate"]
-            group_by_agg_key_values = {"order": {"sum_field": "desc"}}
-        else:
-            # Get count of unique buckets; terminate early if there are no buckets matching criteria
-            bucket_count = get_number_of_unique_terms(filter_query, f"{self.category.agg_key}.hash")
-            if bucket_count == 0:
-                return None
-            else:
-                # Add 100 to make sure that we consider enough records in each shard for accurate results;
-                # Only needed for non high-cardinality fields since those are being routed
-                size = bucket_count
-                shard_size = bucket_count + 100
-                sum_bucket_sort = sum_aggregations["sum_bucket_sort"]
-                group_by_agg_key_values = {}
-
-        if shard_size > 10000:
+        # 10k is the maximum number of allowed buckets
+        size = self.pagination.upper_limit
+        if size > 10000:
             logger.warning(f"Max number of buckets reached for aggregation key: {self.category.agg_key}.")
             raise ElasticsearchConnectionException(
                 "Current filters return too many unique items. Narrow filters to return results."
             )
 
         # Define all aggregations needed to build the response
-        group_by_agg_key_values.update({"field": self.category.agg_key, "size": size, "shard_size": shard_size})
-        group_by_agg_key = A("terms", **group_by_agg_key_values)
-
-        sum_field = sum_aggregations["sum_field"]
+        group_by_agg_key = A(
+            "terms", field=self.category.agg_key, size=size, shard_size=size, order={"sum_field": "desc"}
+        )
 
         # Apply the aggregations to the TransactionSearch object
-        search.aggs.bucket("group_by_agg_key", group_by_agg_key).metric("sum_field", sum_field).pipeline(
-            "sum_bucket_sort", sum_bucket_sort
-        )
+        search.aggs.bucket("group_by_agg_key", group_by_agg_key).metric(
+            "sum_field", sum_aggregations["sum_field"]
+        ).pipeline("sum_bucket_sort", sum_aggregations["sum_bucket_truncate"])
 
         # Set size to 0 since we don't care about documents returned
         search.update_from_dict({"size": 0})
@@ -168,12 +161,22 @@ class AbstractSpendingByCategoryViewSet(APIView, metaclass=ABCMeta):
         return search
 
     def query_elasticsearch_for_prime_awards(self, filter_query: ES_Q) -> list:
-        search = self.build_elasticsearch_search_with_aggregations(filter_query)
-        if search is None:
-            return []
-        response = search.handle_execute()
-        results = self.build_elasticsearch_result(response.aggs.to_dict())
-        return results
+        if self.category.name in self.high_cardinality_categories:
+            search = self.build_elasticsearch_search_with_aggregations(filter_query)
+            response = search.handle_execute()
+            return self.build_elasticsearch_result(response.aggs.to_dict())
+
+        # Every bucket is needed to find the largest, so page through all of them and sort here
+        buckets = get_summed_buckets(filter_query, self.category.agg_key, "generated_pragmatic_obligation")
+        buckets.sort(key=lambda bucket: (-bucket["sum_field"]["value"], bucket["key"]))
+        buckets = buckets[self.pagination.lower_limit : self.pagination.upper_limit]
+        return self.build_elasticsearch_result({"group_by_agg_key": {"buckets": buckets}})
+
+    def query_rollups_for_prime_awards(self, rollup_filters: dict) -> list:
+        buckets = get_rollup_buckets(
+            self.category.agg_key, rollup_filters, self.pagination.lower_limit, self.pagination.upper_limit
+        )
+        return self.build_elasticsearch_result({"group_by_agg_key": {"buckets": buckets}})
 
     @abstractmethod
     def build_elasticsearch_result(self, response: dict) -> List[dict]:
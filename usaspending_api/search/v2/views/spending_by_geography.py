@@ -8,7 +8,7 @@ from enum import Enum
 from django.conf import settings
 from django.db.models import Sum, FloatField, QuerySet
 from django.db.models.functions import Cast
-from elasticsearch_dsl import A, Q as ES_Q
+from elasticsearch_dsl import Q as ES_Q
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
@@ -18,16 +18,15 @@ from usaspending_api.awards.v2.filters.location_filter_geocode import geocode_fi
 from usaspending_api.awards.v2.filters.sub_award import subaward_filter
 from usaspending_api.common.api_versioning import api_transformations, API_TRANSFORM_FUNCTIONS
 from usaspending_api.common.cache_decorator import cache_response
-from usaspending_api.common.elasticsearch.search_wrappers import TransactionSearch
 from usaspending_api.common.helpers.generic_helper import get_generic_filters_message
 from usaspending_api.common.query_with_filters import QueryWithFilters
 from usaspending_api.common.validator.award_filter import AWARD_FILTER
 from usaspending_api.common.validator.pagination import PAGINATION
 from usaspending_api.common.validator.tinyshield import TinyShield
 from usaspending_api.references.abbreviations import code_to_state, fips_to_code, pad_codes
-from usaspending_api.references.models import PopCounty, PopCongressionalDistrict
+from usaspending_api.references.reference_data_cache import county_populations, district_populations, state_populations
 from usaspending_api.search.models import SubawardView
-from usaspending_api.search.v2.elasticsearch_helper import get_scaled_sum_aggregations, get_number_of_unique_terms
+from usaspending_api.search.v2.elasticsearch_helper import get_summed_buckets
 
 logger = logging.getLogger(__name__)
 API_VERSION = settings.API_VERSION
@@ -201,8 +200,7 @@ class SpendingByGeographyVisualizationViewSet(APIView):
                 "transaction_amount", *lookup_fields
             )
 
-        state_pop_rows = PopCounty.objects.filter(county_number="000").values()
-        populations = {row["state_name"].lower(): row["latest_population"] for row in state_pop_rows}
+        populations = state_populations()
 
         # State names are inconsistent in database (upper, lower, null)
         # Used lookup instead to be consistent
@@ -263,8 +261,7 @@ class SpendingByGeographyVisualizationViewSet(APIView):
 
     def county_results(self, state_lookup: str, county_name: str, geo_queryset: QuerySet) -> List[dict]:
         # Returns county results formatted for map
-        state_pop_rows = PopCounty.objects.exclude(county_number="000").values()
-        populations = {f"{row['state_code']}{row['county_number']}": row["latest_population"] for row in state_pop_rows}
+        populations = county_populations()
 
         results = []
         for x in geo_queryset:
@@ -290,11 +287,7 @@ class SpendingByGeographyVisualizationViewSet(APIView):
 
     def district_results(self, state_lookup: str, geo_queryset: QuerySet) -> List[dict]:
         # Returns congressional district results formatted for map
-
-        state_pop_rows = PopCongressionalDistrict.objects.all().values()
-        populations = {
-            f"{row['state_code']}{row['congressional_district']}": row["latest_population"] for row in state_pop_rows
-        }
+        populations = district_populations()
 
         results = []
         for x in geo_queryset:
@@ -318,28 +311,6 @@ class SpendingByGeographyVisualizationViewSet(APIView):
 
         return results
 
-    def build_elasticsearch_search_with_aggregation(self, filter_query: ES_Q) -> Optional[TransactionSearch]:
-        # Create the initial search using filters
-        search = TransactionSearch().filter(filter_query)
-
-        # Check number of unique terms (buckets) for performance and restrictions on maximum buckets allowed
-        bucket_count = get_number_of_unique_terms(filter_query, f"{self.agg_key}.hash")
-
-        if bucket_count == 0:
-            return None
-
-        # Add 100 to make sure that we consider enough records in each shard for accurate results
-        group_by_agg_key = A("terms", field=self.agg_key, size=bucket_count, shard_size=bucket_count + 100)
-        sum_aggregations = get_scaled_sum_aggregations(self.obligation_column)
-        sum_field = sum_aggregations["sum_field"]
-
-        search.aggs.bucket("group_by_agg_key", group_by_agg_key).metric("sum_field", sum_field)
-
-        # Set size to 0 since we don't care about documents returned
-        search.update_from_dict({"size": 0})
-
-        return search
-
     def build_elasticsearch_result(self, response: dict) -> Dict[str, dict]:
         results = {}
         geo_info_buckets = response.get("group_by_agg_key", {}).get("buckets", [])
@@ -373,11 +344,9 @@ class SpendingByGeographyVisualizationViewSet(APIView):
         return results
 
     def query_elasticsearch(self, filter_query: ES_Q) -> list:
-        search = self.build_elasticsearch_search_with_aggregation(filter_query)
-        if search is None:
-            return []
-        response = search.handle_execute()
-        results_dict = self.build_elasticsearch_result(response.aggs.to_dict())
+        # Composite paging returns every shape in one round trip (there are fewer than ES_COMPOSITE_PAGE_SIZE)
+        buckets = get_summed_buckets(filter_query, self.agg_key, self.obligation_column)
+        results_dict = self.build_elasticsearch_result({"group_by_agg_key": {"buckets": buckets}})
 
         if self.geo_layer_filters:
             filtered_shape_codes = set(self.geo_layer_filters) & set(results_dict.keys())
@@ -2,7 +2,7 @@ import copy
 import logging
 
 from calendar import monthrange
-from collections import OrderedDict
+from collections import defaultdict, OrderedDict
 from datetime import datetime, timezone
 
 from django.conf import settings
@@ -33,6 +33,12 @@ from usaspending_api.common.query_with_filters import QueryWithFilters
 from usaspending_api.common.validator.award_filter import AWARD_FILTER
 from usaspending_api.common.validator.pagination import PAGINATION
 from usaspending_api.common.validator.tinyshield import TinyShield
+from usaspending_api.search.helpers.spending_over_time_cube import (
+    get_cube_filters,
+    get_spending_over_time_cube,
+    SpendingOverTimeCube,
+)
+from usaspending_api.search.v2.elasticsearch_helper import get_cents_sum_aggregation
 
 logger = logging.getLogger(__name__)
 
@@ -113,7 +119,7 @@ class SpendingOverTimeVisualizationViewSet(APIView):
         group_by_time_period_agg = A(
             "date_histogram", field="fiscal_action_date", interval=interval, format="yyyy-MM-dd"
         )
-        sum_as_cents_agg = A("sum", field="generated_pragmatic_obligation", script={"source": "_value * 100"})
+        sum_as_cents_agg = get_cents_sum_aggregation("generated_pragmatic_obligation")
         sum_as_dollars_agg = A(
             "bucket_script", buckets_path={"sum_as_cents": "sum_as_cents"}, script="params.sum_as_cents / 100"
         )
@@ -176,6 +182,29 @@ class SpendingOverTimeVisualizationViewSet(APIView):
         response = search.handle_execute()
         return self.build_elasticsearch_result(response.aggs, time_periods)
 
+    def query_cube_for_prime_awards(self, cube: SpendingOverTimeCube, cube_filters: dict, time_periods: list) -> list:
+        amounts = defaultdict(int)
+        for (fiscal_year, fiscal_month), cents in cube.monthly_cents(cube_filters).items():
+            period = [str(fiscal_year)]
+            if self.group == "quarter":
+                period.append(str((fiscal_month - 1) // 3 + 1))
+            elif self.group == "month":
+                period.append(str(fiscal_month))
+            amounts[tuple(period)] += cents
+
+        results = []
+        min_date, max_date = min_and_max_from_date_ranges(time_periods)
+        for fiscal_date in generate_fiscal_date_range(min_date, max_date, self.group):
+            time_period = {"fiscal_year": str(fiscal_date["fiscal_year"])}
+            if self.group == "quarter":
+                time_period["quarter"] = str(fiscal_date["fiscal_quarter"])
+            elif self.group == "month":
+                time_period["month"] = str(fiscal_date["fiscal_month"])
+            aggregated_amount = amounts[tuple(time_period.values())] / 100
+            results.append({"aggregated_amount": aggregated_amount, "time_period": time_period})
+
+        return results
+
     @cache_response()
     def post(self, request: Request) -> Response:
         self.original_filters = request.data.get("filters")
@@ -206,7 +235,12 @@ class SpendingOverTimeVisualizationViewSet(APIView):
                 columns={"aggregated_amount": "aggregated_amount"},
             )
         else:
-            results = self.query_elasticsearch_for_prime_awards(time_periods)
+            cube_filters = get_cube_filters(self.filters)
+            cube = get_spending_over_time_cube() if cube_filters is not None else None
+            if cube is not None:
+                results = self.query_cube_for_prime_awards(cube, cube_filters, time_periods)
+            else:
+                results = self.query_elasticsearch_for_prime_awards(time_periods)
 
         return Response(
             OrderedDict(
@@ -21,6 +21,30 @@ MAX_DOWNLOAD_LIMIT = 500000
 # Timeout limit for streaming downloads
 DOWNLOAD_TIMEOUT_MIN_LIMIT = 10
 
+# Number of sources (e.g. the D1 and D2 files) a download job exports at the same time, each through a psql client
+# and a process writing its rows into members of EXCEL_ROW_LIMIT rows
+DOWNLOAD_SOURCE_WORKERS = int(os.environ.get("DOWNLOAD_SOURCE_WORKERS", 2))
+
+# Deflate processes one download job may run, split evenly between the sources it exports at the same time and never
+# more per source than there are CPUs.  Each one holds one uncompressed member on disk (a source with n of them at most
+# n + 1, the extra one being written) and about 256 KB of zlib state in memory.
+DOWNLOAD_WORKER_BUDGET = int(os.environ.get("DOWNLOAD_WORKER_BUDGET", 4))
+
+# zlib level (0-9) each delimited file format is deflated at in download zips, overridden per format with e.g.
+# DOWNLOAD_CSV_COMPRESSION_LEVEL.  The benchmark_download_compression command compares levels.
+DOWNLOAD_COMPRESSION_LEVELS = {
+    file_format: int(os.environ.get(f"DOWNLOAD_{file_format.upper()}_COMPRESSION_LEVEL", 6))
+    for file_format in ("csv", "tsv", "pstxt")
+}
+
+# Id tables of Elasticsearch-backed downloads older than this were left behind by a killed worker and are dropped when
+# a download worker starts
+DOWNLOAD_ID_TABLE_MAX_AGE_HOURS = int(os.environ.get("DOWNLOAD_ID_TABLE_MAX_AGE_HOURS", 24))
+
+# How Elasticsearch-backed downloads page through the matching ids: "partitions" of a terms aggregation or
+# "search_after" over the documents sorted by id
+DOWNLOAD_ES_ID_PAGING = os.environ.get("DOWNLOAD_ES_ID_PAGING", "partitions")
+
 # Default timeout for SQL statements in Django
 DEFAULT_DB_TIMEOUT_IN_SECONDS = int(os.environ.get("DEFAULT_DB_TIMEOUT_IN_SECONDS", 0))
 CONNECTION_MAX_SECONDS = 10
@@ -34,6 +58,20 @@ API_SEARCH_MIN_DATE = "2007-10-01"  # Beginning of FY2008
 # we have finished fully rolling out all CARES Act features.
 ENABLE_CARES_ACT_FEATURES = False
 
+# Answer spending_by_category requests whose filters the rollup table can satisfy (fiscal years, award types and
+# awarding toptier agencies) from the rollups rather than Elasticsearch.  Only enable this where the
+# load_spending_by_category_rollups command runs after every transaction index load.
+ENABLE_SPENDING_BY_CATEGORY_ROLLUPS = os.environ.get("ENABLE_SPENDING_BY_CATEGORY_ROLLUPS", "").lower() in [
+    "true",
+    "1",
+    "yes",
+]
+
+# Answer spending_over_time requests whose filters the in-memory cube can satisfy (month aligned time periods, award
+# types, awarding toptier agencies and recipient countries and states) from the cube rather than Elasticsearch.  Only
+# enable this where the load_spending_over_time_rollups command runs after every transaction index load.
+ENABLE_SPENDING_OVER_TIME_CUBE = os.environ.get("ENABLE_SPENDING_OVER_TIME_CUBE", "").lower() in ["true", "1", "yes"]
+
 # Quick-start development settings - unsuitable for production
 # See https://docs.djangoproject.com/en/2.2/howto/deployment/checklist/
 
@@ -122,6 +160,19 @@ ES_AWARDS_QUERY_ALIAS_PREFIX = "award-query"
 ES_AWARDS_WRITE_ALIAS = "award-load-alias"
 ES_TIMEOUT = 90
 ES_REPOSITORY = ""
+# Buckets requested per round trip when paging through every bucket of a composite aggregation
+ES_COMPOSITE_PAGE_SIZE = 10000
+# Sum the integer cents companions of amounts (generated_pragmatic_obligation_cents, ...) natively instead of scaling
+# the amounts with a script.  Only enable this once the transaction index has been rebuilt with those fields.
+ES_SUM_CENTS_FIELDS = os.environ.get("ES_SUM_CENTS_FIELDS", "").lower() in ["true", "1", "yes"]
+# Client shared by the searches of each API worker process (see common.elasticsearch.client.get_es_client)
+ES_MAX_CONNECTIONS = int(os.environ.get("ES_MAX_CONNECTIONS", 10))  # pooled connections kept open per node
+ES_TCP_KEEPALIVE_SECONDS = int(os.environ.get("ES_TCP_KEEPALIVE_SECONDS", 30))  # idle time before probes; 0 is off
+ES_SNIFF_INTERVAL = int(os.environ.get("ES_SNIFF_INTERVAL", 0))  # seconds between node discovery; 0 is off
+ES_TRANSPORT_MAX_RETRIES = int(os.environ.get("ES_TRANSPORT_MAX_RETRIES", 0))  # immediate retries on another node
+# Searches retry retryable failures after an exponential backoff with full jitter, capped at the maximum
+ES_RETRY_BACKOFF_SECONDS = float(os.environ.get("ES_RETRY_BACKOFF_SECONDS", 0.5))
+ES_RETRY_MAX_BACKOFF_SECONDS = float(os.environ.get("ES_RETRY_MAX_BACKOFF_SECONDS", 8))
 
 # Application definition
 INSTALLED_APPS = [
@@ -384,6 +435,18 @@ CACHE_ENVIRONMENTS = {
 # Set the usaspending-cache to whatever our environment cache dictates
 CACHES["usaspending-cache"] = CACHE_ENVIRONMENTS[CACHE_ENVIRONMENT]
 
+# Seconds a request computing an uncached API response holds the lock that makes identical concurrent requests wait
+# for (or serve the previous data generation's copy of) its response instead of computing it too
+CACHE_LOCK_TIMEOUT = int(os.environ.get("CACHE_LOCK_TIMEOUT", 60))
+
+# Cached API responses at least this many bytes long are stored zlib compressed at this level
+CACHE_COMPRESSION_THRESHOLD = int(os.environ.get("CACHE_COMPRESSION_THRESHOLD", 16384))
+CACHE_COMPRESSION_LEVEL = int(os.environ.get("CACHE_COMPRESSION_LEVEL", 1))
+
+# Seconds between checks, by each worker process, of whether data it holds in memory (reference tables, filter trees
+# and the spending_over_time cube) is still current.  See common.cache.memoize_per_generation
+GENERATION_CHECK_INTERVAL = int(os.environ.get("GENERATION_CHECK_INTERVAL", 60))
+
 # DRF extensions
 REST_FRAMEWORK_EXTENSIONS = {
     # Not caching errors, these are logged to exceptions.log
@@ -4,6 +4,7 @@ import signal
 from django.core.exceptions import ObjectDoesNotExist
 from django.core.management.base import BaseCommand
 from django.db import transaction
+from usaspending_api.common.cache import try_bump_data_generation
 from usaspending_api.submissions.models import SubmissionAttributes
 
 
@@ -38,6 +39,7 @@ class Command(BaseCommand):
             raise RuntimeError(f"Broker submission id {submission_id} does not exist")
 
         deleted_stats = submission.delete()
+        transaction.on_commit(try_bump_data_generation)
 
         self.logger.info("Finished deletions.")
 
@@ -1,4 +1,3 @@
-import csv
 import logging
 import re
 
@@ -6,8 +5,10 @@ from collections import defaultdict
 from datetime import datetime
 from typing import Optional, List
 from usaspending_api import settings
+from usaspending_api.broker.helpers.deleted_record_journal import journal_deletion_files
+from usaspending_api.broker.models import DeletedRecord
 from usaspending_api.common.helpers.date_helper import datetime_is_ge, datetime_is_lt
-from usaspending_api.common.helpers.s3_helpers import access_s3_object, retrieve_s3_bucket_object_list
+from usaspending_api.common.helpers.s3_helpers import retrieve_s3_bucket_object_list
 from usaspending_api.common.helpers.timing_helpers import ScriptTimer as Timer
 
 
@@ -37,18 +38,18 @@ def retrieve_deleted_transactions(
             f"{len(objects):,} files found in date range {start_datetime} through {end_datetime or 'the end of time'}."
         )
 
-    deleted_records = defaultdict(list)
-    for obj in objects:
-        object_data = access_s3_object(settings.DELETED_TRANSACTION_JOURNAL_FILES, obj)
-        reader = csv.reader(object_data.read().decode("utf-8").splitlines())
-        next(reader)  # skip the header
-
-        transaction_id_list = [rows[0] for rows in reader]
-        logger.info(f"{len(transaction_id_list):,} delete ids found in {obj.key}")
+    with Timer("Journaling new deletion files"):
+        # Files read by an earlier load are already in the journal so only new ones are downloaded
+        journal_deletion_files(settings.DELETED_TRANSACTION_JOURNAL_FILES, objects)
 
-        if transaction_id_list:
-            file_date = obj.key[: obj.key.find("_")]
-            deleted_records[file_date].extend(transaction_id_list)
+    # Ids are grouped by the date at the start of each file's key, as when the files were read straight from S3
+    journal_records = DeletedRecord.objects.filter(deleted_record_file__file_key__in=[o.key for o in objects]).order_by(
+        "deleted_record_file__file_key", "deleted_record_id"
+    )
+    deleted_records = defaultdict(list)
+    for file_key, unique_id in journal_records.values_list("deleted_record_file__file_key", "unique_id").iterator():
+        deleted_records[file_key[: file_key.find("_")]].append(unique_id)
+    logger.info(f"{sum(len(v) for v in deleted_records.values()):,} delete ids found in {len(objects):,} files.")
 
     return deleted_records
 